@@ -0,0 +1 @@
+"""Throughput benchmarks for the pipeline hot paths (``python -m benchmarks.run``)."""
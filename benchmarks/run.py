@@ -0,0 +1,271 @@
+"""Benchmark the backtest, strategy, store and pipeline hot paths.
+
+Results are written as JSON so runs on different commits can be compared::
+
+    python -m benchmarks.run --output bench.json
+    python -m benchmarks.run --compare bench.json --threshold 0.2
+
+``--compare`` exits non-zero when any shared benchmark got slower than the
+threshold allows.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, List
+
+import numpy as np
+
+from src import indicators
+from src.backtester import Backtester
+from src.candle_store import CandleStore
+from src.config import HttpConfig, RobustnessConfig
+from src.crawler import ConditionalCache, GitHubModelCrawler
+from src.data import HistoricalDataClient
+from src.evaluator import ModelEvaluator
+from src.http_client import build_session
+from src.model_factory import ModelCandidate
+from src.model_repository import ModelRepository
+from src.pipeline import DailyPipeline
+from src.result_cache import BacktestCache
+from src.robustness import MonteCarlo
+from src.strategies import MomentumStrategy, SmaCrossStrategy
+
+from fakes import FakeGitHubSearchServer, FakeKlinesServer, synthetic_klines, synthetic_repositories
+
+LOGGER = logging.getLogger(__name__)
+
+PROFILES: Dict[str, Dict[str, List[int]]] = {
+    "quick": {
+        "bars": [1_000, 100_000],
+        "scalar_bars": [1_000, 10_000],
+        "repos": [10, 1_000],
+        "candidates": [10],
+        "paths": [1_000],
+    },
+    "full": {
+        "bars": [1_000, 100_000, 1_000_000, 10_000_000],
+        "scalar_bars": [1_000, 100_000, 1_000_000],
+        "repos": [10, 1_000, 10_000, 100_000],
+        "candidates": [10, 100, 500],
+        "paths": [1_000, 10_000],
+    },
+}
+
+
+def synthetic_closes(bars: int, seed: int = 0) -> np.ndarray:
+    """Return a geometric random walk of ``bars`` closes."""
+    rng = np.random.default_rng(seed)
+    return 10_000.0 * np.exp(np.cumsum(rng.normal(0.0, 0.01, bars)))
+
+
+class _StaticData:
+    def __init__(self, closes: np.ndarray) -> None:
+        self._closes = closes
+
+    def fetch_daily_close(self) -> np.ndarray:
+        return self._closes
+
+
+def measure(fn: Callable[[], object], repeat: int, setup: Callable[[], object] | None = None) -> float:
+    """Return the best wall time of ``repeat`` calls."""
+    best = float("inf")
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def bench_strategies(sizes: Dict[str, List[int]], repeat: int) -> Dict[str, float]:
+    results: Dict[str, float] = {}
+    for bars in sizes["bars"]:
+        closes = synthetic_closes(bars)
+        for strategy in (SmaCrossStrategy(10, 30), MomentumStrategy(14, 0.02)):
+            name = f"generate_signals/{type(strategy).__name__}/{bars}"
+            results[name] = measure(lambda: strategy.generate_signals(closes), repeat, indicators.CACHE.clear)
+    return results
+
+
+def bench_backtester(sizes: Dict[str, List[int]], repeat: int) -> Dict[str, float]:
+    results: Dict[str, float] = {}
+    backtester = Backtester()
+    strategy = SmaCrossStrategy(10, 30)
+    for bars in sizes["scalar_bars"]:
+        closes = synthetic_closes(bars).tolist()
+        results[f"backtester.run/{bars}"] = measure(lambda: backtester.run(strategy, closes), repeat)
+    for bars in sizes["bars"]:
+        closes = synthetic_closes(bars)
+        signals = np.sign(np.random.default_rng(1).normal(size=(8, bars)))
+        results[f"backtester.run_batch/8x{bars}"] = measure(lambda: backtester.run_batch(closes, signals), repeat)
+    returns = np.random.default_rng(2).normal(0.0, 0.01, size=(8, 1_000))
+    for paths in sizes["paths"]:
+        monte_carlo = MonteCarlo(backtester, RobustnessConfig(enabled=True, paths=paths))
+        results[f"robustness.run_returns/8x{paths}x1000"] = measure(lambda: monte_carlo.run_returns(returns), repeat)
+    return results
+
+
+def bench_evaluator(sizes: Dict[str, List[int]], repeat: int, workdir: Path) -> Dict[str, float]:
+    results: Dict[str, float] = {}
+    closes = synthetic_closes(1_095)
+    for count in sizes["candidates"]:
+        candidates = [
+            ModelCandidate({"full_name": f"bench/{idx}"}, SmaCrossStrategy(2 + idx % 40, 50 + idx // 40))
+            for idx in range(count)
+        ]
+        cache_path = workdir / f"evaluator-cache-{count}.sqlite3"
+
+        def reset_cache() -> None:
+            cache_path.unlink(missing_ok=True)
+            indicators.CACHE.clear()
+
+        evaluator = lambda: ModelEvaluator(_StaticData(closes), cache=BacktestCache(cache_path))  # noqa: E731
+        results[f"evaluator.evaluate/cold/{count}"] = measure(
+            lambda: evaluator().evaluate(candidates), repeat, reset_cache
+        )
+        results[f"evaluator.evaluate/cached/{count}"] = measure(lambda: evaluator().evaluate(candidates), repeat)
+    return results
+
+
+def bench_repository(sizes: Dict[str, List[int]], repeat: int, workdir: Path) -> Dict[str, float]:
+    results: Dict[str, float] = {}
+    for count in sizes["repos"]:
+        models = [GitHubModelCrawler._normalize(item) for item in synthetic_repositories(count)]
+        path = workdir / f"models-{count}.sqlite3"
+
+        def reset() -> None:
+            for suffix in ("", "-wal", "-shm"):
+                Path(f"{path}{suffix}").unlink(missing_ok=True)
+
+        results[f"model_repository.update/{count}"] = measure(
+            lambda: ModelRepository(path).update(models), repeat, reset
+        )
+        results[f"model_repository.load/{count}"] = measure(lambda: len(ModelRepository(path)), repeat)
+        results[f"model_repository.update_unchanged/{count}"] = measure(
+            lambda: ModelRepository(path).update(models), repeat
+        )
+    return results
+
+
+def bench_pipeline(repeat: int, workdir: Path) -> Dict[str, float]:
+    now_ms = int(time.time() * 1000)
+    day_ms = 86_400_000
+    klines = synthetic_klines(1_200, start_ms=(now_ms // day_ms - 1_200) * day_ms)
+    counter = iter(range(1_000_000))
+
+    with FakeGitHubSearchServer(synthetic_repositories(200), rate_limit=10_000) as github, FakeKlinesServer(
+        klines
+    ) as binance:
+
+        def run_pipeline(http: HttpConfig) -> None:
+            run_dir = workdir / f"pipeline-{next(counter)}"
+            data_client = HistoricalDataClient(
+                session=build_session("binance_klines", config=http),
+                store=CandleStore(run_dir / "candles"),
+                base_url=binance.klines_url,
+            )
+            crawler = GitHubModelCrawler(
+                session=build_session("github", config=http),
+                search_url=github.search_url,
+                cache=ConditionalCache(None),
+            )
+            pipeline = DailyPipeline(
+                repository_path=run_dir / "models.sqlite3",
+                crawler=crawler,
+                evaluator=ModelEvaluator(data_client, cache=BacktestCache(run_dir / "cache.sqlite3")),
+            )
+            pipeline.run()
+
+        uncached = HttpConfig(cache_path=None)
+        cached = HttpConfig(cache_path=str(workdir / "http-cache.sqlite3"))
+        run_pipeline(cached)  # warm the response cache
+        return {
+            "pipeline.run/offline": measure(lambda: run_pipeline(uncached), repeat, indicators.CACHE.clear),
+            "pipeline.run/http_cached": measure(lambda: run_pipeline(cached), repeat, indicators.CACHE.clear),
+        }
+
+
+def _commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(current: Dict[str, float], baseline: Dict[str, float], threshold: float) -> List[str]:
+    """Return a description of every benchmark slower than ``baseline`` by more than ``threshold``."""
+    regressions: List[str] = []
+    for name in sorted(current.keys() & baseline.keys()):
+        ratio = current[name] / baseline[name] if baseline[name] else float("inf")
+        if ratio > 1 + threshold:
+            regressions.append(f"{name}: {baseline[name]:.6f}s -> {current[name]:.6f}s ({ratio:.2f}x)")
+    return regressions
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--profile", choices=sorted(PROFILES), default="quick")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--only", action="append", help="run only benchmarks whose group matches")
+    parser.add_argument("--output", type=Path, help="write results JSON here")
+    parser.add_argument("--compare", type=Path, help="baseline results JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=0.2, help="allowed slowdown ratio, e.g. 0.2 = 20%%")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.ERROR)
+
+    sizes = PROFILES[args.profile]
+    results: Dict[str, float] = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        workdir = Path(tmp)
+        groups: Dict[str, Callable[[], Dict[str, float]]] = {
+            "strategies": lambda: bench_strategies(sizes, args.repeat),
+            "backtester": lambda: bench_backtester(sizes, args.repeat),
+            "evaluator": lambda: bench_evaluator(sizes, args.repeat, workdir),
+            "repository": lambda: bench_repository(sizes, args.repeat, workdir),
+            "pipeline": lambda: bench_pipeline(args.repeat, workdir),
+        }
+        for group, run in groups.items():
+            if args.only and group not in args.only:
+                continue
+            for name, seconds in run().items():
+                results[name] = seconds
+                print(f"{name:<55} {seconds * 1000:12.3f} ms")
+
+    report = {
+        "meta": {
+            "commit": _commit(),
+            "timestamp": datetime.now(tz=timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "profile": args.profile,
+            "repeat": args.repeat,
+        },
+        "results": results,
+    }
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2, sort_keys=True), encoding="utf-8")
+    if args.compare:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))["results"]
+        regressions = compare(results, baseline, args.threshold)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        if regressions:
+            return 1
+        print(f"No regressions beyond {args.threshold:.0%} against {args.compare}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
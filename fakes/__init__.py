@@ -0,0 +1,22 @@
+"""Local HTTP stand-ins for the external APIs used by the pipeline.
+
+Shared by the test suite and the benchmarks. The fakes run a
+``ThreadingHTTPServer`` on an ephemeral localhost port so the real clients can
+be exercised offline::
+
+    with FakeKlinesServer(synthetic_klines(1500)) as server:
+        client = HistoricalDataClient(base_url=server.klines_url)
+"""
+from .binance import FakeBinanceServer
+from .github import FakeGitHubSearchServer, synthetic_repositories
+from .klines import FakeKlinesServer, synthetic_klines
+from .server import FakeServer
+
+__all__ = [
+    "FakeBinanceServer",
+    "FakeGitHubSearchServer",
+    "FakeKlinesServer",
+    "FakeServer",
+    "synthetic_klines",
+    "synthetic_repositories",
+]
@@ -0,0 +1,94 @@
+"""Fake Binance time and signed order endpoints."""
+from __future__ import annotations
+
+import hashlib
+import hmac
+import time
+from typing import Any, Dict, List
+
+from .server import FakeServer, Response
+
+
+class FakeBinanceServer(FakeServer):
+    """Serve Binance's time and signed order endpoints for offline order routing.
+
+    Orders are filled instantly and stored by ``newClientOrderId`` so
+    idempotent retries can be checked via ``fills``. ``hang_first`` makes the
+    first N order requests sleep ``hang_seconds`` after filling, simulating a
+    client timeout on an order the exchange accepted.
+    """
+
+    ORDER_LIMIT_10S = 50
+
+    def __init__(
+        self,
+        api_secret: str,
+        clock_skew_ms: int = 0,
+        latency: float = 0.0,
+        hang_first: int = 0,
+        hang_seconds: float = 1.0,
+    ) -> None:
+        super().__init__()
+        self.api_secret = api_secret
+        self.clock_skew_ms = clock_skew_ms
+        self.latency = latency
+        self.hang_first = hang_first
+        self.hang_seconds = hang_seconds
+        self.orders: Dict[str, Dict[str, Any]] = {}
+        self.fills = 0
+        self._order_times: List[float] = []
+        self._next_order_id = 1
+
+    def _server_time(self) -> int:
+        return int(time.time() * 1000) + self.clock_skew_ms
+
+    def handle(self, method: str, path: str, query: Dict[str, str], headers: Dict[str, str]) -> Response:
+        if self.latency:
+            time.sleep(self.latency)
+        if path == "/api/v3/time" and method == "GET":
+            return 200, {}, {"serverTime": self._server_time()}
+        if path != "/api/v3/order":
+            return 404, {}, {"code": -1, "msg": "not found"}
+        signed = "&".join(f"{key}={value}" for key, value in query.items() if key != "signature")
+        expected = hmac.new(self.api_secret.encode(), signed.encode(), hashlib.sha256).hexdigest()
+        if query.get("signature") != expected:
+            return 400, {}, {"code": -1022, "msg": "Signature for this request is not valid."}
+        if abs(self._server_time() - int(query["timestamp"])) > int(query.get("recvWindow", 5000)):
+            return 400, {}, {"code": -1021, "msg": "Timestamp for this request is outside of the recvWindow."}
+        if method == "GET":
+            with self._lock:
+                order = self.orders.get(query.get("origClientOrderId", ""))
+            if order is None:
+                return 400, {}, {"code": -2013, "msg": "Order does not exist."}
+            return 200, {}, order
+        if method != "POST":
+            return 405, {}, {"code": -1, "msg": "method not allowed"}
+        with self._lock:
+            now = time.time()
+            self._order_times = [sent for sent in self._order_times if now - sent < 10] + [now]
+            rate_headers = {
+                "X-MBX-ORDER-COUNT-10S": str(len(self._order_times)),
+                "X-MBX-ORDER-COUNT-1D": str(self._next_order_id),
+            }
+            if len(self._order_times) > self.ORDER_LIMIT_10S:
+                return 429, rate_headers, {"code": -1015, "msg": "Too many new orders."}
+            order = {
+                "symbol": query["symbol"],
+                "orderId": self._next_order_id,
+                "clientOrderId": query["newClientOrderId"],
+                "transactTime": self._server_time(),
+                "origQty": query["quantity"],
+                "executedQty": query["quantity"],
+                "status": "FILLED",
+                "type": query["type"],
+                "side": query["side"],
+            }
+            self._next_order_id += 1
+            self.orders[order["clientOrderId"]] = order
+            self.fills += 1
+            hang = self.hang_first > 0
+            if hang:
+                self.hang_first -= 1
+        if hang:
+            time.sleep(self.hang_seconds)
+        return 200, rate_headers, order
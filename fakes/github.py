@@ -0,0 +1,100 @@
+"""Fake GitHub repository search and synthetic search results."""
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+import random
+import time
+from typing import Any, Dict, List
+
+from .server import FakeServer, Response
+
+
+def synthetic_repositories(count: int, seed: int = 0) -> List[Dict[str, Any]]:
+    """Return ``count`` GitHub search items shaped like the real API's."""
+    rng = random.Random(seed)
+    topics = ["sma", "moving-average", "momentum", "trend", "ai", "crypto", "trading-bot", "reinforcement-learning"]
+    languages = ["Python", "Jupyter Notebook", "Rust", "TypeScript", None]
+    items: List[Dict[str, Any]] = []
+    for idx in range(count):
+        name = f"strategy-{idx}"
+        items.append(
+            {
+                "id": 1_000_000 + idx,
+                "name": name,
+                "full_name": f"user{idx % 97}/{name}",
+                "description": "Synthetic crypto AI trading repository",
+                "html_url": f"https://github.com/user{idx % 97}/{name}",
+                "pushed_at": f"2024-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}T00:00:00Z",
+                "stargazers_count": rng.randint(0, 5000),
+                "language": rng.choice(languages),
+                "topics": rng.sample(topics, rng.randint(0, 3)),
+            }
+        )
+    return items
+
+
+class FakeGitHubSearchServer(FakeServer):
+    """Serve ``/search/repositories`` with ETags and GitHub-style rate-limit headers.
+
+    Every query matches all ``items`` unless ``queries`` maps it to its own
+    results; 304 responses do not consume quota.
+    """
+
+    def __init__(
+        self,
+        items: List[Dict[str, Any]],
+        rate_limit: int = 30,
+        reset_after: float = 60.0,
+        queries: Dict[str, List[Dict[str, Any]]] | None = None,
+    ) -> None:
+        super().__init__()
+        self.items = items
+        self.queries = queries or {}
+        self.rate_limit = rate_limit
+        self.remaining = rate_limit
+        self.reset_after = reset_after
+        self._reset_at = self._next_reset(time.time())
+
+    @property
+    def search_url(self) -> str:
+        return f"{self.url}/search/repositories"
+
+    def handle(self, method: str, path: str, query: Dict[str, str], headers: Dict[str, str]) -> Response:
+        if method != "GET" or path != "/search/repositories":
+            return 404, {}, {"message": "Not Found"}
+        per_page = min(int(query.get("per_page", 30)), 100)
+        page = int(query.get("page", 1))
+        items = self.queries.get(query.get("q", ""), self.items)
+        payload = {
+            "total_count": len(items),
+            "incomplete_results": False,
+            "items": items[(page - 1) * per_page : page * per_page],
+        }
+        etag = '"' + hashlib.sha1(json.dumps(payload, sort_keys=True).encode()).hexdigest() + '"'
+        with self._lock:
+            now = time.time()
+            if now >= self._reset_at:
+                self.remaining = self.rate_limit
+                self._reset_at = self._next_reset(now)
+            if headers.get("if-none-match") == etag:
+                return 304, self._rate_headers(etag), None
+            if self.remaining <= 0:
+                return 403, self._rate_headers(None), {"message": "API rate limit exceeded"}
+            self.remaining -= 1
+            return 200, self._rate_headers(etag), payload
+
+    def _next_reset(self, now: float) -> int:
+        # GitHub resets on whole epoch seconds; advertising a truncated time would invite early retries.
+        return math.ceil(now + self.reset_after)
+
+    def _rate_headers(self, etag: str | None) -> Dict[str, str]:
+        headers = {
+            "X-RateLimit-Limit": str(self.rate_limit),
+            "X-RateLimit-Remaining": str(self.remaining),
+            "X-RateLimit-Reset": str(self._reset_at),
+        }
+        if etag:
+            headers["ETag"] = etag
+        return headers
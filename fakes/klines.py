@@ -0,0 +1,94 @@
+"""Fake Binance klines endpoint and synthetic candles."""
+from __future__ import annotations
+
+import random
+import time
+from typing import Any, Dict, List, Sequence, Tuple
+
+from .server import FakeServer, Response
+
+
+def synthetic_klines(
+    count: int,
+    interval_ms: int = 86_400_000,
+    start_ms: int = 1_577_836_800_000,
+    seed: int = 0,
+) -> List[List[Any]]:
+    """Return ``count`` random-walk candles in Binance kline row format."""
+    rng = random.Random(seed)
+    rows: List[List[Any]] = []
+    price = 10_000.0
+    for idx in range(count):
+        open_time = start_ms + idx * interval_ms
+        open_price = price
+        price = max(1.0, price * (1 + rng.gauss(0.0005, 0.03)))
+        high = max(open_price, price) * (1 + abs(rng.gauss(0, 0.01)))
+        low = min(open_price, price) * (1 - abs(rng.gauss(0, 0.01)))
+        volume = abs(rng.gauss(1000, 250))
+        rows.append(
+            [
+                open_time,
+                f"{open_price:.2f}",
+                f"{high:.2f}",
+                f"{low:.2f}",
+                f"{price:.2f}",
+                f"{volume:.4f}",
+                open_time + interval_ms - 1,
+                f"{volume * price:.4f}",
+                rng.randint(100, 10_000),
+                "0",
+                "0",
+                "0",
+            ]
+        )
+    return rows
+
+
+class FakeKlinesServer(FakeServer):
+    """Serve ``/api/v3/klines`` from a fixed list of kline rows.
+
+    Responses report used request weight like Binance does, and the first
+    ``failures`` requests return HTTP 500 to exercise client retries. Before
+    those, ``errors`` are answered in order with their status and extra
+    headers, e.g. ``(429, {"Retry-After": "1"})``.
+    """
+
+    REQUEST_WEIGHT = 2
+
+    def __init__(
+        self,
+        klines: List[List[Any]],
+        failures: int = 0,
+        latency: float = 0.0,
+        errors: Sequence[Tuple[int, Dict[str, str]]] = (),
+    ) -> None:
+        super().__init__()
+        self.klines = sorted(klines, key=lambda row: row[0])
+        self.failures = failures
+        self.latency = latency
+        self.errors = list(errors)
+        self.used_weight = 0
+
+    @property
+    def klines_url(self) -> str:
+        return f"{self.url}/api/v3/klines"
+
+    def handle(self, method: str, path: str, query: Dict[str, str], headers: Dict[str, str]) -> Response:
+        if method != "GET" or path != "/api/v3/klines":
+            return 404, {}, {"code": -1, "msg": "not found"}
+        if self.latency:
+            time.sleep(self.latency)
+        with self._lock:
+            self.used_weight += self.REQUEST_WEIGHT
+            headers = {"X-MBX-USED-WEIGHT-1M": str(self.used_weight)}
+            if self.errors:
+                status, extra = self.errors.pop(0)
+                return status, {**headers, **extra}, {"code": -1003, "msg": "injected error"}
+            if self.failures > 0:
+                self.failures -= 1
+                return 500, headers, {"code": -1000, "msg": "injected failure"}
+        start = int(query.get("startTime", 0))
+        end = int(query.get("endTime", 2**63 - 1))
+        limit = min(int(query.get("limit", 500)), 1000)
+        rows = [row for row in self.klines if start <= row[0] <= end][:limit]
+        return 200, headers, rows
@@ -0,0 +1,86 @@
+"""Base class for the fake HTTP servers."""
+from __future__ import annotations
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Tuple
+from urllib.parse import parse_qsl, urlsplit
+
+Response = Tuple[int, Dict[str, str], Any]
+
+
+class FakeServer:
+    """Serve ``handle`` responses from a background thread."""
+
+    def __init__(self) -> None:
+        self.requests: List[Tuple[str, str, Dict[str, str]]] = []
+        self._lock = threading.Lock()
+        self._server: ThreadingHTTPServer | None = None
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        if self._server is None:
+            raise RuntimeError("Server not started")
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "FakeServer":
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:  # noqa: N802 - http.server naming
+                self._dispatch("GET")
+
+            def do_POST(self) -> None:  # noqa: N802 - http.server naming
+                self._dispatch("POST")
+
+            def do_DELETE(self) -> None:  # noqa: N802 - http.server naming
+                self._dispatch("DELETE")
+
+            def _dispatch(self, method: str) -> None:
+                parts = urlsplit(self.path)
+                query = dict(parse_qsl(parts.query))
+                length = int(self.headers.get("Content-Length") or 0)
+                if length:
+                    query.update(parse_qsl(self.rfile.read(length).decode()))
+                with fake._lock:
+                    fake.requests.append((method, parts.path, query))
+                request_headers = {key.lower(): value for key, value in self.headers.items()}
+                status, headers, payload = fake.handle(method, parts.path, query, request_headers)
+                body = b"" if payload is None else json.dumps(payload).encode()
+                try:
+                    self.send_response(status)
+                    self.send_header("Content-Type", "application/json")
+                    self.send_header("Content-Length", str(len(body)))
+                    for key, value in headers.items():
+                        self.send_header(key, value)
+                    self.end_headers()
+                    self.wfile.write(body)
+                except (BrokenPipeError, ConnectionResetError):
+                    # The client gave up (e.g. a simulated timeout); nothing left to send.
+                    return
+
+            def log_message(self, format: str, *args: Any) -> None:  # noqa: A002 - signature from base
+                return
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> "FakeServer":
+        return self.start()
+
+    def __exit__(self, *exc: Any) -> None:
+        self.stop()
+
+    def handle(self, method: str, path: str, query: Dict[str, str], headers: Dict[str, str]) -> Response:
+        raise NotImplementedError
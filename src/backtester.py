@@ -4,8 +4,11 @@ from __future__ import annotations
 import logging
 import math
 from dataclasses import dataclass
-from typing import Dict, Iterable, List
+from typing import Dict, Iterable, Iterator, List, Sequence, Tuple
 
+import numpy as np
+
+from .bars import Prices, stack_signals
 from .strategies import Strategy
 
 LOGGER = logging.getLogger(__name__)
@@ -19,20 +22,100 @@ class BacktestResult:
     max_drawdown: float
 
 
-class Backtester:
-    """Run a simple backtest on OHLC closes."""
+@dataclass
+class MetricsAccumulator:
+    """Single-pass accumulator for every backtest metric.
+
+    Tracks compounded equity, Welford mean/variance and the running peak, so
+    returns can be fed per bar or per chunk with constant memory.
+    """
 
     risk_free_rate: float = 0.0
+    periods_per_year: float = 365.0
+    count: int = 0
+    mean: float = 0.0
+    m2: float = 0.0
+    equity: float = 1.0
+    peak: float = 1.0
+    max_drawdown: float = 0.0
+
+    def update(self, r: float) -> None:
+        self.count += 1
+        delta = r - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (r - self.mean)
+        self.equity *= 1 + r
+        if self.equity > self.peak:
+            self.peak = self.equity
+        self.max_drawdown = max(self.max_drawdown, (self.peak - self.equity) / self.peak)
+
+    def update_chunk(self, returns: np.ndarray) -> None:
+        returns = np.asarray(returns, dtype=np.float64)
+        size = returns.size
+        if size == 0:
+            return
+        # Seeding the products with the running equity keeps the multiplication order of ``update``.
+        curve = np.cumprod(np.concatenate([[self.equity], 1.0 + returns]))[1:]
+        peaks = np.maximum.accumulate(np.concatenate([[self.peak], curve]))[1:]
+        self.max_drawdown = max(self.max_drawdown, float(((peaks - curve) / peaks).max()))
+        self.equity = float(curve[-1])
+        self.peak = float(peaks[-1])
+        chunk_mean = float(returns.mean())
+        chunk_m2 = float(((returns - chunk_mean) ** 2).sum())
+        total = self.count + size
+        delta = chunk_mean - self.mean
+        self.mean += delta * size / total
+        self.m2 += chunk_m2 + delta * delta * self.count * size / total
+        self.count = total
+
+    def result(self) -> BacktestResult:
+        total = self.equity - 1
+        annual = Backtester._annualized_return(total, self.count, self.periods_per_year)
+        sharpe = 0.0
+        if self.count >= 2:
+            std = math.sqrt(self.m2 / (self.count - 1))
+            if std != 0:
+                excess = self.mean - self.risk_free_rate / self.periods_per_year
+                sharpe = (excess / std) * math.sqrt(self.periods_per_year)
+        return BacktestResult(total, annual, sharpe, self.max_drawdown)
+
 
-    def run(self, strategy: Strategy, closes: List[float]) -> BacktestResult:
+def iter_chunks(
+    closes: np.ndarray,
+    signals: np.ndarray,
+    chunk_size: int = 65_536,
+) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+    """Yield aligned ``(closes, signals)`` views, e.g. over memory-mapped histories."""
+    for start in range(0, len(closes), chunk_size):
+        yield closes[start : start + chunk_size], signals[start : start + chunk_size]
+
+
+class Backtester:
+    """Run a simple backtest on OHLC closes.
+
+    ``run`` is the scalar reference implementation.  ``run_batch`` and
+    ``run_many`` score a whole (strategies x bars) signal matrix against one
+    closes array in a single vectorized pass and must agree with ``run``.
+
+    ``periods_per_year`` annualizes returns and Sharpe ratios; the default of
+    365 matches daily bars, use ``periods_per_year(interval)`` from
+    ``resample`` for other bar sizes.
+    """
+
+    def __init__(self, risk_free_rate: float = 0.0, periods_per_year: float = 365.0) -> None:
+        self.risk_free_rate = risk_free_rate
+        self.periods_per_year = periods_per_year
+
+    def run(self, strategy: Strategy, closes: Prices) -> BacktestResult:
         LOGGER.info("Running backtest for %s", strategy)
-        signals = strategy.generate_signals(closes)
+        # The scalar reference works on plain Python numbers whatever container the closes come in.
+        signals = np.asarray(strategy.generate_signals(closes)).tolist()
         if len(signals) != len(closes):
             raise ValueError("Signals length mismatch")
-        returns = self._compute_returns(closes)
+        returns = self._compute_returns(np.asarray(closes, dtype=np.float64).tolist())
         strategy_returns = [signal * r for signal, r in zip(signals, returns)]
         cumulative = self._cumulative_return(strategy_returns)
-        annual = self._annualized_return(cumulative, len(returns))
+        annual = self._annualized_return(cumulative, len(returns), self.periods_per_year)
         sharpe = self._sharpe_ratio(strategy_returns)
         drawdown = self._max_drawdown(strategy_returns)
         LOGGER.info(
@@ -44,6 +127,142 @@ class Backtester:
         )
         return BacktestResult(cumulative, annual, sharpe, drawdown)
 
+    def run_many(self, strategies: Sequence[Strategy], closes: Prices, tail: int | None = None) -> List[BacktestResult]:
+        """Backtest several strategies against the same closes in one pass.
+
+        With ``tail`` only the last ``tail`` bars are scored, while signals are
+        still generated on (and warmed up over) the whole history.
+        """
+        if not strategies:
+            return []
+        LOGGER.info("Running batch backtest for %d strategies", len(strategies))
+        prices = np.asarray(closes, dtype=np.float64)
+        signals = stack_signals([strategy.generate_signals(closes) for strategy in strategies], len(prices))
+        return self.run_batch(prices, signals, tail)
+
+    def run_batch(self, closes: Prices, signals: np.ndarray, tail: int | None = None) -> List[BacktestResult]:
+        """Return one ``BacktestResult`` per row of a (strategies x bars) signal matrix.
+
+        ``tail`` restricts the metrics to the strategy returns of the last ``tail`` bars.
+        """
+        prices = np.asarray(closes, dtype=np.float64)
+        # Signals keep their compact dtype; the product with the float returns promotes them.
+        matrix = np.atleast_2d(np.asarray(signals))
+        if matrix.shape[1] != prices.shape[0]:
+            raise ValueError("Signals length mismatch")
+        strategy_returns = matrix * self.compute_returns(prices)
+        if tail is not None:
+            strategy_returns = strategy_returns[:, max(len(prices) - tail, 0) :]
+        total, annual, sharpe, drawdown = self.metric_arrays(strategy_returns)
+        return [
+            BacktestResult(float(t), float(a), float(s), float(d))
+            for t, a, s, d in zip(total, annual, sharpe, drawdown)
+        ]
+
+    def run_streaming(self, chunks: Iterable[Tuple[Sequence[float], Sequence[float]]]) -> BacktestResult:
+        """Backtest ``(closes, signals)`` chunks in one fused pass with constant memory."""
+        accumulator = MetricsAccumulator(self.risk_free_rate, self.periods_per_year)
+        prev_close: float | None = None
+        for closes, signals in chunks:
+            prices = np.asarray(closes, dtype=np.float64)
+            positions = np.asarray(signals, dtype=np.float64)
+            if positions.shape != prices.shape:
+                raise ValueError("Signals length mismatch")
+            if prices.size == 0:
+                continue
+            if prev_close is None:
+                returns = self.compute_returns(prices)
+            else:
+                returns = self.compute_returns(np.concatenate([[prev_close], prices]))[1:]
+            accumulator.update_chunk(positions * returns)
+            prev_close = float(prices[-1])
+        return accumulator.result()
+
+    def cross_check(self, strategies: Sequence[Strategy], closes: Prices, rel_tol: float = 1e-9) -> None:
+        """Assert that the vectorized engine matches the scalar reference path."""
+        batch = self.run_many(strategies, closes)
+        for strategy, vectorized in zip(strategies, batch):
+            reference = self.run(strategy, closes)
+            for name in ("total_return", "annualized_return", "sharpe_ratio", "max_drawdown"):
+                expected = getattr(reference, name)
+                actual = getattr(vectorized, name)
+                if not math.isclose(expected, actual, rel_tol=rel_tol, abs_tol=1e-12):
+                    raise AssertionError(f"{strategy} {name}: scalar={expected!r} vectorized={actual!r}")
+
+    @staticmethod
+    def compute_returns(closes: np.ndarray) -> np.ndarray:
+        """Vectorized ``_compute_returns``: simple returns with a leading zero."""
+        returns = np.zeros(closes.shape, dtype=np.float64)
+        prev = closes[..., :-1]
+        np.divide(closes[..., 1:] - prev, prev, out=returns[..., 1:], where=prev != 0)
+        return returns
+
+    def metric_arrays(
+        self,
+        strategy_returns: np.ndarray,
+        periods: np.ndarray | None = None,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Return total, annualized, Sharpe and drawdown arrays for each row of returns.
+
+        ``periods`` gives the number of live bars per row when rows are padded
+        with zero returns outside their live span (e.g. symbols listed later in
+        a panel); annualization and Sharpe then only count those bars.
+        """
+        if periods is not None:
+            return self._padded_metric_arrays(np.atleast_2d(strategy_returns), np.asarray(periods))
+        returns = np.atleast_2d(strategy_returns)
+        rows, periods = returns.shape
+        # Equity, peaks and drawdowns reuse two buffers so large path matrices stay cheap.
+        equity = np.cumprod(1.0 + returns, axis=1, out=np.empty(returns.shape))
+        total = (equity[:, -1] if periods else np.ones(rows)) - 1.0
+
+        annual = np.zeros(rows)
+        if periods:
+            years = periods / self.periods_per_year
+            with np.errstate(invalid="ignore"):
+                annual = (1.0 + total) ** (1 / years) - 1
+
+        sharpe = np.zeros(rows)
+        if periods >= 2:
+            mean = returns.mean(axis=1)
+            std = returns.std(axis=1, ddof=1)
+            excess = mean - self.risk_free_rate / self.periods_per_year
+            np.divide(excess, std, out=sharpe, where=std != 0)
+            sharpe *= math.sqrt(self.periods_per_year)
+
+        drawdown = np.zeros(rows)
+        if periods:
+            # Peaks include the starting equity of 1.0, which itself never draws down.
+            peak = equity.copy()
+            np.maximum(peak[:, 0], 1.0, out=peak[:, 0])
+            np.maximum.accumulate(peak, axis=1, out=peak)
+            np.subtract(peak, equity, out=equity)
+            np.divide(equity, peak, out=equity)
+            equity.max(axis=1, out=drawdown)
+        return total, annual, sharpe, drawdown
+
+    def _padded_metric_arrays(
+        self,
+        returns: np.ndarray,
+        periods: np.ndarray,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        total, _, _, drawdown = self.metric_arrays(returns)
+        counts = np.broadcast_to(periods, total.shape).astype(np.float64)
+        annual = np.zeros(total.shape)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            years = counts / self.periods_per_year
+            np.subtract((1.0 + total) ** (1 / years), 1.0, out=annual, where=counts > 0)
+        sharpe = np.zeros(total.shape)
+        mean = np.divide(returns.sum(axis=1), counts, out=np.zeros(total.shape), where=counts > 0)
+        # Padding bars are exact zeros, each adding ``mean ** 2`` to the squared deviations.
+        m2 = ((returns - mean[:, None]) ** 2).sum(axis=1) - (returns.shape[1] - counts) * mean * mean
+        variance = np.divide(np.maximum(m2, 0.0), counts - 1, out=np.zeros(total.shape), where=counts >= 2)
+        std = np.sqrt(variance)
+        excess = mean - self.risk_free_rate / self.periods_per_year
+        np.divide(excess, std, out=sharpe, where=std != 0)
+        sharpe *= math.sqrt(self.periods_per_year)
+        return total, annual, sharpe, drawdown
+
     @staticmethod
     def _compute_returns(closes: List[float]) -> List[float]:
         returns: List[float] = [0.0]
@@ -62,10 +281,10 @@ class Backtester:
         return total - 1
 
     @staticmethod
-    def _annualized_return(total_return: float, periods: int) -> float:
+    def _annualized_return(total_return: float, periods: int, periods_per_year: float = 365.0) -> float:
         if periods == 0:
             return 0.0
-        years = periods / 365
+        years = periods / periods_per_year
         if years == 0:
             return 0.0
         return (1 + total_return) ** (1 / years) - 1
@@ -78,8 +297,8 @@ class Backtester:
         std = math.sqrt(variance)
         if std == 0:
             return 0.0
-        excess = mean - self.risk_free_rate / 365
-        return (excess / std) * math.sqrt(365)
+        excess = mean - self.risk_free_rate / self.periods_per_year
+        return (excess / std) * math.sqrt(self.periods_per_year)
 
     @staticmethod
     def _max_drawdown(returns: List[float]) -> float:
@@ -0,0 +1,142 @@
+"""Typed, array-backed bar series shared by the data, strategy and backtest layers."""
+from __future__ import annotations
+
+from typing import Any, Dict, Iterator, Sequence, Union, overload
+
+import numpy as np
+
+from .candle_store import CANDLE_DTYPE
+
+# Strategy signals (-1, 0, 1) are stored one byte per bar.
+SIGNAL_DTYPE = np.dtype(np.int8)
+
+COLUMNS = ("open_time", "open", "high", "low", "close", "volume", "trades")
+_DTYPES = {name: CANDLE_DTYPE.fields[name][0] for name in COLUMNS}
+
+
+class BarSeries:
+    """OHLCV bars as one contiguous buffer per column.
+
+    ``open_time`` and ``trades`` are int64, prices and volume float64. As a
+    sequence the series behaves like its closes (``len``, iteration, indexing
+    and ``np.asarray``), so it can be passed wherever closes are accepted.
+    Slicing returns a ``BarSeries`` of views without copying, and pickling
+    only serialises the viewed bars.
+    """
+
+    __slots__ = COLUMNS
+
+    def __init__(
+        self,
+        open_time: np.ndarray,
+        open: np.ndarray,  # noqa: A002 - candle field name
+        high: np.ndarray,
+        low: np.ndarray,
+        close: np.ndarray,
+        volume: np.ndarray,
+        trades: np.ndarray,
+    ) -> None:
+        values = (open_time, open, high, low, close, volume, trades)
+        length = None
+        for name, value in zip(COLUMNS, values):
+            column = np.ascontiguousarray(value, dtype=_DTYPES[name])
+            if column.ndim != 1 or (length is not None and len(column) != length):
+                raise ValueError("Bar columns must be one-dimensional and of equal length")
+            length = len(column)
+            object.__setattr__(self, name, column)
+
+    @classmethod
+    def from_candles(cls, candles: np.ndarray) -> "BarSeries":
+        """Split a ``CANDLE_DTYPE`` array (e.g. a memory-mapped store) into columns."""
+        return cls(*(candles[name] for name in COLUMNS))
+
+    @classmethod
+    def from_closes(cls, closes: Sequence[float] | np.ndarray, open_time: np.ndarray | None = None) -> "BarSeries":
+        """Wrap bare closes; open, high and low share the close buffer and volume is zero."""
+        close = np.ascontiguousarray(closes, dtype=np.float64)
+        times = np.arange(len(close), dtype=np.int64) if open_time is None else open_time
+        empty = np.zeros(len(close), dtype=np.float64)
+        return cls(times, close, close, close, close, empty, empty.view(np.int64))
+
+    def to_candles(self) -> np.ndarray:
+        candles = np.empty(len(self), dtype=CANDLE_DTYPE)
+        for name in COLUMNS:
+            candles[name] = getattr(self, name)
+        return candles
+
+    def buffers(self) -> Dict[str, memoryview]:
+        """Return a read-only buffer-protocol view of every column."""
+        return {name: memoryview(getattr(self, name)).toreadonly() for name in COLUMNS}
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the columns, counting shared buffers once."""
+        sizes: Dict[int, int] = {}
+        for name in COLUMNS:
+            column = getattr(self, name)
+            address = column.__array_interface__["data"][0]
+            sizes[address] = max(sizes.get(address, 0), column.nbytes)
+        return sum(sizes.values())
+
+    def __len__(self) -> int:
+        return len(self.close)
+
+    def __iter__(self) -> Iterator[float]:
+        return iter(self.close)
+
+    @overload
+    def __getitem__(self, index: int) -> float: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "BarSeries": ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[float, "BarSeries"]:
+        if isinstance(index, slice):
+            return BarSeries(*(getattr(self, name)[index] for name in COLUMNS))
+        return float(self.close[index])
+
+    def __array__(self, dtype: Any = None, copy: bool | None = None) -> np.ndarray:
+        if copy:
+            return np.array(self.close, dtype=dtype)
+        return self.close if dtype is None else self.close.astype(dtype, copy=False)
+
+    def __buffer__(self, flags: int) -> memoryview:  # PEP 688 (Python 3.12+): exports the closes
+        return memoryview(self.close)
+
+    def __reduce__(self) -> tuple:
+        # Columns pickle by value, so a slice of a long history only ships its own bars.
+        return BarSeries, tuple(np.ascontiguousarray(getattr(self, name)) for name in COLUMNS)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("BarSeries columns are fixed; write into the arrays instead")
+
+    def __repr__(self) -> str:
+        if not len(self):
+            return "BarSeries(0 bars)"
+        return f"BarSeries({len(self)} bars, open_time {int(self.open_time[0])}..{int(self.open_time[-1])})"
+
+
+Prices = Union[Sequence[float], np.ndarray, BarSeries]
+
+
+def stack_signals(rows: Sequence[Any], length: int) -> np.ndarray:
+    """Stack per-strategy signal rows into a (rows x ``length``) matrix.
+
+    The matrix is ``SIGNAL_DTYPE`` when every row converts losslessly;
+    fractional or out-of-range positions (e.g. 0.5 for half size) keep the
+    matrix float64 instead of being truncated.
+    """
+    arrays = [np.asarray(row) for row in rows]
+    if any(array.shape != (length,) for array in arrays):
+        raise ValueError("Signals length mismatch")
+    info = np.iinfo(SIGNAL_DTYPE)
+    compact = all(
+        array.dtype == SIGNAL_DTYPE
+        or array.dtype == np.bool_
+        or (array.dtype.kind in "iu" and (not array.size or (array.min() >= info.min and array.max() <= info.max)))
+        for array in arrays
+    )
+    matrix = np.empty((len(arrays), length), dtype=SIGNAL_DTYPE if compact else np.float64)
+    for index, array in enumerate(arrays):
+        matrix[index] = array
+    return matrix
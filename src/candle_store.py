@@ -0,0 +1,142 @@
+"""Local memory-mapped OHLCV candle store."""
+from __future__ import annotations
+
+import logging
+import os
+from pathlib import Path
+from typing import IO, Dict, Iterable, List, Sequence
+
+import numpy as np
+
+try:  # POSIX only; appends are not serialised across processes elsewhere
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore[assignment]
+
+LOGGER = logging.getLogger(__name__)
+
+CANDLE_DTYPE = np.dtype(
+    [
+        ("open_time", "<i8"),
+        ("open", "<f8"),
+        ("high", "<f8"),
+        ("low", "<f8"),
+        ("close", "<f8"),
+        ("volume", "<f8"),
+        ("trades", "<i8"),
+    ]
+)
+
+# Nominal bar widths of the Binance kline intervals (``1M`` uses a 31-day upper bound).
+INTERVAL_MS: Dict[str, int] = {
+    "1s": 1_000,
+    "1m": 60_000,
+    "3m": 180_000,
+    "5m": 300_000,
+    "15m": 900_000,
+    "30m": 1_800_000,
+    "1h": 3_600_000,
+    "2h": 7_200_000,
+    "4h": 14_400_000,
+    "6h": 21_600_000,
+    "8h": 28_800_000,
+    "12h": 43_200_000,
+    "1d": 86_400_000,
+    "3d": 259_200_000,
+    "1w": 604_800_000,
+    "1M": 2_678_400_000,
+}
+
+
+def interval_ms(interval: str) -> int:
+    try:
+        return INTERVAL_MS[interval]
+    except KeyError:
+        raise ValueError(f"Unsupported kline interval: {interval}") from None
+
+
+def candles_from_klines(rows: Iterable[Sequence]) -> np.ndarray:
+    """Convert Binance kline rows into a structured candle array."""
+    records: List[tuple] = [
+        (int(row[0]), float(row[1]), float(row[2]), float(row[3]), float(row[4]), float(row[5]), int(row[8]))
+        for row in rows
+    ]
+    return np.array(records, dtype=CANDLE_DTYPE)
+
+
+class CandleStore:
+    """Persist candles as one append-only columnar record file per symbol and interval.
+
+    Files hold fixed-size little-endian records in ``CANDLE_DTYPE`` order and
+    are read back through ``np.memmap`` so callers get zero-copy views such as
+    ``store.load("BTCUSDT", "1d")["close"]``. Appends to one file hold an
+    exclusive ``flock`` on it, so concurrent jobs and processes syncing the
+    same symbol and interval never interleave or duplicate records.
+    """
+
+    def __init__(self, root: Path) -> None:
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    def path_for(self, symbol: str, interval: str) -> Path:
+        return self.root / f"{symbol.upper()}-{interval}.candles"
+
+    def load(self, symbol: str, interval: str) -> np.ndarray:
+        """Return a read-only memory-mapped view of every stored candle."""
+        path = self.path_for(symbol, interval)
+        count = self._record_count(path)
+        if count == 0:
+            return np.empty(0, dtype=CANDLE_DTYPE)
+        return np.memmap(path, dtype=CANDLE_DTYPE, mode="r", shape=(count,))
+
+    def last_open_time(self, symbol: str, interval: str) -> int | None:
+        path = self.path_for(symbol, interval)
+        count = self._record_count(path)
+        if count == 0:
+            return None
+        with path.open("rb") as handle:
+            handle.seek((count - 1) * CANDLE_DTYPE.itemsize)
+            record = np.frombuffer(handle.read(CANDLE_DTYPE.itemsize), dtype=CANDLE_DTYPE)
+        return int(record["open_time"][0])
+
+    def append(self, symbol: str, interval: str, candles: np.ndarray) -> int:
+        """Append candles newer than the last stored one and return how many were written."""
+        path = self.path_for(symbol, interval)
+        candles = np.asarray(candles, dtype=CANDLE_DTYPE)
+        with path.open("a+b") as handle:
+            if fcntl is not None:
+                # Held until the handle closes: repair, read the tail and append as one step.
+                fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+            last = self._last_record_time(path, handle)
+            if last is not None:
+                candles = candles[candles["open_time"] > last]
+            if candles.size == 0:
+                return 0
+            if np.any(np.diff(candles["open_time"]) <= 0):
+                raise ValueError("Candles must be sorted by strictly increasing open time")
+            handle.write(candles.tobytes())
+            handle.flush()
+            os.fsync(handle.fileno())
+        LOGGER.info("Stored %d new %s %s candles", candles.size, symbol, interval)
+        return int(candles.size)
+
+    @staticmethod
+    def _record_count(path: Path) -> int:
+        if not path.exists():
+            return 0
+        return path.stat().st_size // CANDLE_DTYPE.itemsize
+
+    @staticmethod
+    def _last_record_time(path: Path, handle: IO[bytes]) -> int | None:
+        """Drop a torn trailing record left by an interrupted append and return the last open time."""
+        size = os.fstat(handle.fileno()).st_size
+        remainder = size % CANDLE_DTYPE.itemsize
+        if remainder:
+            LOGGER.warning("Discarding partial candle record in %s", path)
+            size -= remainder
+            handle.truncate(size)
+        if size == 0:
+            return None
+        handle.seek(size - CANDLE_DTYPE.itemsize)
+        record = np.frombuffer(handle.read(CANDLE_DTYPE.itemsize), dtype=CANDLE_DTYPE)
+        return int(record["open_time"][0])
@@ -0,0 +1,232 @@
+"""Command line interface with one subcommand per pipeline stage.
+
+Each subcommand imports only the modules it needs, so ``requests`` and NumPy
+are loaded lazily and operational commands start quickly::
+
+    python -m src.cli --timings backtest --strategy sma --param fast_window=5
+"""
+from __future__ import annotations
+
+import time
+
+_STARTED = time.perf_counter()
+
+import argparse  # noqa: E402 - measured from the very top of the module
+import json  # noqa: E402
+import logging  # noqa: E402
+import sys  # noqa: E402
+from typing import Any, Callable, Dict, List  # noqa: E402
+
+LOGGER = logging.getLogger(__name__)
+
+STRATEGY_ALIASES = {"sma": "SmaCrossStrategy", "momentum": "MomentumStrategy", "hold": "HoldStrategy"}
+
+
+def _ready(args: argparse.Namespace) -> None:
+    """Report how long the command took to import everything it needs."""
+    if args.timings:
+        elapsed = (time.perf_counter() - _STARTED) * 1000
+        print(f"startup: {elapsed:.1f} ms ({len(sys.modules)} modules loaded)", file=sys.stderr)
+
+
+def _print(payload: Any) -> None:
+    print(json.dumps(payload, indent=2, sort_keys=True, default=str))
+
+
+def _parse_params(pairs: List[str]) -> Dict[str, Any]:
+    params: Dict[str, Any] = {}
+    for pair in pairs:
+        name, _, raw = pair.partition("=")
+        try:
+            params[name] = json.loads(raw)
+        except json.JSONDecodeError:
+            params[name] = raw
+    return params
+
+
+def cmd_crawl(args: argparse.Namespace) -> int:
+    from pathlib import Path
+
+    from .crawler import GitHubModelCrawler
+    from .model_repository import ModelRepository
+
+    _ready(args)
+    repositories = GitHubModelCrawler().fetch_recent_models()
+    new = ModelRepository(Path(args.repository)).update(repositories)
+    _print({"fetched": len(repositories), "new": [repo.get("full_name") for repo in new]})
+    return 0
+
+
+def cmd_sync_data(args: argparse.Namespace) -> int:
+    from .config import CONFIG
+    from .data import HistoricalDataClient
+
+    _ready(args)
+    symbol = args.symbol or CONFIG.data.symbol
+    interval = args.interval or CONFIG.data.interval
+    candles = HistoricalDataClient().fetch_candles(symbol, interval)
+    first = int(candles["open_time"][0]) if len(candles) else None
+    last = int(candles["open_time"][-1]) if len(candles) else None
+    _print({"symbol": symbol, "interval": interval, "candles": len(candles), "first": first, "last": last})
+    return 0
+
+
+def cmd_backtest(args: argparse.Namespace) -> int:
+    from dataclasses import asdict
+    from pathlib import Path
+
+    from . import strategies
+    from .backtester import Backtester
+    from .candle_store import CandleStore
+    from .config import CONFIG
+
+    _ready(args)
+    store_dir = CONFIG.data.store_dir
+    if not store_dir:
+        print("backtest reads the local candle store; set DataConfig.store_dir", file=sys.stderr)
+        return 2
+    interval = args.interval or CONFIG.data.interval
+    strategy_cls = getattr(strategies, STRATEGY_ALIASES.get(args.strategy, args.strategy))
+    strategy = strategy_cls(**_parse_params(args.param))
+    if args.symbols:
+        from .panel import PanelBacktest, align_candles
+
+        store = CandleStore(Path(store_dir))
+        panel_candles = {symbol: store.load(symbol, interval) for symbol in args.symbols.split(",")}
+        if not any(len(rows) for rows in panel_candles.values()):
+            print(f"No stored candles for {args.symbols} {interval}; run sync-data first", file=sys.stderr)
+            return 1
+        panel = align_candles(panel_candles)
+        panel_result = PanelBacktest().run(strategy, panel)
+        _print(
+            {
+                "strategy": type(strategy).__name__,
+                "params": asdict(strategy),
+                "bars": panel.bars,
+                "portfolio": asdict(panel_result.portfolio),
+                "symbols": {symbol: asdict(result) for symbol, result in panel_result.symbols.items()},
+            }
+        )
+        return 0
+    symbol = args.symbol or CONFIG.data.symbol
+    candles = CandleStore(Path(store_dir)).load(symbol, interval)
+    if len(candles) == 0:
+        print(f"No stored candles for {symbol} {interval}; run sync-data first", file=sys.stderr)
+        return 1
+    result = Backtester().run_many([strategy], candles["close"])[0]
+    _print({"strategy": type(strategy).__name__, "params": asdict(strategy), "bars": len(candles), **asdict(result)})
+    return 0
+
+
+def cmd_evaluate(args: argparse.Namespace) -> int:
+    from pathlib import Path
+
+    from .evaluator import ModelEvaluator
+    from .model_factory import build_candidate
+    from .model_repository import ModelRepository
+
+    _ready(args)
+    models = ModelRepository(Path(args.repository)).query(topic=args.topic, pushed_since=args.since, limit=args.limit)
+    outcomes = ModelEvaluator().evaluate(build_candidate(model) for model in models)
+    _print(
+        [
+            {
+                "repository": outcome.candidate.metadata.get("full_name"),
+                "strategy": repr(outcome.candidate.strategy),
+                "eligible": outcome.eligible_for_live,
+                "sharpe_ratio": outcome.result.sharpe_ratio,
+                "annualized_return": outcome.result.annualized_return,
+                "max_drawdown": outcome.result.max_drawdown,
+            }
+            for outcome in outcomes
+        ]
+    )
+    return 0
+
+
+def cmd_trade(args: argparse.Namespace) -> int:
+    from .config import CONFIG
+    from .trader import TradeDecision, Trader
+
+    _ready(args)
+    decision = TradeDecision(
+        symbol=args.symbol or CONFIG.binance.trade_symbol,
+        side=args.side,
+        quantity=args.quantity if args.quantity is not None else CONFIG.binance.trade_quantity,
+        client_order_id=args.client_order_id,
+    )
+    _print(Trader().execute(decision))
+    return 0
+
+
+def cmd_run(args: argparse.Namespace) -> int:
+    from pathlib import Path
+
+    from .pipeline import DailyPipeline
+
+    _ready(args)
+    decisions = DailyPipeline(repository_path=Path(args.repository)).run()
+    _print([decision.__dict__ for decision in decisions])
+    return 0
+
+
+def cmd_schedule(args: argparse.Namespace) -> int:
+    from .scheduler import run_forever
+
+    _ready(args)
+    run_forever()
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m src.cli", description="Crypto AI trading pipeline")
+    parser.add_argument("--log-level", default="INFO")
+    parser.add_argument("--timings", action="store_true", help="report startup import time on stderr")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    def add(name: str, handler: Callable[[argparse.Namespace], int], help_text: str) -> argparse.ArgumentParser:
+        command = sub.add_parser(name, help=help_text)
+        command.set_defaults(handler=handler)
+        return command
+
+    crawl = add("crawl", cmd_crawl, "crawl GitHub and store new repositories")
+    crawl.add_argument("--repository", default="data/models.sqlite3")
+
+    sync = add("sync-data", cmd_sync_data, "download candles newer than the local store")
+    sync.add_argument("--symbol")
+    sync.add_argument("--interval")
+
+    backtest = add("backtest", cmd_backtest, "backtest one strategy on stored candles (no network)")
+    backtest.add_argument("--strategy", default="sma", help="sma, momentum, hold or a strategy class name")
+    backtest.add_argument("--param", action="append", default=[], metavar="NAME=VALUE")
+    backtest.add_argument("--symbol")
+    backtest.add_argument("--symbols", help="comma-separated symbols scored as one equal-weight panel")
+    backtest.add_argument("--interval")
+
+    evaluate = add("evaluate", cmd_evaluate, "evaluate stored repositories without trading")
+    evaluate.add_argument("--repository", default="data/models.sqlite3")
+    evaluate.add_argument("--topic")
+    evaluate.add_argument("--since", help="only repositories pushed since this ISO date")
+    evaluate.add_argument("--limit", type=int)
+
+    trade = add("trade", cmd_trade, "place a single market order")
+    trade.add_argument("--symbol")
+    trade.add_argument("--side", choices=["BUY", "SELL"], default="BUY")
+    trade.add_argument("--quantity", type=float)
+    trade.add_argument("--client-order-id")
+
+    run = add("run", cmd_run, "run the full pipeline once")
+    run.add_argument("--repository", default="data/models.sqlite3")
+
+    add("schedule", cmd_schedule, "run the job scheduler until interrupted")
+    return parser
+
+
+def main(argv: List[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    logging.basicConfig(level=args.log_level.upper(), format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -11,9 +11,17 @@ class GitHubConfig:
     """Parameters for GitHub model crawling."""
 
     query: str = "crypto AI trading"
-    per_page: int = 10
+    extra_queries: tuple[str, ...] = (
+        "crypto trading bot machine learning",
+        "bitcoin reinforcement learning trading",
+    )
+    per_page: int = 50
+    max_pages: int = 4
     sort: str = "updated"
     order: str = "desc"
+    max_concurrent_requests: int = 4
+    etag_cache_path: str | None = "data/github_etags.json"
+    api_token: str | None = os.getenv("GITHUB_TOKEN")
 
 
 @dataclass(frozen=True)
@@ -23,6 +31,10 @@ class DataConfig:
     symbol: str = "BTCUSDT"
     interval: str = "1d"
     lookback_years: int = 3
+    store_dir: str | None = "data/candles"  # None disables the local candle store
+    max_concurrent_requests: int = 4
+    request_retries: int = 3
+    weight_limit_per_minute: int = 5000  # stay below Binance's 6000/minute IP limit
 
 
 @dataclass(frozen=True)
@@ -32,13 +44,85 @@ class EvaluationConfig:
     min_annual_return: float = 0.15
     min_sharpe_ratio: float = 1.0
     max_drawdown: float = 0.35
+    result_cache_path: str | None = "data/backtest_cache.sqlite3"  # None disables caching
+    result_cache_max_entries: int = 100_000
+    result_cache_max_age_days: float = 30.0
+    # Extra intervals resampled from DataConfig.interval; every candidate is also scored on each.
+    timeframes: tuple[str, ...] = ()
+    min_timeframe_pass_rate: float = 1.0  # share of all scored timeframes that must meet the thresholds
+
+
+@dataclass(frozen=True)
+class WalkForwardConfig:
+    """Walk-forward window layout and the distribution gates applied to it."""
+
+    enabled: bool = False
+    train_bars: int = 365
+    test_bars: int = 90
+    step_bars: int = 30
+    expanding: bool = False  # anchor every train window at the first bar
+    min_pass_rate: float = 0.5  # share of test windows that must meet EvaluationConfig
+    min_median_sharpe: float = 0.5
+
+
+@dataclass(frozen=True)
+class ScreeningConfig:
+    """Successive cheap rounds on recent bars that reject hopeless candidates early."""
+
+    enabled: bool = False
+    rungs: tuple[int, ...] = (90, 365)  # recent bars scored per round, cheapest first
+    sharpe_margin: float = 1.0  # reject below EvaluationConfig.min_sharpe_ratio minus this
+    return_margin: float = 0.3  # reject below EvaluationConfig.min_annual_return minus this
+    drawdown_margin: float = 0.15  # reject above EvaluationConfig.max_drawdown plus this
+    # Additionally keep only the best share by Sharpe per round, e.g. 0.5. The ranking needs the
+    # whole batch, so it is skipped when ExecutionConfig.evaluation_processes isolates candidates.
+    keep_fraction: float = 1.0
+
+
+@dataclass(frozen=True)
+class RobustnessConfig:
+    """Bootstrap resampling of strategy returns and the confidence gates applied to it."""
+
+    enabled: bool = False
+    paths: int = 2000
+    block_size: int = 20  # bars per resampled block; 0 shuffles single bars without replacement
+    seed: int = 7  # fixed so repeated evaluations of the same data agree
+    chunk_paths: int = 1000  # paths scored per vectorized pass, bounds peak memory
+    percentile: float = 5.0  # lower tail used for return and Sharpe, upper tail for drawdown
+    min_sharpe_ratio: float = 0.5
+    min_annual_return: float = 0.0
+    max_drawdown: float = 0.5
+
+
+@dataclass(frozen=True)
+class PanelConfig:
+    """Cross-sectional evaluation of every candidate over several symbols at once."""
+
+    # e.g. the top pairs by volume; when set, ModelEvaluator.evaluate and the daily pipeline score
+    # candidates on this panel instead of DataConfig.symbol alone. Empty disables panel evaluation.
+    symbols: tuple[str, ...] = ()
+    min_symbol_pass_rate: float = 0.5  # share of symbols whose own result must meet EvaluationConfig
+
+
+@dataclass(frozen=True)
+class RescoringConfig:
+    """Persisted sliding-window scores of tracked strategies, advanced by new bars only."""
+
+    state_path: str = "data/tracked_scores.sqlite3"
+    window_bars: int | None = None  # None: DataConfig.lookback_years worth of bars
 
 
 @dataclass(frozen=True)
 class SchedulerConfig:
-    """Configuration for the daily scheduler."""
+    """Configuration for the job scheduler."""
 
     run_time: time = time(hour=6, minute=0)  # 06:00 UTC
+    state_path: str | None = "data/scheduler_state.json"
+    repository_path: str = "data/models.sqlite3"
+    max_workers: int = 4
+    jitter_seconds: float = 30.0
+    candle_refresh_minutes: int | None = 60
+    reevaluate_minutes: int | None = None
 
 
 @dataclass(frozen=True)
@@ -50,6 +134,46 @@ class BinanceConfig:
     api_secret: str | None = os.getenv("BINANCE_API_SECRET")
     trade_symbol: str = "BTCUSDT"
     trade_quantity: float = 0.001
+    recv_window_ms: int = 5000
+    order_timeout: float = 10.0
+    max_order_retries: int = 3
+    max_concurrent_orders: int = 4
+    order_limit_10s: int = 50
+    order_limit_1d: int = 160_000
+
+
+@dataclass(frozen=True)
+class HttpConfig:
+    """Shared connection pooling and response cache for the read-only API clients."""
+
+    cache_path: str | None = "data/http_cache.sqlite3"  # None disables caching
+    cache_max_mb: float = 256.0
+    ttl_seconds: float = 900.0  # fresh entries are served without contacting the server
+    mode: str = os.getenv("PIPELINE_HTTP_MODE", "live")  # live, record (refresh every entry) or replay (offline)
+    pool_connections: int = 4
+    pool_maxsize: int = 16
+
+
+@dataclass(frozen=True)
+class ExecutionConfig:
+    """How the pipeline stages are scheduled within one run."""
+
+    overlap_stages: bool = False  # download candles during the crawl, trade while backtests run
+    max_workers: int = 4
+    evaluation_batch_size: int = 16
+    evaluation_processes: int = 0  # >0 evaluates each candidate in an isolated worker process
+    candidate_timeout_seconds: float | None = 300.0  # hung candidates are killed and marked failed
+    worker_memory_mb: int | None = 4096  # address-space cap per worker (POSIX only)
+    worker_start_method: str | None = "spawn"  # fresh interpreters; forking a threaded parent is unsafe
+
+
+@dataclass(frozen=True)
+class MetricsConfig:
+    """Per-run instrumentation and where its summaries are exported."""
+
+    enabled: bool = os.getenv("PIPELINE_METRICS", "0") == "1"
+    prometheus_path: str | None = "data/metrics/pipeline.prom"
+    jsonl_path: str | None = "data/metrics/runs.jsonl"
 
 
 @dataclass(frozen=True)
@@ -59,8 +183,16 @@ class PipelineConfig:
     github: GitHubConfig = GitHubConfig()
     data: DataConfig = DataConfig()
     evaluation: EvaluationConfig = EvaluationConfig()
+    walk_forward: WalkForwardConfig = WalkForwardConfig()
+    screening: ScreeningConfig = ScreeningConfig()
+    robustness: RobustnessConfig = RobustnessConfig()
+    panel: PanelConfig = PanelConfig()
+    rescoring: RescoringConfig = RescoringConfig()
     scheduler: SchedulerConfig = SchedulerConfig()
     binance: BinanceConfig = BinanceConfig()
+    metrics: MetricsConfig = MetricsConfig()
+    execution: ExecutionConfig = ExecutionConfig()
+    http: HttpConfig = HttpConfig()
 
 
 CONFIG = PipelineConfig()
@@ -1,41 +1,190 @@
 """Utilities for discovering recent open-source crypto AI trading models."""
 from __future__ import annotations
 
+import json
 import logging
+import math
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Any, Dict, List
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
 
 import requests
 
 from .config import CONFIG
+from .http_client import build_session
+from .metrics import METRICS
 
 LOGGER = logging.getLogger(__name__)
 
+PageKey = Tuple[str, int]
+
+
+class RateLimiter:
+    """Schedule requests from GitHub's ``X-RateLimit-Remaining``/``Reset`` headers."""
+
+    def __init__(self, reserve: int = 1) -> None:
+        self._reserve = reserve
+        self._remaining: int | None = None
+        self._reset_at = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self) -> None:
+        """Block until the current rate-limit window has budget for one more request."""
+        while True:
+            with self._lock:
+                now = time.time()
+                if self._remaining is None or now >= self._reset_at or self._remaining > self._reserve:
+                    if self._remaining is not None and now < self._reset_at:
+                        self._remaining -= 1
+                    return
+                delay = self._reset_at - now + 1
+            LOGGER.info("GitHub rate limit reached, sleeping %.0fs until reset", delay)
+            time.sleep(delay)
+
+    def observe(self, response: requests.Response) -> None:
+        remaining = response.headers.get("X-RateLimit-Remaining")
+        reset = response.headers.get("X-RateLimit-Reset")
+        retry_after = response.headers.get("Retry-After")
+        with self._lock:
+            if remaining is not None and reset is not None:
+                self._remaining = int(remaining)
+                self._reset_at = float(reset)
+            if retry_after is not None:
+                self._remaining = 0
+                self._reset_at = max(self._reset_at, time.time() + float(retry_after))
+
+
+class ConditionalCache:
+    """Persist ETags and payloads of search result pages for conditional requests."""
+
+    def __init__(self, path: Path | None) -> None:
+        self._path = path
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        if path is not None and path.exists():
+            try:
+                entries = json.loads(path.read_text(encoding="utf-8"))
+            except ValueError:  # undecodable bytes or malformed JSON
+                entries = None
+            if isinstance(entries, dict) and all(
+                isinstance(entry, dict) and {"etag", "payload"} <= entry.keys() for entry in entries.values()
+            ):
+                self._entries = entries
+            else:
+                LOGGER.warning("ETag cache corrupted, resetting: %s", path)
+
+    @staticmethod
+    def _key(page: PageKey) -> str:
+        return f"{page[0]}#{page[1]}"
+
+    def get(self, page: PageKey) -> Dict[str, Any] | None:
+        with self._lock:
+            return self._entries.get(self._key(page))
+
+    def put(self, page: PageKey, etag: str, payload: Dict[str, Any]) -> None:
+        with self._lock:
+            self._entries[self._key(page)] = {"etag": etag, "payload": payload}
+
+    def save(self) -> None:
+        if self._path is None:
+            return
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self._path.with_suffix(self._path.suffix + ".tmp")
+        with self._lock:
+            tmp.write_text(json.dumps(self._entries), encoding="utf-8")
+        os.replace(tmp, self._path)
+
 
 class GitHubModelCrawler:
-    """Fetch model repositories from GitHub search."""
+    """Fetch model repositories from GitHub search.
+
+    Every configured query is walked page by page with a small thread pool.
+    Requests carry ``If-None-Match`` so unchanged pages come back as 304s
+    that do not count against the search quota.
+    """
 
     SEARCH_URL = "https://api.github.com/search/repositories"
+    MAX_SEARCH_RESULTS = 1000  # GitHub search never returns more than this per query
+    RATE_LIMIT_RETRIES = 2
 
-    def __init__(self, session: requests.Session | None = None) -> None:
-        self._session = session or requests.Session()
+    def __init__(
+        self,
+        session: requests.Session | None = None,
+        search_url: str | None = None,
+        cache: ConditionalCache | None = None,
+    ) -> None:
+        cfg = CONFIG.github
+        if session is None:
+            self._session = build_session("github", cfg.max_concurrent_requests)
+        else:
+            self._session = METRICS.instrument_session(session, "github")
+        self._search_url = search_url or self.SEARCH_URL
+        self._cache = cache or ConditionalCache(Path(cfg.etag_cache_path) if cfg.etag_cache_path else None)
+        self._limiter = RateLimiter()
 
     def fetch_recent_models(self) -> List[Dict[str, Any]]:
-        """Return metadata for the latest repositories that match the query."""
+        """Return metadata for the latest repositories that match the configured queries."""
+        cfg = CONFIG.github
+        queries = (cfg.query, *cfg.extra_queries)
+        with ThreadPoolExecutor(max_workers=cfg.max_concurrent_requests) as pool:
+            first_pages = list(pool.map(self._fetch_page, [(query, 1) for query in queries]))
+            pages: Dict[PageKey, Dict[str, Any]] = {(query, 1): payload for query, payload in zip(queries, first_pages)}
+            follow_up: List[PageKey] = []
+            for query, payload in zip(queries, first_pages):
+                total = min(payload.get("total_count", 0), self.MAX_SEARCH_RESULTS)
+                last_page = min(cfg.max_pages, math.ceil(total / cfg.per_page))
+                follow_up.extend((query, page) for page in range(2, last_page + 1))
+            for key, payload in zip(follow_up, pool.map(self._fetch_page, follow_up)):
+                pages[key] = payload
+        self._cache.save()
+        seen: Dict[Any, Dict[str, Any]] = {}
+        for query in queries:
+            page = 1
+            while (query, page) in pages:
+                for item in pages[(query, page)].get("items", []):
+                    seen.setdefault(item.get("id"), item)
+                page += 1
+        LOGGER.info("Fetched %d repositories from GitHub across %d pages", len(seen), len(pages))
+        return [self._normalize(item) for item in seen.values()]
+
+    def _fetch_page(self, page: PageKey) -> Dict[str, Any]:
         cfg = CONFIG.github
         params = {
-            "q": cfg.query,
+            "q": page[0],
             "sort": cfg.sort,
             "order": cfg.order,
             "per_page": cfg.per_page,
+            "page": page[1],
         }
-        LOGGER.debug("Querying GitHub: %s", params)
-        response = self._session.get(self.SEARCH_URL, params=params, timeout=30)
+        headers = {"Accept": "application/vnd.github+json"}
+        if cfg.api_token:
+            headers["Authorization"] = f"Bearer {cfg.api_token}"
+        cached = self._cache.get(page)
+        if cached:
+            headers["If-None-Match"] = cached["etag"]
+        for _ in range(self.RATE_LIMIT_RETRIES + 1):
+            self._limiter.wait()
+            LOGGER.debug("Querying GitHub: %s", params)
+            response = self._session.get(self._search_url, params=params, headers=headers, timeout=30)
+            self._limiter.observe(response)
+            if response.status_code not in (403, 429) or response.headers.get("X-RateLimit-Remaining") != "0":
+                break
+            LOGGER.warning("GitHub rate limit hit for %s, waiting for reset", page)
+            METRICS.increment("http_retries_total", client="github")
+        if response.status_code == 304 and cached:
+            LOGGER.debug("GitHub page %s unchanged", page)
+            METRICS.increment("github_not_modified_total")
+            return cached["payload"]
         response.raise_for_status()
         payload = response.json()
-        items = payload.get("items", [])
-        LOGGER.info("Fetched %d repositories from GitHub", len(items))
-        return [self._normalize(item) for item in items]
+        etag = response.headers.get("ETag")
+        if etag:
+            self._cache.put(page, etag, payload)
+        return payload
 
     @staticmethod
     def _normalize(item: Dict[str, Any]) -> Dict[str, Any]:
@@ -3,38 +3,92 @@ from __future__ import annotations
 
 import logging
 from datetime import datetime, timedelta, timezone
-from typing import List
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, List
 
-import requests
+import numpy as np
 
+from .bars import BarSeries
+from .candle_store import CandleStore, candles_from_klines, interval_ms
 from .config import CONFIG
 
+if TYPE_CHECKING:  # requests is only imported once something is downloaded
+    import requests
+
+    from .downloader import KlineDownloader
+
 LOGGER = logging.getLogger(__name__)
 
 
 class HistoricalDataClient:
-    """Download historical OHLC data from Binance."""
+    """Download historical OHLC data from Binance.
+
+    When a ``CandleStore`` is configured only candles newer than the last
+    stored open time are requested, and callers receive zero-copy views of the
+    memory-mapped store.
+    """
 
     BASE_URL = "https://api.binance.com/api/v3/klines"
 
-    def __init__(self, session: requests.Session | None = None) -> None:
-        self._session = session or requests.Session()
+    def __init__(
+        self,
+        session: requests.Session | None = None,
+        store: CandleStore | None = None,
+        base_url: str | None = None,
+    ) -> None:
+        self._session = session
+        self._base_url = base_url or self.BASE_URL
+        self._downloader: KlineDownloader | None = None
+        store_dir = CONFIG.data.store_dir
+        self._store = store if store is not None else (CandleStore(Path(store_dir)) if store_dir else None)
+
+    def fetch_daily_close(self) -> np.ndarray:
+        closes = self.fetch_candles()["close"]
+        LOGGER.info("Loaded %d daily candles", len(closes))
+        return closes
 
-    def fetch_daily_close(self) -> List[float]:
+    def fetch_bars(self, symbol: str | None = None, interval: str | None = None) -> BarSeries:
+        """Return the configured lookback window as a columnar ``BarSeries``."""
+        return BarSeries.from_candles(self.fetch_candles(symbol, interval))
+
+    def fetch_candles(self, symbol: str | None = None, interval: str | None = None) -> np.ndarray:
+        """Return the configured lookback window of candles as a structured array."""
         cfg = CONFIG.data
+        symbol = symbol or cfg.symbol
+        interval = interval or cfg.interval
         end = datetime.now(tz=timezone.utc)
         start = end - timedelta(days=cfg.lookback_years * 365)
-        params = {
-            "symbol": cfg.symbol,
-            "interval": cfg.interval,
-            "startTime": int(start.timestamp() * 1000),
-            "endTime": int(end.timestamp() * 1000),
-            "limit": 1000,
-        }
-        LOGGER.info("Requesting historical data: %s", params)
-        response = self._session.get(self.BASE_URL, params=params, timeout=30)
-        response.raise_for_status()
-        data = response.json()
-        closes = [float(entry[4]) for entry in data]
-        LOGGER.info("Fetched %d daily candles", len(closes))
-        return closes
+        # Bounds snap to the bar grid so repeated runs within a bar issue identical, cacheable requests.
+        step = interval_ms(interval)
+        start_ms = int(start.timestamp() * 1000) // step * step
+        end_ms = int(end.timestamp() * 1000) // step * step + step - 1
+        if self._store is None:
+            return self.download(symbol, interval, start_ms, end_ms)
+        last = self._store.last_open_time(symbol, interval)
+        since = start_ms if last is None else max(start_ms, last + 1)
+        # Only closed candles are persisted; the still-forming bar is fetched again next run.
+        fresh = self.download(symbol, interval, since, end_ms, closed_only=True)
+        self._store.append(symbol, interval, fresh)
+        stored = self._store.load(symbol, interval)
+        first = int(np.searchsorted(stored["open_time"], start_ms))
+        return stored[first:]
+
+    def download(
+        self,
+        symbol: str,
+        interval: str,
+        start_ms: int,
+        end_ms: int,
+        closed_only: bool = False,
+    ) -> np.ndarray:
+        """Request candles in ``[start_ms, end_ms]`` page by page from the klines endpoint."""
+        if self._downloader is None:
+            from .downloader import KlineDownloader
+
+            self._downloader = KlineDownloader(self._base_url, session=self._session)
+        rows: List[List[Any]] = self._downloader.download(symbol, interval, start_ms, end_ms)
+        if closed_only:
+            now_ms = int(datetime.now(tz=timezone.utc).timestamp() * 1000)
+            rows = [row for row in rows if int(row[6]) < now_ms]
+        LOGGER.info("Fetched %d candles", len(rows))
+        return candles_from_klines(rows)
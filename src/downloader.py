@@ -0,0 +1,158 @@
+"""Paginated, concurrent Binance kline downloader."""
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, List, Tuple
+
+import requests
+
+from .candle_store import INTERVAL_MS, interval_ms  # noqa: F401 - re-exported for callers
+from .config import CONFIG
+from .http_client import build_session
+from .metrics import METRICS
+
+LOGGER = logging.getLogger(__name__)
+
+Window = Tuple[int, int]
+
+
+class WeightBudget:
+    """Track Binance request weight from ``X-MBX-USED-WEIGHT-1M`` response headers."""
+
+    HEADER = "X-MBX-USED-WEIGHT-1M"
+
+    def __init__(self, limit_per_minute: int) -> None:
+        self.limit_per_minute = limit_per_minute
+        self._used = 0
+        self._minute = self._current_minute()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _current_minute() -> int:
+        return int(time.time() // 60)
+
+    def acquire(self, weight: int) -> None:
+        """Block until ``weight`` can be spent without crossing the per-minute limit."""
+        while True:
+            with self._lock:
+                now = time.time()
+                minute = int(now // 60)
+                if minute != self._minute:
+                    self._minute = minute
+                    self._used = 0
+                if now >= self._blocked_until and self._used + weight <= self.limit_per_minute:
+                    self._used += weight
+                    return
+                wait = max(self._blocked_until, (minute + 1) * 60) - now
+            LOGGER.info("Request weight budget exhausted, sleeping %.1fs", wait)
+            time.sleep(max(wait, 0.05))
+
+    def observe(self, response: requests.Response) -> None:
+        """Synchronise with the server's view of used weight and back-off hints."""
+        with self._lock:
+            used = response.headers.get(self.HEADER)
+            if used is not None and self._current_minute() == self._minute:
+                self._used = max(self._used, int(used))
+            retry_after = response.headers.get("Retry-After")
+            if response.status_code in (418, 429) and retry_after:
+                self._blocked_until = max(self._blocked_until, time.time() + float(retry_after))
+
+
+class KlineDownloader:
+    """Split ``[start, end]`` into page windows and fetch them concurrently."""
+
+    PAGE_LIMIT = 1000
+    REQUEST_WEIGHT = 2
+
+    def __init__(
+        self,
+        base_url: str,
+        session: requests.Session | None = None,
+        max_workers: int | None = None,
+        max_retries: int | None = None,
+        weight_limit: int | None = None,
+        backoff_seconds: float = 0.5,
+    ) -> None:
+        cfg = CONFIG.data
+        self._base_url = base_url
+        self._max_workers = max_workers or cfg.max_concurrent_requests
+        self._max_retries = cfg.request_retries if max_retries is None else max_retries
+        self._backoff = backoff_seconds
+        self._budget = WeightBudget(weight_limit or cfg.weight_limit_per_minute)
+        if session is None:
+            self._session = build_session("binance_klines", self._max_workers)
+        else:
+            self._session = METRICS.instrument_session(session, "binance_klines")
+
+    def windows(self, interval: str, start_ms: int, end_ms: int) -> List[Window]:
+        """Return the pages covering ``[start_ms, end_ms]`` on a fixed grid of ``PAGE_LIMIT`` bars.
+
+        Pages are aligned to the epoch rather than to ``start_ms``, so an
+        incremental sync from a later start, or a rerun later in the same
+        page, requests the same URLs as a full download. Those hit the HTTP
+        cache and recorded replays.
+        """
+        span = interval_ms(interval) * self.PAGE_LIMIT
+        windows: List[Window] = []
+        cursor = start_ms // span * span
+        while cursor <= end_ms:
+            windows.append((cursor, cursor + span - 1))
+            cursor += span
+        return windows
+
+    def download(self, symbol: str, interval: str, start_ms: int, end_ms: int) -> List[List[Any]]:
+        """Return de-duplicated kline rows for ``[start_ms, end_ms]`` in open-time order."""
+        windows = self.windows(interval, start_ms, end_ms)
+        if not windows:
+            return []
+        LOGGER.info("Downloading %s %s klines in %d pages", symbol, interval, len(windows))
+        if len(windows) == 1:
+            pages = [self._fetch_page(symbol, interval, windows[0])]
+        else:
+            with ThreadPoolExecutor(max_workers=min(self._max_workers, len(windows))) as pool:
+                pages = list(pool.map(lambda window: self._fetch_page(symbol, interval, window), windows))
+        rows: List[List[Any]] = []
+        last_open = None
+        for page in pages:
+            for row in page:
+                open_time = int(row[0])
+                if open_time < start_ms or open_time > end_ms or (last_open is not None and open_time <= last_open):
+                    continue
+                rows.append(row)
+                last_open = open_time
+        return rows
+
+    def _fetch_page(self, symbol: str, interval: str, window: Window) -> List[List[Any]]:
+        params = {
+            "symbol": symbol,
+            "interval": interval,
+            "startTime": window[0],
+            "endTime": window[1],
+            "limit": self.PAGE_LIMIT,
+        }
+        for attempt in range(self._max_retries + 1):
+            self._budget.acquire(self.REQUEST_WEIGHT)
+            try:
+                response = self._session.get(self._base_url, params=params, timeout=30)
+                self._budget.observe(response)
+                if response.status_code in (418, 429) or response.status_code >= 500:
+                    raise requests.HTTPError(f"{response.status_code} from klines endpoint", response=response)
+                response.raise_for_status()
+                return response.json()
+            except requests.RequestException as exc:
+                if attempt == self._max_retries or not self._retryable(exc):
+                    raise
+                delay = self._backoff * 2**attempt
+                METRICS.increment("http_retries_total", client="binance_klines")
+                LOGGER.warning("Kline page %s failed (%s), retrying in %.1fs", window, exc, delay)
+                time.sleep(delay)
+        raise AssertionError("unreachable")
+
+    @staticmethod
+    def _retryable(exc: requests.RequestException) -> bool:
+        response = exc.response
+        return response is None or response.status_code in (418, 429) or response.status_code >= 500
@@ -2,13 +2,30 @@
 from __future__ import annotations
 
 import logging
-from dataclasses import dataclass
-from typing import Iterable, List
+import math
+import statistics
+import threading
+from contextlib import ExitStack
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Sequence, Tuple
+
+import numpy as np
 
 from .backtester import Backtester, BacktestResult
 from .config import CONFIG
 from .data import HistoricalDataClient
+from .indicators import fingerprint
+from .metrics import METRICS
 from .model_factory import ModelCandidate
+from .panel import Panel, PanelBacktest, load_panel
+from .resample import periods_per_year, resample
+from .result_cache import BacktestCache
+from .robustness import MonteCarlo, RobustnessResult
+from .strategies import Strategy
+from .sweep import SharedPrices, attach_prices
+from .walk_forward import WalkForward, WalkForwardWindow
+from .worker_pool import WorkerPool
 
 LOGGER = logging.getLogger(__name__)
 
@@ -18,34 +35,469 @@ class EvaluationOutcome:
     candidate: ModelCandidate
     result: BacktestResult
     eligible_for_live: bool
+    windows: List[WalkForwardWindow] = field(default_factory=list)
+    timeframes: Dict[str, BacktestResult] = field(default_factory=dict)
+    symbols: Dict[str, BacktestResult] = field(default_factory=dict)  # per-symbol results of a panel evaluation
+    robustness: RobustnessResult | None = None
+    screened_bars: int | None = None  # recent-window length that rejected it; None if fully evaluated
+    error: str | None = None  # why an isolated evaluation failed (timeout, crash, exception)
 
 
 class ModelEvaluator:
-    """Run backtests and apply selection criteria."""
+    """Run backtests and apply selection criteria.
+
+    With ``EvaluationConfig.timeframes`` set, the base interval candles are
+    resampled to each extra interval and every candidate is scored on all of
+    them; the base interval result stays the primary ``result``.
+
+    With ``ScreeningConfig`` enabled, candidates are first scored on their
+    most recent bars (signals still warm up on the full history) and those
+    far below the thresholds are rejected before any full-history,
+    walk-forward or robustness work is spent on them.
+
+    With ``PanelConfig.symbols`` set, ``load_closes`` returns a ``Panel`` of
+    those symbols and ``evaluate``/``evaluate_on`` hand it to
+    ``evaluate_panel``, which scores candidates on every symbol in one batched
+    pass; the equal-weight portfolio is the primary ``result``. Panel mode
+    applies only the thresholds and the symbol pass rate: the result cache,
+    walk-forward, robustness, extra timeframes, screening and worker
+    processes are bypassed, with a warning when any of them is enabled.
 
-    def __init__(self, data_client: HistoricalDataClient | None = None, backtester: Backtester | None = None) -> None:
+    With ``ExecutionConfig.evaluation_processes`` set, every candidate runs in
+    a warm worker process that reads the closes from shared memory and is
+    killed if it exceeds the per-candidate timeout or memory cap; such
+    candidates come back ineligible with ``error`` set.
+    """
+
+    def __init__(
+        self,
+        data_client: HistoricalDataClient | None = None,
+        backtester: Backtester | None = None,
+        walk_forward: WalkForward | None = None,
+        cache: BacktestCache | None = None,
+        robustness: MonteCarlo | None = None,
+    ) -> None:
+        cfg = CONFIG.evaluation
         self._data_client = data_client or HistoricalDataClient()
-        self._backtester = backtester or Backtester()
+        self._backtester = backtester or Backtester(periods_per_year=periods_per_year(CONFIG.data.interval))
+        if cache is None and cfg.result_cache_path:
+            cache = BacktestCache(
+                Path(cfg.result_cache_path),
+                max_entries=cfg.result_cache_max_entries,
+                max_age_days=cfg.result_cache_max_age_days,
+            )
+        self._cache = cache
+        if walk_forward is None and CONFIG.walk_forward.enabled:
+            walk_forward = WalkForward(self._backtester)
+        self._walk_forward = walk_forward
+        if robustness is None and CONFIG.robustness.enabled:
+            robustness = MonteCarlo(self._backtester)
+        self._robustness = robustness
+        self._pool: WorkerPool | None = None
+        self._pool_lock = threading.Lock()
 
     def evaluate(self, candidates: Iterable[ModelCandidate]) -> List[EvaluationOutcome]:
-        closes = self._data_client.fetch_daily_close()
+        candidates = list(candidates)
+        if not candidates:
+            return []
+        return self.evaluate_on(candidates, self.load_closes())
+
+    def load_closes(self) -> Sequence[float] | Dict[str, np.ndarray] | Panel:
+        """Fetch the closes every candidate is evaluated against.
+
+        When extra timeframes are configured this returns a mapping from
+        interval to closes, base interval first, all derived from one download.
+        With panel symbols configured it returns their aligned ``Panel``.
+        """
+        cfg = CONFIG.evaluation
+        with METRICS.span("stage_seconds", stage="data_fetch"):
+            if CONFIG.panel.symbols:
+                return load_panel(CONFIG.panel.symbols, CONFIG.data.interval, self._data_client)
+            if not cfg.timeframes:
+                return self._data_client.fetch_daily_close()
+            candles = self._data_client.fetch_candles()
+        base = CONFIG.data.interval
+        frames: Dict[str, np.ndarray] = {base: candles["close"]}
+        with METRICS.span("stage_seconds", stage="resample"):
+            for interval in cfg.timeframes:
+                if interval not in frames:
+                    frames[interval] = resample(candles, base, interval, drop_partial=True)["close"]
+        return frames
+
+    def evaluate_on(
+        self,
+        candidates: Sequence[ModelCandidate],
+        closes: Sequence[float] | Mapping[str, Sequence[float]] | Panel,
+    ) -> List[EvaluationOutcome]:
+        """Evaluate candidates against already loaded closes (or closes per timeframe, or a panel).
+
+        Outcomes are returned in candidate order, including screened-out ones.
+        """
+        if not candidates:
+            return []
+        if isinstance(closes, Panel):
+            return self.evaluate_panel(candidates, closes)
+        if not CONFIG.execution.evaluation_processes:
+            return self._evaluate_local(candidates, closes)
+        outcomes: List[EvaluationOutcome | None] = [None] * len(candidates)
+        for index, outcome in self.iter_outcomes(candidates, closes):
+            outcomes[index] = outcome
+        return outcomes  # type: ignore[return-value]
+
+    def evaluate_panel(
+        self,
+        candidates: Sequence[ModelCandidate],
+        panel: Panel | None = None,
+    ) -> List[EvaluationOutcome]:
+        """Evaluate candidates on every symbol of a panel at once.
+
+        A candidate is eligible when its portfolio meets the thresholds and so
+        do the results of at least ``PanelConfig.min_symbol_pass_rate`` of the
+        symbols. No other gate applies; enabled ones are logged as bypassed.
+        """
+        if not candidates:
+            return []
+        bypassed = self._panel_bypassed()
+        if bypassed:
+            LOGGER.warning("Panel evaluation ignores the enabled %s settings", ", ".join(bypassed))
+        if panel is None:
+            with METRICS.span("stage_seconds", stage="data_fetch"):
+                panel = load_panel(CONFIG.panel.symbols, CONFIG.data.interval, self._data_client)
+        with METRICS.span("stage_seconds", stage="panel_backtest"):
+            results = PanelBacktest(self._backtester).run_many([candidate.strategy for candidate in candidates], panel)
         outcomes: List[EvaluationOutcome] = []
-        for candidate in candidates:
-            result = self._backtester.run(candidate.strategy, closes)
-            eligible = self._passes_thresholds(result)
-            outcomes.append(EvaluationOutcome(candidate, result, eligible))
+        for candidate, result in zip(candidates, results):
+            eligible = self._meets_thresholds(result.portfolio) and self._passes_symbols(result.symbols)
+            outcomes.append(EvaluationOutcome(candidate, result.portfolio, eligible, symbols=result.symbols))
         return outcomes
 
+    def _panel_bypassed(self) -> List[str]:
+        """Name the enabled settings that ``evaluate_panel`` does not apply."""
+        enabled = {
+            "result cache": self._cache is not None,
+            "walk-forward": self._walk_forward is not None,
+            "robustness": self._robustness is not None,
+            "timeframes": bool(CONFIG.evaluation.timeframes),
+            "screening": CONFIG.screening.enabled,
+            "evaluation processes": bool(CONFIG.execution.evaluation_processes),
+        }
+        return [name for name, on in enabled.items() if on]
+
+    def iter_outcomes(
+        self,
+        candidates: Sequence[ModelCandidate],
+        closes: Sequence[float] | Mapping[str, Sequence[float]],
+    ) -> Iterator[Tuple[int, EvaluationOutcome]]:
+        """Yield ``(candidate index, outcome)`` pairs as soon as each candidate finishes."""
+        if not CONFIG.execution.evaluation_processes:
+            yield from enumerate(self._evaluate_local(candidates, closes))
+            return
+        frames: Mapping[str | None, Sequence[float]] = closes if isinstance(closes, Mapping) else {None: closes}
+        with self._pool_lock, ExitStack() as stack:
+            shared = {key: stack.enter_context(SharedPrices(prices)) for key, prices in frames.items()}
+            spec = {key: (block.name, block.length) for key, block in shared.items()}
+            tasks = [(candidate, spec) for candidate in candidates]
+            for index, ok, value in self._worker_pool().imap_unordered(_evaluate_candidate, tasks):
+                if not ok:
+                    METRICS.increment("candidate_failures_total")
+                    LOGGER.warning("Evaluation of %s failed: %s", candidates[index].metadata.get("full_name"), value)
+                    nan = float("nan")
+                    value = EvaluationOutcome(candidates[index], BacktestResult(nan, nan, nan, nan), False, error=value)
+                yield index, value
+
+    def close(self) -> None:
+        """Stop the evaluation worker processes, if any were started."""
+        with self._pool_lock:
+            if self._pool is not None:
+                self._pool.close()
+                self._pool = None
+
+    def _worker_pool(self) -> WorkerPool:
+        if self._pool is None:
+            cfg = CONFIG.execution
+            cache = self._cache
+            cache_spec = (cache.path, cache.max_entries, cache.max_age_seconds / 86_400) if cache else None
+            self._pool = WorkerPool(
+                cfg.evaluation_processes,
+                initializer=_init_evaluation_worker,
+                initargs=(self._backtester, self._walk_forward, self._robustness, cache_spec),
+                timeout=cfg.candidate_timeout_seconds,
+                memory_limit_mb=cfg.worker_memory_mb,
+                start_method=cfg.worker_start_method,
+            )
+        return self._pool
+
+    def _evaluate_local(
+        self,
+        candidates: Sequence[ModelCandidate],
+        closes: Sequence[float] | Mapping[str, Sequence[float]],
+    ) -> List[EvaluationOutcome]:
+        if not CONFIG.screening.enabled:
+            return self._evaluate_all(candidates, closes)
+        base_closes = closes[next(iter(closes))] if isinstance(closes, Mapping) else closes
+        survivors, rejected = self._screen(candidates, base_closes)
+        evaluated = iter(self._evaluate_all([candidates[index] for index in survivors], closes) if survivors else [])
+        return [rejected[index] if index in rejected else next(evaluated) for index in range(len(candidates))]
+
+    def _evaluate_all(
+        self,
+        candidates: Sequence[ModelCandidate],
+        closes: Sequence[float] | Mapping[str, Sequence[float]],
+    ) -> List[EvaluationOutcome]:
+        strategies = [candidate.strategy for candidate in candidates]
+        frames: Dict[str, List[BacktestResult]] = {}
+        if isinstance(closes, Mapping):
+            base, *_ = closes
+            for interval, prices in closes.items():
+                backtester = self._backtester
+                if interval != base:
+                    backtester = Backtester(self._backtester.risk_free_rate, periods_per_year(interval))
+                with METRICS.span("backtest_seconds", kind="batch", timeframe=interval):
+                    frames[interval] = self._run_many(backtester, strategies, prices)
+            closes = closes[base]
+            results = frames[base]
+        else:
+            with METRICS.span("backtest_seconds", kind="batch"):
+                results = self._run_many(self._backtester, strategies, closes)
+        METRICS.increment("backtests_total", len(strategies) * max(len(frames), 1))
+        outcomes: List[EvaluationOutcome] = []
+        for index, (candidate, result) in enumerate(zip(candidates, results)):
+            windows: List[WalkForwardWindow] = []
+            if self._walk_forward:
+                strategy_name = type(candidate.strategy).__name__
+                with METRICS.span("backtest_seconds", kind="walk_forward", strategy=strategy_name):
+                    windows = self._walk_forward.run(candidate.strategy, closes)
+            timeframes = {interval: frame[index] for interval, frame in frames.items()}
+            eligible = self._passes_thresholds(result, windows if self._walk_forward else None)
+            if eligible and timeframes:
+                eligible = self._passes_timeframes(timeframes)
+            outcomes.append(EvaluationOutcome(candidate, result, eligible, windows, timeframes))
+        if self._robustness:
+            self._apply_robustness(outcomes, closes)
+        return outcomes
+
+    def _screen(
+        self,
+        candidates: Sequence[ModelCandidate],
+        closes: Sequence[float],
+    ) -> Tuple[List[int], Dict[int, EvaluationOutcome]]:
+        """Successively score survivors on longer recent windows, returning survivor indices and rejections.
+
+        Signals are generated on the full history, so indicator warm-up never
+        falls inside the scored window; only its strategy returns count.
+        """
+        cfg = CONFIG.screening
+        prices = np.asarray(closes, dtype=np.float64)
+        alive = list(range(len(candidates)))
+        rejected: Dict[int, EvaluationOutcome] = {}
+        for bars in cfg.rungs:
+            if not alive or bars >= len(prices):
+                break
+            strategies = [candidates[index].strategy for index in alive]
+            with METRICS.span("backtest_seconds", kind="screening", bars=bars):
+                results = self._run_many(self._backtester, strategies, prices, tail=bars)
+            METRICS.increment("backtests_total", len(alive))
+            ranked = [(index, result) for index, result in zip(alive, results) if not self._far_below(result)]
+            if cfg.keep_fraction < 1.0:
+                ranked.sort(key=lambda pair: pair[1].sharpe_ratio, reverse=True)
+                ranked = ranked[: max(1, math.ceil(len(ranked) * cfg.keep_fraction))]
+            keep = {index for index, _ in ranked}
+            for index, result in zip(alive, results):
+                if index not in keep:
+                    rejected[index] = EvaluationOutcome(candidates[index], result, False, screened_bars=bars)
+            dropped = len(alive) - len(keep)
+            LOGGER.info(
+                "Screening on last %d bars rejected %d of %d candidates (%.0f%%)",
+                bars,
+                dropped,
+                len(alive),
+                100 * dropped / len(alive),
+            )
+            METRICS.increment("candidates_screened_total", len(alive), bars=bars)
+            METRICS.increment("candidates_rejected_total", dropped, bars=bars)
+            alive = sorted(keep)
+        return alive, rejected
+
     @staticmethod
-    def _passes_thresholds(result: BacktestResult) -> bool:
+    def _far_below(result: BacktestResult) -> bool:
+        thresholds = CONFIG.evaluation
+        cfg = CONFIG.screening
+        return (
+            result.sharpe_ratio < thresholds.min_sharpe_ratio - cfg.sharpe_margin
+            or result.annualized_return < thresholds.min_annual_return - cfg.return_margin
+            or result.max_drawdown > thresholds.max_drawdown + cfg.drawdown_margin
+        )
+
+    def _apply_robustness(self, outcomes: List[EvaluationOutcome], closes: Sequence[float]) -> None:
+        """Resample paths only for candidates that passed the point-estimate gates."""
+        survivors = [outcome for outcome in outcomes if outcome.eligible_for_live]
+        if not survivors:
+            return
+        with METRICS.span("backtest_seconds", kind="robustness"):
+            results = self._robustness.run_many([outcome.candidate.strategy for outcome in survivors], closes)
+        for outcome, robustness in zip(survivors, results):
+            outcome.robustness = robustness
+            outcome.eligible_for_live = self._passes_robustness(robustness)
+
+    def _run_many(
+        self,
+        backtester: Backtester,
+        strategies: Sequence[Strategy],
+        closes: Sequence[float],
+        tail: int | None = None,
+    ) -> List[BacktestResult]:
+        if self._cache is None:
+            return backtester.run_many(strategies, closes, tail)
+        data_fingerprint = fingerprint(np.asarray(closes, dtype=np.float64))
+        return self._cache.run_many(backtester, strategies, closes, data_fingerprint, tail)
+
+    @classmethod
+    def _passes_thresholds(
+        cls,
+        result: BacktestResult,
+        windows: Sequence[WalkForwardWindow] | None = None,
+    ) -> bool:
+        if not cls._meets_thresholds(result):
+            return False
+        if windows is None:
+            return True
+        return cls._passes_window_distribution(windows)
+
+    @staticmethod
+    def _meets_thresholds(result: BacktestResult, log: bool = True) -> bool:
         cfg = CONFIG.evaluation
         if result.annualized_return < cfg.min_annual_return:
-            LOGGER.info("Annualized return %.2f below threshold %.2f", result.annualized_return, cfg.min_annual_return)
+            if log:
+                LOGGER.info(
+                    "Annualized return %.2f below threshold %.2f", result.annualized_return, cfg.min_annual_return
+                )
             return False
         if result.sharpe_ratio < cfg.min_sharpe_ratio:
-            LOGGER.info("Sharpe %.2f below threshold %.2f", result.sharpe_ratio, cfg.min_sharpe_ratio)
+            if log:
+                LOGGER.info("Sharpe %.2f below threshold %.2f", result.sharpe_ratio, cfg.min_sharpe_ratio)
             return False
         if result.max_drawdown > cfg.max_drawdown:
-            LOGGER.info("Drawdown %.2f above threshold %.2f", result.max_drawdown, cfg.max_drawdown)
+            if log:
+                LOGGER.info("Drawdown %.2f above threshold %.2f", result.max_drawdown, cfg.max_drawdown)
+            return False
+        return True
+
+    @staticmethod
+    def _passes_robustness(robustness: RobustnessResult) -> bool:
+        cfg = CONFIG.robustness
+        if robustness.sharpe_low < cfg.min_sharpe_ratio:
+            LOGGER.info(
+                "P%g bootstrap Sharpe %.2f below threshold %.2f",
+                cfg.percentile,
+                robustness.sharpe_low,
+                cfg.min_sharpe_ratio,
+            )
+            return False
+        if robustness.annual_return_low < cfg.min_annual_return:
+            LOGGER.info(
+                "P%g bootstrap annual return %.2f below threshold %.2f",
+                cfg.percentile,
+                robustness.annual_return_low,
+                cfg.min_annual_return,
+            )
+            return False
+        if robustness.drawdown_high > cfg.max_drawdown:
+            LOGGER.info(
+                "P%g bootstrap drawdown %.2f above threshold %.2f",
+                100 - cfg.percentile,
+                robustness.drawdown_high,
+                cfg.max_drawdown,
+            )
+            return False
+        return True
+
+    @classmethod
+    def _passes_timeframes(cls, timeframes: Mapping[str, BacktestResult]) -> bool:
+        cfg = CONFIG.evaluation
+        passed = [interval for interval, result in timeframes.items() if cls._meets_thresholds(result, log=False)]
+        pass_rate = len(passed) / len(timeframes)
+        if pass_rate < cfg.min_timeframe_pass_rate:
+            LOGGER.info(
+                "Passed on %s of %d timeframes, rate %.2f below threshold %.2f",
+                ",".join(passed) or "none",
+                len(timeframes),
+                pass_rate,
+                cfg.min_timeframe_pass_rate,
+            )
+            return False
+        return True
+
+    @classmethod
+    def _passes_symbols(cls, symbols: Mapping[str, BacktestResult]) -> bool:
+        cfg = CONFIG.panel
+        passed = sum(cls._meets_thresholds(result, log=False) for result in symbols.values())
+        pass_rate = passed / len(symbols)
+        if pass_rate < cfg.min_symbol_pass_rate:
+            LOGGER.info(
+                "Passed on %d of %d symbols, rate %.2f below threshold %.2f",
+                passed,
+                len(symbols),
+                pass_rate,
+                cfg.min_symbol_pass_rate,
+            )
+            return False
+        return True
+
+    @classmethod
+    def _passes_window_distribution(cls, windows: Sequence[WalkForwardWindow]) -> bool:
+        cfg = CONFIG.walk_forward
+        if not windows:
+            LOGGER.info("No walk-forward windows available")
+            return False
+        passed = sum(cls._meets_thresholds(window.test, log=False) for window in windows)
+        pass_rate = passed / len(windows)
+        if pass_rate < cfg.min_pass_rate:
+            LOGGER.info("Walk-forward pass rate %.2f below threshold %.2f", pass_rate, cfg.min_pass_rate)
+            return False
+        median_sharpe = statistics.median(window.test.sharpe_ratio for window in windows)
+        if median_sharpe < cfg.min_median_sharpe:
+            LOGGER.info("Median window Sharpe %.2f below threshold %.2f", median_sharpe, cfg.min_median_sharpe)
             return False
         return True
+
+
+_WORKER_STATE: Dict[str, Any] = {}
+
+
+def _init_evaluation_worker(
+    backtester: Backtester,
+    walk_forward: WalkForward | None,
+    robustness: MonteCarlo | None,
+    cache_spec: Tuple[Path, int, float] | None,
+) -> None:
+    cache = BacktestCache(Path(cache_spec[0]), cache_spec[1], cache_spec[2]) if cache_spec else None
+    _WORKER_STATE["evaluator"] = ModelEvaluator(
+        backtester=backtester,
+        walk_forward=walk_forward,
+        cache=cache,
+        robustness=robustness,
+    )
+    _WORKER_STATE["frames"] = {}
+
+
+def _evaluate_candidate(
+    candidate: ModelCandidate,
+    spec: Mapping[str | None, Tuple[str, int]],
+) -> EvaluationOutcome:
+    attached = _WORKER_STATE["frames"]
+    wanted = {name for name, _ in spec.values()}
+    # Detach blocks of previous batches; the parent has already unlinked them.
+    for name in [name for name in attached if name not in wanted]:
+        shm, prices = attached.pop(name)
+        del prices
+        try:
+            shm.close()
+        except BufferError:
+            LOGGER.debug("Shared block %s still referenced, leaving it mapped", name)
+    frames: Dict[str | None, np.ndarray] = {}
+    for key, (name, length) in spec.items():
+        if name not in attached:
+            attached[name] = attach_prices(name, length)
+        frames[key] = attached[name][1]
+    closes = frames[None] if None in frames else frames
+    return _WORKER_STATE["evaluator"]._evaluate_local([candidate], closes)[0]
@@ -0,0 +1,259 @@
+"""Shared HTTP sessions with connection pooling and an on-disk response cache."""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Mapping
+from urllib.parse import parse_qsl, urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from .config import CONFIG, HttpConfig
+from .metrics import METRICS
+
+LOGGER = logging.getLogger(__name__)
+
+MODES = ("live", "record", "replay")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    url TEXT NOT NULL,
+    status INTEGER NOT NULL,
+    headers TEXT NOT NULL,
+    body BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    stored_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_responses_accessed ON responses(accessed_at);
+"""
+
+# Per-request bookkeeping that must never be replayed from the cache.
+_VOLATILE_HEADERS = (
+    "content-encoding",
+    "content-length",
+    "transfer-encoding",
+    "connection",
+    "date",
+    "retry-after",
+    "x-ratelimit-limit",
+    "x-ratelimit-remaining",
+    "x-ratelimit-reset",
+    "x-ratelimit-used",
+    "x-mbx-used-weight",
+    "x-mbx-used-weight-1m",
+)
+
+
+class ReplayMiss(LookupError):
+    """Raised in replay mode when a request has no recorded response."""
+
+
+class ResponseCache:
+    """Store GET responses in SQLite with LRU eviction bounded by total body size."""
+
+    def __init__(self, path: Path, max_bytes: int) -> None:
+        self.path = path
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+        self._size = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+    @staticmethod
+    def key(url: str) -> str:
+        return hashlib.sha256(url.encode()).hexdigest()
+
+    def get(self, key: str) -> Dict[str, Any] | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT status, headers, body, stored_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            with self._conn:
+                self._conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (time.time(), key))
+        status, headers, body, stored_at = row
+        return {"status": status, "headers": json.loads(headers), "body": body, "stored_at": stored_at}
+
+    def put(self, key: str, url: str, status: int, headers: Mapping[str, str], body: bytes) -> None:
+        stored = {name: value for name, value in headers.items() if name.lower() not in _VOLATILE_HEADERS}
+        now = time.time()
+        with self._lock, self._conn:
+            previous = self._conn.execute("SELECT size FROM responses WHERE key = ?", (key,)).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, url, status, json.dumps(stored), body, len(body), now, now),
+            )
+            self._size += len(body) - (previous[0] if previous else 0)
+            self._evict()
+
+    def touch(self, key: str, headers: Mapping[str, str]) -> None:
+        """Mark an entry as freshly revalidated, merging headers from the 304."""
+        with self._lock, self._conn:
+            row = self._conn.execute("SELECT headers FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return
+            merged = json.loads(row[0])
+            merged.update({name: value for name, value in headers.items() if name.lower() not in _VOLATILE_HEADERS})
+            now = time.time()
+            self._conn.execute(
+                "UPDATE responses SET headers = ?, stored_at = ?, accessed_at = ? WHERE key = ?",
+                (json.dumps(merged), now, now, key),
+            )
+
+    def _evict(self) -> None:
+        while self._size > self.max_bytes:
+            rows = self._conn.execute(
+                "SELECT key, size FROM responses ORDER BY accessed_at LIMIT 64"
+            ).fetchall()
+            if not rows:
+                return
+            for key, size in rows:
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._size -= size
+                METRICS.increment("http_cache_total", result="evicted")
+                if self._size <= self.max_bytes:
+                    return
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class CachingAdapter(HTTPAdapter):
+    """Transport adapter that answers GETs from a ``ResponseCache``.
+
+    ``live`` serves entries younger than the TTL, revalidates older ones with
+    ``If-None-Match``/``If-Modified-Since`` and stores successful responses.
+    ``record`` always goes to the network and stores every success, and
+    ``replay`` never touches the network, raising ``ReplayMiss`` instead.
+    Only unsigned GETs are cached; signed Binance requests (orders and their
+    lookups) always pass straight through.
+    """
+
+    def __init__(
+        self,
+        cache: ResponseCache,
+        client: str,
+        mode: str = "live",
+        ttl_seconds: float = 900.0,
+        **kwargs: Any,
+    ) -> None:
+        if mode not in MODES:
+            raise ValueError(f"Unknown HTTP cache mode {mode!r}, expected one of {MODES}")
+        super().__init__(**kwargs)
+        self.cache = cache
+        self.client = client
+        self.mode = mode
+        self.ttl_seconds = ttl_seconds
+
+    def send(self, request: requests.PreparedRequest, **kwargs: Any) -> requests.Response:
+        if request.method != "GET" or _is_signed(request):
+            if self.mode == "replay":
+                raise ReplayMiss(f"{request.method} {request.url} is not replayable")
+            return super().send(request, **kwargs)
+        key = self.cache.key(request.url)
+        entry = self.cache.get(key)
+        if self.mode == "replay":
+            if entry is None:
+                raise ReplayMiss(f"No recorded response for {request.url}")
+            return self._hit(request, entry, "replayed")
+        if self.mode == "live" and entry is not None and time.time() - entry["stored_at"] < self.ttl_seconds:
+            return self._hit(request, entry, "hit")
+        if self.mode == "live" and entry is not None:
+            etag = entry["headers"].get("ETag")
+            last_modified = entry["headers"].get("Last-Modified")
+            if etag and "If-None-Match" not in request.headers:
+                request.headers["If-None-Match"] = etag
+            if last_modified and "If-Modified-Since" not in request.headers:
+                request.headers["If-Modified-Since"] = last_modified
+        response = super().send(request, **kwargs)
+        if response.status_code == 304 and entry is not None and self._validates(request, entry):
+            self.cache.touch(key, response.headers)
+            cached = self._hit(request, entry, "revalidated")
+            cached.headers.update(response.headers)
+            cached.headers["Content-Length"] = str(len(entry["body"]))
+            return cached
+        if response.status_code == 200 and "no-store" not in response.headers.get("Cache-Control", ""):
+            self.cache.put(key, request.url, response.status_code, response.headers, response.content)
+        METRICS.increment("http_cache_total", client=self.client, result="miss")
+        return response
+
+    @staticmethod
+    def _validates(request: requests.PreparedRequest, entry: Dict[str, Any]) -> bool:
+        """Whether a 304 refers to our stored copy rather than the caller's own."""
+        headers = entry["headers"]
+        sent_etag = request.headers.get("If-None-Match")
+        if sent_etag is not None:
+            return sent_etag == headers.get("ETag")
+        return request.headers.get("If-Modified-Since") == headers.get("Last-Modified")
+
+    def _hit(self, request: requests.PreparedRequest, entry: Dict[str, Any], result: str) -> requests.Response:
+        METRICS.increment("http_cache_total", client=self.client, result=result)
+        response = requests.Response()
+        response.status_code = entry["status"]
+        response.reason = "OK"
+        response.headers = CaseInsensitiveDict(entry["headers"])
+        response.headers["Content-Length"] = str(len(entry["body"]))
+        response.headers["X-Cache"] = result.upper()
+        response._content = entry["body"]
+        response._content_consumed = True
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        return response
+
+
+def _is_signed(request: requests.PreparedRequest) -> bool:
+    query = urlsplit(request.url or "").query
+    return any(name == "signature" for name, _ in parse_qsl(query))
+
+
+_CACHES: Dict[Path, ResponseCache] = {}
+_CACHES_LOCK = threading.Lock()
+
+
+def shared_cache(path: Path, max_bytes: int) -> ResponseCache:
+    """Return one ``ResponseCache`` per file so every client shares it."""
+    with _CACHES_LOCK:
+        cache = _CACHES.get(path)
+        if cache is None:
+            cache = _CACHES[path] = ResponseCache(path, max_bytes)
+        return cache
+
+
+def build_session(client: str, pool_maxsize: int | None = None, config: HttpConfig | None = None) -> requests.Session:
+    """Create an instrumented session with pooled connections and, if configured, response caching.
+
+    Only use it for read-only clients; order placement keeps its own session.
+    """
+    cfg = config or CONFIG.http
+    if cfg.mode != "live" and not cfg.cache_path:
+        raise ValueError(f"HTTP mode {cfg.mode!r} needs HttpConfig.cache_path")
+    pool = {"pool_connections": cfg.pool_connections, "pool_maxsize": max(cfg.pool_maxsize, pool_maxsize or 0)}
+    if cfg.cache_path:
+        cache = shared_cache(Path(cfg.cache_path), int(cfg.cache_max_mb * 1024 * 1024))
+        adapter: HTTPAdapter = CachingAdapter(cache, client, cfg.mode, cfg.ttl_seconds, **pool)
+    else:
+        adapter = HTTPAdapter(**pool)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return METRICS.instrument_session(session, client)
@@ -0,0 +1,153 @@
+"""Vectorized indicator kernels shared across strategies.
+
+Every kernel is O(n) in the series length (cumulative sums instead of
+per-bar window slices) and results are memoized per
+(price-series fingerprint, indicator, parameters), so many strategy variants
+evaluated on the same closes share one computation.
+"""
+from __future__ import annotations
+
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, Sequence, Tuple
+
+import numpy as np
+
+LOGGER = logging.getLogger(__name__)
+
+Kernel = Callable[..., np.ndarray]
+
+
+def fingerprint(prices: np.ndarray) -> str:
+    """Return a stable content hash for a float64 price series."""
+    digest = hashlib.blake2b(np.ascontiguousarray(prices).tobytes(), digest_size=16)
+    return f"{prices.shape[-1]}:{digest.hexdigest()}"
+
+
+class IndicatorCache:
+    """Bounded LRU memo of computed indicator series, safe to share across threads.
+
+    Kernels run outside the lock, so two threads missing on the same key may
+    both compute it; the results are identical and the later one is kept.
+    """
+
+    def __init__(self, max_entries: int = 1024) -> None:
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Tuple[str, str, Tuple[Hashable, ...]], np.ndarray]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def get(self, prices: np.ndarray, name: str, params: Tuple[Hashable, ...], kernel: Kernel) -> np.ndarray:
+        key = (fingerprint(prices), name, params)
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                self.hits += 1
+                self._entries.move_to_end(key)
+                return cached
+            self.misses += 1
+        result = kernel(prices, *params)
+        result.flags.writeable = False
+        with self._lock:
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return result
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+CACHE = IndicatorCache()
+
+
+def as_array(prices: Sequence[float] | np.ndarray) -> np.ndarray:
+    """Return prices as a float64 array without copying when possible."""
+    return np.asarray(prices, dtype=np.float64)
+
+
+def _rolling_sum(values: np.ndarray, window: int) -> np.ndarray:
+    """Sum of ``values[i - window + 1 : i + 1]``; NaN until the window is full."""
+    out = np.full(values.shape, np.nan)
+    if window <= 0 or values.shape[-1] < window:
+        return out
+    # Centering keeps the running total small so differences stay precise.
+    offset = values[..., :1]
+    totals = np.cumsum(values - offset, axis=-1)
+    window_sums = totals[..., window - 1 :].copy()
+    window_sums[..., 1:] -= totals[..., :-window]
+    out[..., window - 1 :] = window_sums + offset * window
+    return out
+
+
+def _sma(prices: np.ndarray, window: int) -> np.ndarray:
+    return _rolling_sum(prices, window) / window
+
+
+def _ema(prices: np.ndarray, span: int) -> np.ndarray:
+    out = np.full(prices.shape, np.nan)
+    if prices.shape[-1] == 0:
+        return out
+    alpha = 2.0 / (span + 1)
+    out[..., 0] = prices[..., 0]
+    for idx in range(1, prices.shape[-1]):
+        out[..., idx] = alpha * prices[..., idx] + (1 - alpha) * out[..., idx - 1]
+    return out
+
+
+def _rolling_return(prices: np.ndarray, lookback: int) -> np.ndarray:
+    out = np.full(prices.shape, np.nan)
+    if lookback == 0:
+        # Every bar's return over itself; only a zero price leaves it undefined.
+        np.divide(prices - prices, prices, out=out, where=prices != 0)
+        return out
+    if lookback < 0 or prices.shape[-1] <= lookback:
+        return out
+    start = prices[..., :-lookback]
+    np.divide(prices[..., lookback:] - start, start, out=out[..., lookback:], where=start != 0)
+    return out
+
+
+def _rolling_std(prices: np.ndarray, window: int) -> np.ndarray:
+    if window < 2:
+        return np.full(prices.shape, np.nan)
+    centered = prices - prices[..., :1]
+    sums = _rolling_sum(centered, window)
+    squares = _rolling_sum(centered * centered, window)
+    variance = (squares - sums * sums / window) / (window - 1)
+    return np.sqrt(np.maximum(variance, 0.0))
+
+
+def sma(prices: np.ndarray, window: int, cache: IndicatorCache | None = None) -> np.ndarray:
+    """Simple moving average of the ``window`` bars ending at each index."""
+    return (CACHE if cache is None else cache).get(prices, "sma", (window,), _sma)
+
+
+def ema(prices: np.ndarray, span: int, cache: IndicatorCache | None = None) -> np.ndarray:
+    """Exponential moving average seeded with the first price."""
+    return (CACHE if cache is None else cache).get(prices, "ema", (span,), _ema)
+
+
+def rolling_return(prices: np.ndarray, lookback: int, cache: IndicatorCache | None = None) -> np.ndarray:
+    """Return over the previous ``lookback`` bars; NaN when undefined."""
+    return (CACHE if cache is None else cache).get(prices, "rolling_return", (lookback,), _rolling_return)
+
+
+def rolling_std(prices: np.ndarray, window: int, cache: IndicatorCache | None = None) -> np.ndarray:
+    """Sample standard deviation of the ``window`` bars ending at each index."""
+    return (CACHE if cache is None else cache).get(prices, "rolling_std", (window,), _rolling_std)
@@ -0,0 +1,91 @@
+"""Advance many strategies bar by bar from a live or replayed kline feed."""
+from __future__ import annotations
+
+import dataclasses
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Dict, Iterator, Tuple, Type
+
+from .strategies import HoldStrategy, MomentumStrategy, SmaCrossStrategy, Strategy
+
+LOGGER = logging.getLogger(__name__)
+
+STRATEGY_TYPES: Dict[str, Type[Strategy]] = {
+    cls.__name__: cls for cls in (SmaCrossStrategy, MomentumStrategy, HoldStrategy)
+}
+
+
+def iter_kline_closes(path: Path) -> Iterator[Tuple[int, float]]:
+    """Yield ``(open_time, close)`` for each closed kline in a JSON-lines file.
+
+    Lines may be REST kline rows or websocket kline events; events for bars
+    that are still forming (``"x": false``) are skipped.
+    """
+    with path.open(encoding="utf-8") as handle:
+        for line in handle:
+            line = line.strip()
+            if not line:
+                continue
+            record = json.loads(line)
+            if isinstance(record, list):
+                yield int(record[0]), float(record[4])
+                continue
+            kline = record.get("k", record)
+            if kline.get("x", True):
+                yield int(kline["t"]), float(kline["c"])
+
+
+class StrategyBook:
+    """Keep incremental state for many strategies and advance them together."""
+
+    def __init__(self, strategies: Dict[str, Strategy], last_open_time: int | None = None) -> None:
+        self.strategies = strategies
+        self.last_open_time = last_open_time
+        self.signals: Dict[str, int] = {}
+
+    def on_bar(self, open_time: int, close: float) -> Dict[str, int]:
+        """Advance every strategy by one closed bar; replays of old bars are ignored."""
+        if self.last_open_time is not None and open_time <= self.last_open_time:
+            return self.signals
+        self.signals = {key: strategy.update(close) for key, strategy in self.strategies.items()}
+        self.last_open_time = open_time
+        return self.signals
+
+    def replay(self, path: Path) -> Dict[str, int]:
+        """Feed every closed bar of a recorded kline file and return the latest signals."""
+        bars = 0
+        for open_time, close in iter_kline_closes(path):
+            self.on_bar(open_time, close)
+            bars += 1
+        LOGGER.info("Replayed %d bars into %d strategies", bars, len(self.strategies))
+        return self.signals
+
+    def checkpoint(self, path: Path) -> None:
+        """Atomically write parameters and incremental state of every strategy."""
+        payload = {
+            "last_open_time": self.last_open_time,
+            "strategies": {
+                key: {
+                    "type": type(strategy).__name__,
+                    "params": dataclasses.asdict(strategy) if dataclasses.is_dataclass(strategy) else {},
+                    "state": strategy.get_state(),
+                }
+                for key, strategy in self.strategies.items()
+            },
+        }
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(path.suffix + ".tmp")
+        tmp.write_text(json.dumps(payload), encoding="utf-8")
+        os.replace(tmp, path)
+
+    @classmethod
+    def restore(cls, path: Path) -> "StrategyBook":
+        payload = json.loads(path.read_text(encoding="utf-8"))
+        strategies: Dict[str, Strategy] = {}
+        for key, entry in payload["strategies"].items():
+            strategy = STRATEGY_TYPES[entry["type"]](**entry["params"])
+            strategy.set_state(entry["state"])
+            strategies[key] = strategy
+        return cls(strategies, payload.get("last_open_time"))
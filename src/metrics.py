@@ -0,0 +1,211 @@
+"""Lightweight timing spans, counters and per-run metrics export.
+
+``METRICS`` is a process-wide registry. When disabled every call returns
+immediately (``span`` hands back a shared no-op context manager), so the
+instrumentation left in hot paths costs next to nothing. Timers and counters
+accumulate for the life of the process, so exported counters stay monotonic
+across runs as Prometheus expects.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Tuple
+
+from .config import CONFIG
+
+LOGGER = logging.getLogger(__name__)
+
+LabelKey = Tuple[str, Tuple[Tuple[str, str], ...]]
+# Timers and counters recorded since the last ``Metrics.drain``.
+MetricsDelta = Tuple[Dict[LabelKey, "TimerStats"], Dict[LabelKey, float]]
+
+
+def _key(name: str, labels: Dict[str, Any]) -> LabelKey:
+    return name, tuple(sorted((label, str(value)) for label, value in labels.items()))
+
+
+@dataclass
+class TimerStats:
+    count: int = 0
+    total: float = 0.0
+    max: float = 0.0
+
+    def add(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+
+class _NoopSpan:
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        return None
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+class _Span:
+    __slots__ = ("_metrics", "_key", "_start")
+
+    def __init__(self, metrics: "Metrics", key: LabelKey) -> None:
+        self._metrics = metrics
+        self._key = key
+        self._start = 0.0
+
+    def __enter__(self) -> "_Span":
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type: Any, *exc: Any) -> None:
+        name, labels = self._key
+        if exc_type is not None:
+            labels = labels + (("error", exc_type.__name__),)
+        self._metrics._record((name, labels), time.perf_counter() - self._start)
+
+
+class Metrics:
+    """Registry of timing spans and counters for one process."""
+
+    def __init__(self, enabled: bool = False) -> None:
+        self.enabled = enabled
+        self._timers: Dict[LabelKey, TimerStats] = {}
+        self._counters: Dict[LabelKey, float] = {}
+        self._lock = threading.Lock()
+
+    def span(self, name: str, **labels: Any) -> Any:
+        """Time the enclosed block as ``name`` (seconds)."""
+        if not self.enabled:
+            return _NOOP_SPAN
+        return _Span(self, _key(name, labels))
+
+    def observe(self, name: str, seconds: float, **labels: Any) -> None:
+        if self.enabled:
+            self._record(_key(name, labels), seconds)
+
+    def increment(self, name: str, value: float = 1, **labels: Any) -> None:
+        if not self.enabled:
+            return
+        key = _key(name, labels)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def instrument_session(self, session: Any, client: str) -> Any:
+        """Record latency and status of every response made through a ``requests`` session."""
+        if not self.enabled:
+            return session
+
+        def hook(response: Any, *args: Any, **kwargs: Any) -> None:
+            labels = {"client": client, "status": f"{response.status_code // 100}xx"}
+            self._record(_key("http_request_seconds", labels), response.elapsed.total_seconds())
+
+        session.hooks["response"].append(hook)
+        return session
+
+    def _record(self, key: LabelKey, seconds: float) -> None:
+        with self._lock:
+            stats = self._timers.get(key)
+            if stats is None:
+                stats = self._timers[key] = TimerStats()
+            stats.add(seconds)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._timers.clear()
+            self._counters.clear()
+
+    def drain(self) -> MetricsDelta:
+        """Return and clear everything recorded so far, e.g. to ship a worker's metrics to its parent."""
+        with self._lock:
+            delta = (self._timers, self._counters)
+            self._timers, self._counters = {}, {}
+        return delta
+
+    def merge(self, delta: MetricsDelta) -> None:
+        """Add timers and counters drained in another process."""
+        timers, counters = delta
+        if not self.enabled or not (timers or counters):
+            return
+        with self._lock:
+            for key, stats in timers.items():
+                own = self._timers.get(key)
+                if own is None:
+                    own = self._timers[key] = TimerStats()
+                own.count += stats.count
+                own.total += stats.total
+                own.max = max(own.max, stats.max)
+            for key, value in counters.items():
+                self._counters[key] = self._counters.get(key, 0) + value
+
+    def summary(self) -> Dict[str, Any]:
+        """Return a JSON-serialisable snapshot of every timer and counter."""
+        with self._lock:
+            timers = [
+                {"name": name, "labels": dict(labels), "count": s.count, "sum": s.total, "max": s.max}
+                for (name, labels), s in sorted(self._timers.items())
+            ]
+            counters = [
+                {"name": name, "labels": dict(labels), "value": value}
+                for (name, labels), value in sorted(self._counters.items())
+            ]
+        return {"timers": timers, "counters": counters}
+
+    def export_jsonl(self, path: Path, **fields: Any) -> None:
+        """Append the cumulative summary, tagged with ``fields``, as one JSON line."""
+        record = {"timestamp": time.time(), **fields, **self.summary()}
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("a", encoding="utf-8") as handle:
+            handle.write(json.dumps(record, sort_keys=True) + "\n")
+
+    def export_prometheus(self, path: Path) -> None:
+        """Atomically write a Prometheus textfile-collector file."""
+        lines = []
+        summary = self.summary()
+        for name in sorted({timer["name"] for timer in summary["timers"]}):
+            metric = f"pipeline_{name}"
+            timers = [timer for timer in summary["timers"] if timer["name"] == name]
+            lines.append(f"# TYPE {metric} summary")
+            for timer in timers:
+                labels = _format_labels(timer["labels"])
+                lines.append(f"{metric}_count{labels} {timer['count']}")
+                lines.append(f"{metric}_sum{labels} {timer['sum']:.6f}")
+            lines.append(f"# TYPE {metric}_max gauge")
+            lines.extend(f"{metric}_max{_format_labels(timer['labels'])} {timer['max']:.6f}" for timer in timers)
+        for name in sorted({counter["name"] for counter in summary["counters"]}):
+            metric = f"pipeline_{name}"
+            lines.append(f"# TYPE {metric} counter")
+            for counter in summary["counters"]:
+                if counter["name"] == name:
+                    lines.append(f"{metric}{_format_labels(counter['labels'])} {counter['value']}")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(path.suffix + ".tmp")
+        tmp.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        os.replace(tmp, path)
+
+    def export(self, **fields: Any) -> None:
+        """Write the configured exports for the current run."""
+        if not self.enabled:
+            return
+        cfg = CONFIG.metrics
+        if cfg.prometheus_path:
+            self.export_prometheus(Path(cfg.prometheus_path))
+        if cfg.jsonl_path:
+            self.export_jsonl(Path(cfg.jsonl_path), **fields)
+
+
+def _format_labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+    escaped = (value.replace("\\", "\\\\").replace('"', '\\"') for value in labels.values())
+    return "{" + ",".join(f'{label}="{value}"' for label, value in zip(labels, escaped)) + "}"
+
+
+METRICS = Metrics(CONFIG.metrics.enabled)
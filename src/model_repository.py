@@ -3,48 +3,175 @@ from __future__ import annotations
 
 import json
 import logging
+import sqlite3
+import threading
 from dataclasses import dataclass, field
+from datetime import datetime
 from pathlib import Path
-from typing import Dict, Iterable, List
+from typing import Any, Dict, Iterable, List, Sequence
 
 LOGGER = logging.getLogger(__name__)
 
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS models (
+    id INTEGER PRIMARY KEY,
+    full_name TEXT,
+    pushed_at TEXT,
+    stargazers_count INTEGER NOT NULL DEFAULT 0,
+    language TEXT,
+    payload TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_models_pushed_at ON models(pushed_at);
+CREATE INDEX IF NOT EXISTS idx_models_stars ON models(stargazers_count);
+CREATE INDEX IF NOT EXISTS idx_models_language ON models(language);
+CREATE TABLE IF NOT EXISTS model_topics (
+    topic TEXT NOT NULL,
+    model_id INTEGER NOT NULL REFERENCES models(id) ON DELETE CASCADE,
+    PRIMARY KEY (topic, model_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_model_topics_model ON model_topics(model_id);
+"""
+
+# SQLite limits the number of bound parameters per statement.
+_BATCH = 500
+
 
 @dataclass
 class ModelRepository:
-    """Persist model metadata in a JSON file."""
+    """Persist model metadata in an indexed SQLite database.
+
+    Only new or changed records are written, each ``update`` is a single
+    transaction, and ``pushed_at``, ``stargazers_count``, ``language`` and
+    topics are indexed for ``query``. A legacy ``models.json`` next to the
+    database is imported on first use; a ``path`` that still names the JSON
+    file opens its ``.sqlite3`` sibling and migrates the JSON into it.
+    """
 
     path: Path
-    _models: Dict[int, Dict] = field(default_factory=dict)
+    _conn: sqlite3.Connection = field(init=False, repr=False)
+    _lock: threading.Lock = field(init=False, repr=False, default_factory=threading.Lock)
 
     def __post_init__(self) -> None:
-        if self.path.exists():
-            self._models = self._load()
+        if self.path.suffix == ".json":
+            legacy, self.path = self.path, self.path.with_suffix(".sqlite3")
         else:
-            self.path.parent.mkdir(parents=True, exist_ok=True)
-            self.path.write_text("{}", encoding="utf-8")
+            legacy = self.path.with_suffix(".json")
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=FULL")
+        self._conn.execute("PRAGMA foreign_keys=ON")
+        self._conn.executescript(_SCHEMA)
+        if legacy.exists() and len(self) == 0:
+            self._import_legacy(legacy)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM models").fetchone()[0]
 
     def update(self, models: Iterable[Dict]) -> List[Dict]:
-        """Store unseen models and return the new ones."""
-        new_models: List[Dict] = []
+        """Store unseen or changed models and return the new ones."""
+        incoming: Dict[int, Dict] = {}
         for model in models:
             model_id = model.get("id")
-            if model_id is None:
-                continue
-            if model_id not in self._models:
-                LOGGER.info("Discovered new model: %s", model.get("full_name"))
-                self._models[model_id] = model
-                new_models.append(model)
-        if new_models:
-            self._persist()
+            if model_id is not None:
+                incoming[int(model_id)] = model
+        if not incoming:
+            return []
+        new_models: List[Dict] = []
+        with self._lock, self._conn:
+            stored = self._stored_payloads(list(incoming))
+            for model_id, model in incoming.items():
+                payload = json.dumps(model, sort_keys=True)
+                previous = stored.get(model_id)
+                if previous == payload:
+                    continue
+                if previous is None:
+                    LOGGER.info("Discovered new model: %s", model.get("full_name"))
+                    new_models.append(model)
+                self._write(model_id, model, payload)
         return new_models
 
-    def _persist(self) -> None:
-        self.path.write_text(json.dumps(self._models, indent=2, sort_keys=True), encoding="utf-8")
+    def get(self, model_id: int) -> Dict | None:
+        with self._lock:
+            row = self._conn.execute("SELECT payload FROM models WHERE id = ?", (model_id,)).fetchone()
+        return json.loads(row["payload"]) if row else None
+
+    def query(
+        self,
+        topic: str | None = None,
+        language: str | None = None,
+        pushed_since: datetime | str | None = None,
+        min_stars: int | None = None,
+        limit: int | None = None,
+    ) -> List[Dict]:
+        """Return models matching every given filter, most recently pushed first."""
+        clauses: List[str] = []
+        params: List[Any] = []
+        if topic is not None:
+            clauses.append("id IN (SELECT model_id FROM model_topics WHERE topic = ?)")
+            params.append(topic.lower())
+        if language is not None:
+            clauses.append("language = ?")
+            params.append(language)
+        if pushed_since is not None:
+            clauses.append("pushed_at >= ?")
+            params.append(pushed_since.isoformat() if isinstance(pushed_since, datetime) else pushed_since)
+        if min_stars is not None:
+            clauses.append("stargazers_count >= ?")
+            params.append(min_stars)
+        sql = "SELECT payload FROM models"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY pushed_at DESC"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [json.loads(row["payload"]) for row in rows]
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def _stored_payloads(self, ids: Sequence[int]) -> Dict[int, str]:
+        stored: Dict[int, str] = {}
+        for start in range(0, len(ids), _BATCH):
+            batch = ids[start : start + _BATCH]
+            placeholders = ",".join("?" * len(batch))
+            for row in self._conn.execute(f"SELECT id, payload FROM models WHERE id IN ({placeholders})", batch):
+                stored[row["id"]] = row["payload"]
+        return stored
+
+    def _write(self, model_id: int, model: Dict, payload: str) -> None:
+        self._conn.execute(
+            "INSERT OR REPLACE INTO models (id, full_name, pushed_at, stargazers_count, language, payload)"
+            " VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                model_id,
+                model.get("full_name"),
+                model.get("pushed_at"),
+                model.get("stargazers_count") or 0,
+                model.get("language"),
+                payload,
+            ),
+        )
+        self._conn.execute("DELETE FROM model_topics WHERE model_id = ?", (model_id,))
+        topics = {str(topic).lower() for topic in model.get("topics") or []}
+        self._conn.executemany(
+            "INSERT INTO model_topics (topic, model_id) VALUES (?, ?)",
+            [(topic, model_id) for topic in topics],
+        )
 
-    def _load(self) -> Dict[int, Dict]:
+    def _import_legacy(self, legacy: Path) -> None:
         try:
-            return json.loads(self.path.read_text(encoding="utf-8"))
+            models = json.loads(legacy.read_text(encoding="utf-8"))
         except json.JSONDecodeError:
-            LOGGER.warning("Model store corrupted, resetting: %s", self.path)
-            return {}
+            LOGGER.warning("Legacy model store corrupted, skipping import: %s", legacy)
+            return
+        with self._lock, self._conn:
+            for model in models.values():
+                if model.get("id") is not None:
+                    self._write(int(model["id"]), model, json.dumps(model, sort_keys=True))
+        LOGGER.info("Imported %d models from %s", len(models), legacy)
@@ -0,0 +1,242 @@
+"""Low-latency, idempotent order routing to Binance."""
+from __future__ import annotations
+
+import hashlib
+import hmac
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Deque, Dict, List, Sequence
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .config import CONFIG
+from .metrics import METRICS
+
+LOGGER = logging.getLogger(__name__)
+
+# Binance error codes the router reacts to.
+TIMESTAMP_OUTSIDE_RECV_WINDOW = -1021
+ORDER_DOES_NOT_EXIST = -2013
+
+
+class OrderStatusUnknown(RuntimeError):
+    """The exchange could not confirm whether an order exists, so it must not be resubmitted."""
+
+
+def client_order_id(*parts: Any) -> str:
+    """Return a deterministic ``newClientOrderId`` for the given identifying parts."""
+    digest = hashlib.sha256("|".join(str(part) for part in parts).encode()).hexdigest()
+    return f"cm{digest[:32]}"
+
+
+class OrderRateLimiter:
+    """Client-side order-count limiter synced from ``X-MBX-ORDER-COUNT-*`` headers.
+
+    A 429 or 418 with ``Retry-After`` holds every order until it has passed.
+    """
+
+    def __init__(self, per_10s: int, per_day: int) -> None:
+        self._per_10s = per_10s
+        self._per_day = per_day
+        self._sent: Deque[float] = deque()
+        self._server_10s = 0
+        self._server_day = 0
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                while self._sent and now - self._sent[0] >= 10:
+                    self._sent.popleft()
+                if self._server_day >= self._per_day:
+                    raise RuntimeError("Daily Binance order limit reached")
+                if now < self._blocked_until:
+                    wait = self._blocked_until - now
+                else:
+                    used = max(len(self._sent), self._server_10s if self._sent else 0)
+                    if used < self._per_10s:
+                        self._sent.append(now)
+                        return
+                    wait = 10 - (now - self._sent[0])
+            LOGGER.info("Order rate limit reached, waiting %.2fs", wait)
+            time.sleep(max(wait, 0.01))
+
+    def observe(self, response: requests.Response) -> None:
+        with self._lock:
+            count_10s = response.headers.get("X-MBX-ORDER-COUNT-10S")
+            count_day = response.headers.get("X-MBX-ORDER-COUNT-1D")
+            if count_10s is not None:
+                self._server_10s = int(count_10s)
+            if count_day is not None:
+                self._server_day = int(count_day)
+            retry_after = response.headers.get("Retry-After")
+            if response.status_code in (418, 429) and retry_after:
+                self._blocked_until = max(self._blocked_until, time.monotonic() + float(retry_after))
+
+
+class OrderRouter:
+    """Sign and submit market orders concurrently over a keep-alive session.
+
+    Every order carries a deterministic ``newClientOrderId``. When a request
+    fails ambiguously (timeout, connection drop, 5xx) the router first looks the
+    order up by that id and only resubmits once the exchange answers that it
+    does not exist (``-2013``), so retries cannot double-fill. If the lookups
+    themselves keep failing, ``OrderStatusUnknown`` is raised instead.
+    Rate-limit rejections (429, 418) are retried the same way once their
+    ``Retry-After`` has passed.
+    """
+
+    TIME_ENDPOINT = "/api/v3/time"
+    ORDER_ENDPOINT = "/api/v3/order"
+
+    def __init__(self, session: requests.Session | None = None, base_url: str | None = None) -> None:
+        self._cfg = CONFIG.binance
+        self._base_url = base_url or self._cfg.base_url
+        session = session or self._pooled_session(self._cfg.max_concurrent_orders)
+        self._session = METRICS.instrument_session(session, "binance_orders")
+        self._limiter = OrderRateLimiter(self._cfg.order_limit_10s, self._cfg.order_limit_1d)
+        self._time_offset_ms: int | None = None
+        self._time_lock = threading.Lock()
+
+    @staticmethod
+    def _pooled_session(pool_size: int) -> requests.Session:
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def sync_time(self) -> int:
+        """Measure the server clock offset in milliseconds."""
+        sent = time.time() * 1000
+        response = self._session.get(f"{self._base_url}{self.TIME_ENDPOINT}", timeout=self._cfg.order_timeout)
+        received = time.time() * 1000
+        response.raise_for_status()
+        offset = int(response.json()["serverTime"] - (sent + received) / 2)
+        with self._time_lock:
+            self._time_offset_ms = offset
+        LOGGER.debug("Binance server time offset %d ms", offset)
+        return offset
+
+    def _timestamp(self) -> int:
+        if self._time_offset_ms is None:
+            self.sync_time()
+        return int(time.time() * 1000) + (self._time_offset_ms or 0)
+
+    def submit_many(self, orders: Sequence[Dict[str, Any]]) -> List[Dict]:
+        """Submit independent orders concurrently; results keep the input order."""
+        if not orders:
+            return []
+        if self._time_offset_ms is None:
+            self.sync_time()
+        if len(orders) == 1:
+            return [self.submit(**orders[0])]
+        with ThreadPoolExecutor(max_workers=min(self._cfg.max_concurrent_orders, len(orders))) as pool:
+            return list(pool.map(lambda order: self.submit(**order), orders))
+
+    def submit(self, symbol: str, side: str, quantity: float, client_order_id: str) -> Dict:
+        """Place one market order, retrying safely on ambiguous failures."""
+        with METRICS.span("order_seconds", symbol=symbol, side=side.upper()):
+            return self._submit(symbol, side, quantity, client_order_id)
+
+    def _submit(self, symbol: str, side: str, quantity: float, client_order_id: str) -> Dict:
+        for attempt in range(self._cfg.max_order_retries + 1):
+            if attempt:
+                existing = self._lookup(symbol, client_order_id)
+                if existing is not None:
+                    LOGGER.info("Order %s already accepted by the exchange", client_order_id)
+                    return existing
+                METRICS.increment("http_retries_total", client="binance_orders")
+                time.sleep(min(0.1 * 2**attempt, 2.0))
+            self._limiter.acquire()
+            params = {
+                "symbol": symbol,
+                "side": side.upper(),
+                "type": "MARKET",
+                "quantity": f"{quantity:.6f}",
+                "newClientOrderId": client_order_id,
+                "recvWindow": self._cfg.recv_window_ms,
+                "timestamp": self._timestamp(),
+            }
+            try:
+                response = self._signed("POST", params)
+            except (requests.Timeout, requests.ConnectionError) as exc:
+                LOGGER.warning("Order %s failed ambiguously (%s)", client_order_id, exc)
+                continue
+            self._limiter.observe(response)
+            if response.status_code in (418, 429) or response.status_code >= 500:
+                LOGGER.warning("Order %s got HTTP %d", client_order_id, response.status_code)
+                continue
+            if response.status_code == 400 and self._error_code(response) == TIMESTAMP_OUTSIDE_RECV_WINDOW:
+                LOGGER.warning("Order %s outside recvWindow, resyncing server time", client_order_id)
+                self.sync_time()
+                continue
+            response.raise_for_status()
+            return response.json()
+        raise RuntimeError(f"Order {client_order_id} failed after {self._cfg.max_order_retries + 1} attempts")
+
+    def query(self, symbol: str, client_order_id: str) -> Dict | None:
+        """Return the exchange's view of an order, or ``None`` if it does not exist.
+
+        Raises ``OrderStatusUnknown`` when the lookup itself fails (timeout,
+        connection drop or any error other than ``ORDER_DOES_NOT_EXIST``).
+        """
+        params = {
+            "symbol": symbol,
+            "origClientOrderId": client_order_id,
+            "recvWindow": self._cfg.recv_window_ms,
+            "timestamp": self._timestamp(),
+        }
+        try:
+            response = self._signed("GET", params)
+        except (requests.Timeout, requests.ConnectionError) as exc:
+            raise OrderStatusUnknown(f"Lookup of order {client_order_id} failed: {exc}") from exc
+        if response.status_code == 400 and self._error_code(response) == ORDER_DOES_NOT_EXIST:
+            return None
+        if not response.ok:
+            if self._error_code(response) == TIMESTAMP_OUTSIDE_RECV_WINDOW:
+                self.sync_time()
+            raise OrderStatusUnknown(f"Lookup of order {client_order_id} got HTTP {response.status_code}")
+        return response.json()
+
+    def _lookup(self, symbol: str, client_order_id: str) -> Dict | None:
+        """Query an order until the exchange confirms it exists or not; never guess."""
+        attempts = self._cfg.max_order_retries + 1
+        for attempt in range(attempts):
+            if attempt:
+                time.sleep(min(0.1 * 2**attempt, 2.0))
+            try:
+                return self.query(symbol, client_order_id)
+            except OrderStatusUnknown as exc:
+                LOGGER.warning("Order %s status unknown (%s)", client_order_id, exc)
+        raise OrderStatusUnknown(
+            f"Order {client_order_id} status still unknown after {attempts} lookups; not resubmitting"
+        )
+
+    def _signed(self, method: str, params: Dict[str, Any]) -> requests.Response:
+        params = dict(params)
+        params["signature"] = self.sign(params)
+        return self._session.request(
+            method,
+            f"{self._base_url}{self.ORDER_ENDPOINT}",
+            headers={"X-MBX-APIKEY": self._cfg.api_key or ""},
+            params=params,
+            timeout=self._cfg.order_timeout,
+        )
+
+    def sign(self, payload: Dict[str, Any]) -> str:
+        query = "&".join(f"{key}={value}" for key, value in payload.items() if key != "signature")
+        return hmac.new((self._cfg.api_secret or "").encode(), query.encode(), hashlib.sha256).hexdigest()
+
+    @staticmethod
+    def _error_code(response: requests.Response) -> int | None:
+        try:
+            return int(response.json().get("code"))
+        except (ValueError, TypeError, AttributeError):
+            return None
@@ -0,0 +1,156 @@
+"""Cross-sectional backtests of strategies over aligned multi-symbol close matrices."""
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from typing import Dict, List, Mapping, Sequence
+
+import numpy as np
+
+from .backtester import Backtester, BacktestResult
+from .config import CONFIG
+from .data import HistoricalDataClient
+from .strategies import Strategy
+
+LOGGER = logging.getLogger(__name__)
+
+
+@dataclass
+class Panel:
+    """Closes of several symbols on one shared bar grid.
+
+    ``closes`` is (symbols x bars) and fully finite: bars before a symbol's
+    listing repeat its first close and missing bars repeat the previous close,
+    so their returns are zero. ``first``/``last`` bound each symbol's live span
+    and ``observed`` marks the bars that were actually traded.
+    """
+
+    symbols: tuple[str, ...]
+    open_time: np.ndarray
+    closes: np.ndarray
+    observed: np.ndarray
+    first: np.ndarray
+    last: np.ndarray
+
+    @property
+    def bars(self) -> int:
+        return self.closes.shape[1]
+
+    @property
+    def periods(self) -> np.ndarray:
+        """Live bars per symbol, the span its own single-symbol backtest would cover."""
+        return self.last - self.first + 1
+
+    def live(self) -> np.ndarray:
+        """Boolean (symbols x bars) mask of each symbol's listed span."""
+        bar = np.arange(self.bars)
+        return (bar >= self.first[:, None]) & (bar <= self.last[:, None])
+
+
+def align_candles(candles: Mapping[str, np.ndarray]) -> Panel:
+    """Align ``CANDLE_DTYPE`` arrays per symbol on the union of their open times.
+
+    Symbols without any candles are dropped.
+    """
+    frames = {symbol: rows for symbol, rows in candles.items() if len(rows)}
+    for symbol in candles.keys() - frames.keys():
+        LOGGER.warning("No candles for %s; leaving it out of the panel", symbol)
+    if not frames:
+        raise ValueError("No candles to build a panel from")
+    open_time = np.unique(np.concatenate([rows["open_time"] for rows in frames.values()]))
+    rows, bars = len(frames), len(open_time)
+    raw = np.zeros((rows, bars), dtype=np.float64)
+    observed = np.zeros((rows, bars), dtype=bool)
+    for row, frame in enumerate(frames.values()):
+        columns = np.searchsorted(open_time, frame["open_time"])
+        raw[row, columns] = frame["close"]
+        observed[row, columns] = True
+    first = observed.argmax(axis=1)
+    last = bars - 1 - observed[:, ::-1].argmax(axis=1)
+    # Forward-fill gaps by carrying the index of the latest observed bar; clamping to ``first``
+    # back-fills the pre-listing bars with the listing close.
+    source = np.where(observed, np.arange(bars), 0)
+    np.maximum.accumulate(source, axis=1, out=source)
+    np.maximum(source, first[:, None], out=source)
+    closes = np.take_along_axis(raw, source, axis=1)
+    gaps = int((last - first + 1).sum() - observed.sum())
+    if gaps:
+        LOGGER.info("Filled %d missing bars across %d symbols", gaps, rows)
+    return Panel(tuple(frames), open_time, closes, observed, first, last)
+
+
+def load_panel(
+    symbols: Sequence[str] | None = None,
+    interval: str | None = None,
+    client: HistoricalDataClient | None = None,
+) -> Panel:
+    """Fetch the configured lookback for every symbol and align it into a ``Panel``."""
+    symbols = symbols or CONFIG.panel.symbols
+    if not symbols:
+        raise ValueError("No panel symbols configured; set PanelConfig.symbols")
+    client = client or HistoricalDataClient()
+    candles = {symbol: client.fetch_candles(symbol, interval) for symbol in symbols}
+    panel = align_candles(candles)
+    LOGGER.info("Loaded panel of %d symbols x %d bars", len(panel.symbols), panel.bars)
+    return panel
+
+
+def panel_signals(strategy: Strategy, panel: Panel) -> np.ndarray:
+    """Return (symbols x bars) signals with every symbol's warm-up starting at its listing.
+
+    Rows are shifted left so each starts at its first live bar, scored in one
+    ``generate_signal_matrix`` call and shifted back; signals outside the live
+    span are zero.
+    """
+    bar = np.arange(panel.bars)
+    shifted = np.take_along_axis(panel.closes, np.minimum(bar + panel.first[:, None], panel.bars - 1), axis=1)
+    signals = strategy.generate_signal_matrix(shifted)
+    signals = np.take_along_axis(signals, np.maximum(bar - panel.first[:, None], 0), axis=1)
+    signals[~panel.live()] = 0
+    return signals
+
+
+@dataclass
+class PanelResult:
+    portfolio: BacktestResult  # equal weight across the symbols live at each bar
+    symbols: Dict[str, BacktestResult]
+
+
+class PanelBacktest:
+    """Score strategies on every symbol of a panel and on an equal-weight portfolio.
+
+    Per-symbol metrics cover each symbol's live span only and agree with a
+    single-symbol ``Backtester`` run over the same candles when none are missing.
+    """
+
+    def __init__(self, backtester: Backtester | None = None) -> None:
+        self._backtester = backtester or Backtester()
+
+    def run(self, strategy: Strategy, panel: Panel) -> PanelResult:
+        return self.run_many([strategy], panel)[0]
+
+    def run_many(self, strategies: Sequence[Strategy], panel: Panel) -> List[PanelResult]:
+        if not strategies:
+            return []
+        LOGGER.info("Running panel backtest for %d strategies on %d symbols", len(strategies), len(panel.symbols))
+        returns = self._backtester.compute_returns(panel.closes)
+        live = panel.live()
+        counts = live.sum(axis=0)
+        weights = np.divide(live, counts, out=np.zeros(live.shape), where=counts > 0)
+        symbol_returns = np.empty((len(strategies), len(panel.symbols), panel.bars))
+        for index, strategy in enumerate(strategies):
+            np.multiply(panel_signals(strategy, panel), returns, out=symbol_returns[index])
+        portfolio_returns = np.einsum("ksb,sb->kb", symbol_returns, weights)
+        flat = symbol_returns.reshape(-1, panel.bars)
+        per_symbol = self._backtester.metric_arrays(flat, np.tile(panel.periods, len(strategies)))
+        portfolio = self._backtester.metric_arrays(portfolio_returns)
+        results: List[PanelResult] = []
+        for index in range(len(strategies)):
+            rows = slice(index * len(panel.symbols), (index + 1) * len(panel.symbols))
+            symbols = {
+                symbol: BacktestResult(float(t), float(a), float(s), float(d))
+                for symbol, t, a, s, d in zip(panel.symbols, *(metric[rows] for metric in per_symbol))
+            }
+            portfolio_result = BacktestResult(*(float(metric[index]) for metric in portfolio))
+            results.append(PanelResult(portfolio_result, symbols))
+        return results
@@ -2,25 +2,36 @@
 from __future__ import annotations
 
 import logging
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Iterable, List
+from typing import Dict, Iterable, List
 
 from .config import CONFIG
 from .crawler import GitHubModelCrawler
-from .evaluator import ModelEvaluator
+from .evaluator import EvaluationOutcome, ModelEvaluator
+from .metrics import METRICS
 from .model_factory import ModelCandidate, build_candidate
 from .model_repository import ModelRepository
+from .order_router import client_order_id
 from .trader import TradeDecision, Trader
 
 LOGGER = logging.getLogger(__name__)
 
 
 class DailyPipeline:
-    """End-to-end pipeline executed each day."""
+    """End-to-end pipeline executed each day.
+
+    With ``ExecutionConfig.overlap_stages`` the candle download runs while
+    GitHub is crawled, candidates are backtested in small batches as soon as
+    they are built, and eligible decisions are sent to the trader while other
+    batches are still being evaluated.
+    """
 
     def __init__(
         self,
-        repository_path: Path = Path("data/models.json"),
+        repository_path: Path = Path("data/models.sqlite3"),
         crawler: GitHubModelCrawler | None = None,
         evaluator: ModelEvaluator | None = None,
         trader: Trader | None = None,
@@ -32,28 +43,95 @@ class DailyPipeline:
 
     def run(self) -> List[TradeDecision]:
         LOGGER.info("Starting daily pipeline")
-        repositories = self._crawler.fetch_recent_models()
-        new_repositories = self._model_store.update(repositories)
+        started = time.perf_counter()
+        try:
+            if CONFIG.execution.overlap_stages:
+                return self._run_overlapped()
+            return self._run()
+        finally:
+            # Evaluation workers are restarted lazily; do not leave them idle between daily runs.
+            self._evaluator.close()
+            METRICS.observe("run_seconds", time.perf_counter() - started)
+            METRICS.export(pipeline="daily")
+
+    def _run(self) -> List[TradeDecision]:
+        with METRICS.span("stage_seconds", stage="crawl"):
+            repositories = self._crawler.fetch_recent_models()
+        with METRICS.span("stage_seconds", stage="store_update"):
+            new_repositories = self._model_store.update(repositories)
+        METRICS.increment("repositories_total", len(repositories), kind="fetched")
+        METRICS.increment("repositories_total", len(new_repositories), kind="new")
         if not new_repositories:
             LOGGER.info("No new repositories discovered")
             return []
-        candidates = self._build_candidates(new_repositories)
-        outcomes = self._evaluator.evaluate(candidates)
-        decisions: List[TradeDecision] = []
-        for outcome in outcomes:
-            metadata = outcome.candidate.metadata
-            if outcome.eligible_for_live:
-                decision = TradeDecision(
-                    symbol=CONFIG.binance.trade_symbol,
-                    side="BUY",
-                    quantity=CONFIG.binance.trade_quantity,
-                )
-                LOGGER.info("Strategy %s eligible, preparing live trade", metadata.get("full_name"))
-                self._trader.execute(decision)
-                decisions.append(decision)
-            else:
-                LOGGER.info("Strategy %s not eligible for live trading", metadata.get("full_name"))
+        with METRICS.span("stage_seconds", stage="candidate_build"):
+            candidates = self._build_candidates(new_repositories)
+        with METRICS.span("stage_seconds", stage="evaluate"):
+            outcomes = self._evaluator.evaluate(candidates)
+        decisions = [decision for decision in map(self._decide, outcomes) if decision is not None]
+        if decisions:
+            with METRICS.span("stage_seconds", stage="trade"):
+                self._trader.execute_many(decisions)
         return decisions
 
+    def _run_overlapped(self) -> List[TradeDecision]:
+        cfg = CONFIG.execution
+        with (
+            ThreadPoolExecutor(max_workers=cfg.max_workers, thread_name_prefix="pipeline") as pool,
+            ThreadPoolExecutor(max_workers=cfg.max_workers, thread_name_prefix="orders") as order_pool,
+        ):
+            # The candle download does not depend on the crawl, so start it first.
+            closes_future = pool.submit(self._evaluator.load_closes)
+            with METRICS.span("stage_seconds", stage="crawl"):
+                repositories = self._crawler.fetch_recent_models()
+            with METRICS.span("stage_seconds", stage="store_update"):
+                new_repositories = self._model_store.update(repositories)
+            METRICS.increment("repositories_total", len(repositories), kind="fetched")
+            METRICS.increment("repositories_total", len(new_repositories), kind="new")
+            if not new_repositories:
+                LOGGER.info("No new repositories discovered")
+                closes_future.cancel()
+                return []
+            closes = closes_future.result()
+            batches: List[Future] = []
+            batch: List[ModelCandidate] = []
+            for repository in new_repositories:
+                batch.append(build_candidate(repository))
+                if len(batch) >= cfg.evaluation_batch_size:
+                    batches.append(pool.submit(self._evaluator.evaluate_on, batch, closes))
+                    batch = []
+            if batch:
+                batches.append(pool.submit(self._evaluator.evaluate_on, batch, closes))
+            orders: Dict[int, Future] = {}
+            positions = {future: index for index, future in enumerate(batches)}
+            for future in as_completed(batches):
+                for offset, outcome in enumerate(future.result()):
+                    decision = self._decide(outcome)
+                    if decision is not None:
+                        key = positions[future] * cfg.evaluation_batch_size + offset
+                        orders[key] = order_pool.submit(self._execute, decision)
+            # Keep the returned decisions in candidate order regardless of completion order.
+            return [orders[key].result() for key in sorted(orders)]
+
+    def _decide(self, outcome: EvaluationOutcome) -> TradeDecision | None:
+        metadata = outcome.candidate.metadata
+        if not outcome.eligible_for_live:
+            LOGGER.info("Strategy %s not eligible for live trading", metadata.get("full_name"))
+            return None
+        LOGGER.info("Strategy %s eligible, preparing live trade", metadata.get("full_name"))
+        symbol = CONFIG.binance.trade_symbol
+        # Stable per strategy and UTC day, so retries of this order are idempotent.
+        today = datetime.now(tz=timezone.utc).date().isoformat()
+        return TradeDecision(
+            symbol=symbol,
+            side="BUY",
+            quantity=CONFIG.binance.trade_quantity,
+            client_order_id=client_order_id(today, metadata.get("id"), symbol, "BUY"),
+        )
+
+    def _execute(self, decision: TradeDecision) -> TradeDecision:
+        self._trader.execute(decision)
+        return decision
+
     def _build_candidates(self, repositories: Iterable[dict]) -> List[ModelCandidate]:
         return [build_candidate(repo) for repo in repositories]
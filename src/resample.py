@@ -0,0 +1,127 @@
+"""Derive coarser OHLCV bars from a single stored base interval."""
+from __future__ import annotations
+
+from typing import Tuple
+
+import numpy as np
+
+from .candle_store import CANDLE_DTYPE, interval_ms
+
+YEAR_MS = 365 * 86_400_000
+# Binance weekly candles open on Monday 00:00 UTC; the Unix epoch was a Thursday.
+WEEK_OFFSET_MS = 4 * 86_400_000
+
+
+def periods_per_year(interval: str) -> float:
+    """Number of ``interval`` bars in a 365-day year (365.0 for ``1d``)."""
+    return YEAR_MS / interval_ms(interval)
+
+
+def bucket_spec(base_interval: str, interval: str) -> Tuple[int, int]:
+    """Return ``(width_ms, offset_ms)`` of ``interval`` buckets built from ``base_interval`` bars."""
+    if interval == "1M" or base_interval == "1M":
+        raise ValueError("Calendar-month bars cannot be derived from fixed-width buckets")
+    base = interval_ms(base_interval)
+    width = interval_ms(interval)
+    if width < base or width % base:
+        raise ValueError(f"Cannot resample {base_interval} bars into {interval} bars")
+    return width, WEEK_OFFSET_MS if interval == "1w" else 0
+
+
+def bucket_bounds(open_times: np.ndarray, width: int, offset: int = 0) -> Tuple[np.ndarray, np.ndarray]:
+    """Return bucket ids and the start index of every bucket in sorted ``open_times``."""
+    ids = (np.asarray(open_times, dtype=np.int64) - offset) // width
+    if ids.size == 0:
+        return ids, np.empty(0, dtype=np.intp)
+    starts = np.concatenate([[0], np.flatnonzero(ids[1:] != ids[:-1]) + 1])
+    return ids[starts], starts
+
+
+def resample(candles: np.ndarray, base_interval: str, interval: str, drop_partial: bool = False) -> np.ndarray:
+    """Aggregate ``CANDLE_DTYPE`` rows into ``interval`` bars in one vectorized pass.
+
+    Buckets are aligned like Binance's own klines (epoch multiples, Mondays
+    for ``1w``); missing base bars simply leave a bucket with fewer members.
+    With ``drop_partial`` a trailing bucket whose final base bar has not
+    arrived yet is omitted.
+    """
+    width, offset = bucket_spec(base_interval, interval)
+    ids, starts = bucket_bounds(candles["open_time"], width, offset)
+    bars = np.empty(starts.size, dtype=CANDLE_DTYPE)
+    if starts.size == 0:
+        return bars
+    ends = np.append(starts[1:], len(candles))
+    bars["open_time"] = ids * width + offset
+    bars["open"] = candles["open"][starts]
+    bars["high"] = np.maximum.reduceat(candles["high"], starts)
+    bars["low"] = np.minimum.reduceat(candles["low"], starts)
+    bars["close"] = candles["close"][ends - 1]
+    bars["volume"] = np.add.reduceat(candles["volume"], starts)
+    bars["trades"] = np.add.reduceat(candles["trades"], starts)
+    if drop_partial and not _closes_bucket(int(candles["open_time"][-1]), interval_ms(base_interval), width, offset):
+        bars = bars[:-1]
+    return bars
+
+
+def _closes_bucket(open_time: int, base_ms: int, width: int, offset: int) -> bool:
+    return (open_time + base_ms - offset) % width == 0
+
+
+class Resampler:
+    """Incrementally maintain ``interval`` bars as new base bars arrive.
+
+    Only the newly appended base bars are reduced; when they continue the
+    last (partial) bucket it is merged in place instead of being rebuilt.
+    """
+
+    def __init__(self, base_interval: str, interval: str) -> None:
+        self.base_interval = base_interval
+        self.interval = interval
+        self._width, self._offset = bucket_spec(base_interval, interval)
+        self._base_ms = interval_ms(base_interval)
+        self._buffer = np.empty(16, dtype=CANDLE_DTYPE)
+        self._size = 0
+        self._last_open_time: int | None = None
+
+    @property
+    def bars(self) -> np.ndarray:
+        """Read-only view of every bar so far, including a trailing partial one."""
+        view = self._buffer[: self._size]
+        view.flags.writeable = False
+        return view
+
+    @property
+    def partial(self) -> bool:
+        """Whether the last bar is still waiting for base bars of its bucket."""
+        if self._last_open_time is None:
+            return False
+        return not _closes_bucket(self._last_open_time, self._base_ms, self._width, self._offset)
+
+    def update(self, candles: np.ndarray) -> np.ndarray:
+        """Fold base bars newer than the last one seen into the bars and return them."""
+        if self._last_open_time is not None:
+            candles = candles[candles["open_time"] > self._last_open_time]
+        if len(candles) == 0:
+            return self.bars
+        fresh = resample(candles, self.base_interval, self.interval)
+        if self._size and fresh["open_time"][0] == self._buffer["open_time"][self._size - 1]:
+            last = self._buffer[self._size - 1 : self._size]
+            head = fresh[0]
+            last["high"] = max(float(last["high"][0]), float(head["high"]))
+            last["low"] = min(float(last["low"][0]), float(head["low"]))
+            last["close"] = head["close"]
+            last["volume"] += head["volume"]
+            last["trades"] += head["trades"]
+            fresh = fresh[1:]
+        self._append(fresh)
+        self._last_open_time = int(candles["open_time"][-1])
+        return self.bars
+
+    def _append(self, rows: np.ndarray) -> None:
+        needed = self._size + len(rows)
+        if needed > len(self._buffer):
+            grown = np.empty(max(needed, 2 * len(self._buffer)), dtype=CANDLE_DTYPE)
+            grown[: self._size] = self._buffer[: self._size]
+            self._buffer = grown
+        self._buffer[self._size : needed] = rows
+        self._size = needed
@@ -0,0 +1,341 @@
+"""Keep tracked strategies' backtest metrics current in O(new bars) per update."""
+from __future__ import annotations
+
+import json
+import logging
+import math
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Sequence, Tuple
+
+import numpy as np
+
+from .backtester import Backtester, BacktestResult
+from .config import CONFIG
+from .metrics import METRICS
+from .model_factory import ModelCandidate
+from .resample import periods_per_year
+from .result_cache import strategy_params
+
+LOGGER = logging.getLogger(__name__)
+
+# (count, mean, m2, growth, peak, trough, max drawdown) of a run of returns, with
+# peak/trough relative to the equity just before the run so that runs compose.
+Summary = Tuple[int, float, float, float, float, float, float]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS scores (
+    key TEXT PRIMARY KEY,
+    full_name TEXT,
+    spec TEXT NOT NULL,
+    state TEXT NOT NULL,
+    ring BLOB,
+    front BLOB,
+    last_open_time INTEGER,
+    total_return REAL NOT NULL,
+    annualized_return REAL NOT NULL,
+    sharpe_ratio REAL NOT NULL,
+    max_drawdown REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_scores_sharpe ON scores(sharpe_ratio);
+"""
+_COLUMNS = (
+    "key",
+    "full_name",
+    "spec",
+    "state",
+    "ring",
+    "front",
+    "last_open_time",
+    "total_return",
+    "annualized_return",
+    "sharpe_ratio",
+    "max_drawdown",
+    "updated_at",
+)
+# Scalar RollingScore fields kept as JSON; the ring and the front stack are stored as float64 bytes.
+_SCALAR_FIELDS = ("window", "start", "count", "back", "last_close", "last_open_time")
+_SUMMARY_WIDTH = 7
+
+
+def _single(r: float) -> Summary:
+    growth = 1.0 + r
+    return 1, r, 0.0, growth, max(1.0, growth), min(1.0, growth), max(0.0, -r)
+
+
+def _merge(older: Summary | None, newer: Summary | None) -> Summary | None:
+    if older is None:
+        return newer
+    if newer is None:
+        return older
+    count = older[0] + newer[0]
+    delta = newer[1] - older[1]
+    mean = older[1] + delta * newer[0] / count
+    m2 = older[2] + newer[2] + delta * delta * older[0] * newer[0] / count
+    growth = older[3]
+    drawdown = max(older[6], newer[6], 1 - growth * newer[5] / older[4])
+    return (
+        count,
+        mean,
+        m2,
+        growth * newer[3],
+        max(older[4], growth * newer[4]),
+        min(older[5], growth * newer[5]),
+        drawdown,
+    )
+
+
+@dataclass
+class RollingScore:
+    """Metrics of the last ``window`` strategy returns, updatable one bar at a time.
+
+    Returns live in a ring buffer; their summaries sit in a two-stack queue
+    (suffix aggregates in front, one running aggregate at the back), so bars
+    leaving the window are dropped without subtracting anything and the
+    statistics never accumulate rounding drift. The ring and the front stack
+    are float64 arrays, so checkpoints are plain byte copies of them.
+    """
+
+    window: int
+    ring: np.ndarray = field(default_factory=lambda: np.zeros(0))
+    start: int = 0
+    count: int = 0
+    front: np.ndarray = field(default_factory=lambda: np.zeros((0, _SUMMARY_WIDTH)))
+    front_size: int = 0
+    back: Summary | None = None
+    last_close: float | None = None
+    last_open_time: int | None = None
+
+    def push(self, r: float) -> None:
+        if not self.ring.size:
+            self.ring = np.zeros(self.window)
+        if self.count == self.window:
+            if not self.front_size:
+                self._refill_front()
+            self.front_size -= 1
+            self.start = (self.start + 1) % self.window
+            self.count -= 1
+        self.ring[(self.start + self.count) % self.window] = r
+        self.count += 1
+        self.back = _merge(self.back, _single(r))
+
+    def summary(self) -> Summary | None:
+        top = tuple(self.front[self.front_size - 1].tolist()) if self.front_size else None
+        return _merge(top, self.back)  # type: ignore[arg-type]
+
+    def result(self, backtester: Backtester) -> BacktestResult:
+        summary = self.summary()
+        if summary is None:
+            return BacktestResult(0.0, 0.0, 0.0, 0.0)
+        count, mean, m2, growth, _, _, drawdown = summary
+        total = growth - 1
+        annual = Backtester._annualized_return(total, count, backtester.periods_per_year)
+        sharpe = 0.0
+        if count >= 2 and m2 > 0:
+            std = math.sqrt(m2 / (count - 1))
+            excess = mean - backtester.risk_free_rate / backtester.periods_per_year
+            sharpe = excess / std * math.sqrt(backtester.periods_per_year)
+        return BacktestResult(total, annual, sharpe, drawdown)
+
+    def _refill_front(self) -> None:
+        if len(self.front) < self.count:
+            self.front = np.empty((self.window, _SUMMARY_WIDTH))
+        values = self.ring.tolist()
+        suffix: Summary | None = None
+        for size, offset in enumerate(range(self.count - 1, -1, -1)):
+            suffix = _merge(_single(values[(self.start + offset) % self.window]), suffix)
+            self.front[size] = suffix
+        self.front_size = self.count
+        self.back = None
+
+    def pack(self) -> Tuple[Dict[str, Any], bytes, bytes]:
+        """Return the scalar fields plus the ring and the live front stack as float64 bytes."""
+        scalars = {name: getattr(self, name) for name in _SCALAR_FIELDS}
+        return scalars, self.ring.tobytes(), self.front[: self.front_size].tobytes()
+
+    @classmethod
+    def unpack(cls, scalars: Dict[str, Any], ring: bytes, front: bytes) -> "RollingScore":
+        score = cls(**scalars)
+        score.ring = np.frombuffer(ring, dtype=np.float64).copy()
+        score.front = np.frombuffer(front, dtype=np.float64).reshape(-1, _SUMMARY_WIDTH).copy()
+        score.front_size = len(score.front)
+        score.back = tuple(score.back) if score.back is not None else None  # type: ignore[assignment]
+        return score
+
+
+@dataclass
+class TrackedScore:
+    key: str
+    full_name: str | None
+    result: BacktestResult
+    bars: int  # bars folded in by this update
+
+
+class TrackedScoreStore:
+    """Persist each tracked strategy's incremental and rolling-score state in SQLite.
+
+    The strategy state and the rolling score's scalars are JSON; the score's
+    ring and front stack, which grow with the window, are float64 blobs.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(scores)")}
+        for name in ("ring", "front"):
+            if name not in columns:  # files written before the binary columns; their rows replay once
+                self._conn.execute(f"ALTER TABLE scores ADD COLUMN {name} BLOB")
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """Return ``{"spec", "strategy", "score"}`` per stored key."""
+        keys = list(dict.fromkeys(keys))
+        found: Dict[str, Dict[str, Any]] = {}
+        with self._lock:
+            for offset in range(0, len(keys), 500):
+                batch = keys[offset : offset + 500]
+                placeholders = ",".join("?" * len(batch))
+                rows = self._conn.execute(
+                    "SELECT key, spec, state, ring, front FROM scores"
+                    f" WHERE key IN ({placeholders}) AND ring IS NOT NULL",
+                    batch,
+                ).fetchall()
+                for key, spec, state, ring, front in rows:
+                    state = json.loads(state)
+                    score = RollingScore.unpack(state["score"], ring, front)
+                    found[key] = {"spec": json.loads(spec), "strategy": state["strategy"], "score": score}
+        return found
+
+    def put_many(self, rows: Sequence[Tuple[TrackedScore, Dict[str, Any], Dict[str, Any], RollingScore]]) -> None:
+        """Store ``(tracked score, spec, strategy state, rolling score)`` rows in one transaction."""
+        now = time.time()
+        records = []
+        for tracked, spec, strategy_state, score in rows:
+            scalars, ring, front = score.pack()
+            result = tracked.result
+            records.append(
+                (
+                    tracked.key,
+                    tracked.full_name,
+                    json.dumps(spec, sort_keys=True),
+                    json.dumps({"strategy": strategy_state, "score": scalars}),
+                    ring,
+                    front,
+                    score.last_open_time,
+                    result.total_return,
+                    result.annualized_return,
+                    result.sharpe_ratio,
+                    result.max_drawdown,
+                    now,
+                )
+            )
+        with self._lock, self._conn:
+            self._conn.executemany(
+                f"INSERT OR REPLACE INTO scores ({', '.join(_COLUMNS)}) VALUES ({', '.join('?' * len(_COLUMNS))})",
+                records,
+            )
+
+    def top(self, limit: int = 20) -> List[TrackedScore]:
+        """Tracked strategies ranked by their current Sharpe ratio."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT key, full_name, total_return, annualized_return, sharpe_ratio, max_drawdown "
+                "FROM scores ORDER BY sharpe_ratio DESC LIMIT ?",
+                (limit,),
+            ).fetchall()
+        return [TrackedScore(key, name, BacktestResult(*metrics), 0) for key, name, *metrics in rows]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM scores").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class IncrementalRescorer:
+    """Advance tracked strategies and their rolling metrics by the bars they have not seen.
+
+    Signals come from ``Strategy.update`` over the continuous history, so they
+    never restart their warm-up at the window edge; the metrics cover the
+    strategy returns of the last ``window`` bars. A strategy seen for the
+    first time, or whose parameters changed, is replayed over the candles
+    given once and then only advanced.
+    """
+
+    def __init__(
+        self,
+        store: TrackedScoreStore | None = None,
+        backtester: Backtester | None = None,
+        window: int | None = None,
+    ) -> None:
+        cfg = CONFIG.rescoring
+        self._store = store if store is not None else TrackedScoreStore(Path(cfg.state_path))
+        self._backtester = backtester or Backtester(periods_per_year=periods_per_year(CONFIG.data.interval))
+        lookback_bars = round(CONFIG.data.lookback_years * self._backtester.periods_per_year)
+        self._window = window or cfg.window_bars or lookback_bars
+
+    @staticmethod
+    def key(candidate: ModelCandidate) -> str:
+        metadata = candidate.metadata
+        return str(metadata.get("id") or metadata.get("full_name"))
+
+    def advance(self, candidates: Sequence[ModelCandidate], candles: np.ndarray) -> List[TrackedScore]:
+        """Fold new ``CANDLE_DTYPE`` rows into every candidate's state and persist it."""
+        open_times = candles["open_time"]
+        closes = candles["close"]
+        keys = [self.key(candidate) for candidate in candidates]
+        stored = self._store.get_many(keys)
+        scores: List[TrackedScore] = []
+        rows = []
+        reset = 0
+        with METRICS.span("stage_seconds", stage="rescore"):
+            for key, candidate in zip(keys, candidates):
+                strategy = candidate.strategy
+                spec = {"type": type(strategy).__name__, "params": strategy_params(strategy), "window": self._window}
+                entry = stored.get(key)
+                if entry is not None and entry["spec"] == spec:
+                    strategy.set_state(entry["strategy"])
+                    score = entry["score"]
+                else:
+                    strategy.reset()
+                    score = RollingScore(self._window)
+                    reset += 1
+                first = 0
+                if score.last_open_time is not None:
+                    first = int(np.searchsorted(open_times, score.last_open_time, "right"))
+                for index in range(first, len(closes)):
+                    close = float(closes[index])
+                    signal = strategy.update(close)
+                    previous = score.last_close
+                    r = 0.0 if previous is None or previous == 0 else (close - previous) / previous
+                    score.push(signal * r)
+                    score.last_close = close
+                if first < len(closes):
+                    score.last_open_time = int(open_times[-1])
+                bars = len(closes) - first
+                result = TrackedScore(key, candidate.metadata.get("full_name"), score.result(self._backtester), bars)
+                scores.append(result)
+                if bars:  # unchanged state is not rewritten
+                    rows.append((result, spec, strategy.get_state(), score))
+            self._store.put_many(rows)
+        advanced = sum(score.bars for score in scores)
+        LOGGER.info(
+            "Rescored %d tracked strategies (%d replayed from scratch) over %d new bars",
+            len(scores),
+            reset,
+            advanced,
+        )
+        METRICS.increment("rescored_bars_total", advanced)
+        return scores
+
+    def close(self) -> None:
+        self._store.close()
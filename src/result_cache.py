@@ -0,0 +1,166 @@
+"""Content-addressed cache of backtest results."""
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import json
+import logging
+import math
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Mapping, Sequence
+
+from .backtester import Backtester, BacktestResult
+from .metrics import METRICS
+from .strategies import Strategy
+
+LOGGER = logging.getLogger(__name__)
+
+# Bump when backtest semantics change so stale results are never served.
+CACHE_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    key TEXT PRIMARY KEY,
+    total_return REAL NOT NULL,
+    annualized_return REAL NOT NULL,
+    sharpe_ratio REAL NOT NULL,
+    max_drawdown REAL NOT NULL,
+    created_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_results_accessed ON results(accessed_at);
+CREATE INDEX IF NOT EXISTS idx_results_created ON results(created_at);
+"""
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+def strategy_params(strategy: Strategy) -> Dict:
+    if dataclasses.is_dataclass(strategy):
+        return dataclasses.asdict(strategy)
+    return dict(vars(strategy))
+
+
+def cache_key(strategy: Strategy, data_fingerprint: str, backtester: Backtester) -> str:
+    """Hash strategy class, parameters, price fingerprint and engine settings."""
+    spec = {
+        "version": CACHE_VERSION,
+        "strategy": f"{type(strategy).__module__}.{type(strategy).__qualname__}",
+        "params": strategy_params(strategy),
+        "data": data_fingerprint,
+        "engine": {"risk_free_rate": backtester.risk_free_rate, "periods_per_year": backtester.periods_per_year},
+    }
+    return hashlib.sha256(json.dumps(spec, sort_keys=True, default=repr).encode()).hexdigest()
+
+
+class BacktestCache:
+    """Persist ``BacktestResult``s in SQLite with LRU size and age eviction."""
+
+    def __init__(self, path: Path, max_entries: int = 100_000, max_age_days: float = 30.0) -> None:
+        self.path = path
+        self.max_entries = max_entries
+        self.max_age_seconds = max_age_days * 86_400
+        self.stats = CacheStats()
+        self._lock = threading.Lock()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, BacktestResult]:
+        keys = list(dict.fromkeys(keys))
+        found: Dict[str, BacktestResult] = {}
+        now = time.time()
+        with self._lock, self._conn:
+            for start in range(0, len(keys), 500):
+                batch = keys[start : start + 500]
+                placeholders = ",".join("?" * len(batch))
+                rows = self._conn.execute(
+                    "SELECT key, total_return, annualized_return, sharpe_ratio, max_drawdown FROM results"
+                    f" WHERE key IN ({placeholders}) AND created_at >= ?",
+                    (*batch, now - self.max_age_seconds),
+                ).fetchall()
+                for key, *values in rows:
+                    found[key] = BacktestResult(*values)
+            self._conn.executemany("UPDATE results SET accessed_at = ? WHERE key = ?", [(now, key) for key in found])
+        self.stats.hits += len(found)
+        self.stats.misses += len(keys) - len(found)
+        return found
+
+    def put_many(self, results: Mapping[str, BacktestResult]) -> None:
+        """Store results; ones with a NaN or infinite metric are not cached."""
+        results = {key: r for key, r in results.items() if all(map(math.isfinite, dataclasses.astuple(r)))}
+        if not results:
+            return
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (key, r.total_return, r.annualized_return, r.sharpe_ratio, r.max_drawdown, now, now)
+                    for key, r in results.items()
+                ],
+            )
+        self.evict()
+
+    def evict(self) -> int:
+        """Drop expired entries, then least recently used ones beyond ``max_entries``."""
+        with self._lock, self._conn:
+            expired = self._conn.execute(
+                "DELETE FROM results WHERE created_at < ?", (time.time() - self.max_age_seconds,)
+            ).rowcount
+            overflow = self._conn.execute("SELECT COUNT(*) FROM results").fetchone()[0] - self.max_entries
+            if overflow > 0:
+                self._conn.execute(
+                    "DELETE FROM results WHERE key IN (SELECT key FROM results ORDER BY accessed_at LIMIT ?)",
+                    (overflow,),
+                )
+        evicted = expired + max(overflow, 0)
+        self.stats.evictions += evicted
+        return evicted
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def run_many(
+        self,
+        backtester: Backtester,
+        strategies: Sequence[Strategy],
+        closes: Sequence[float],
+        data_fingerprint: str,
+        tail: int | None = None,
+    ) -> List[BacktestResult]:
+        """``Backtester.run_many`` that only backtests strategies missing from the cache."""
+        if tail is not None:
+            data_fingerprint = f"{data_fingerprint}/tail:{tail}"
+        keys = [cache_key(strategy, data_fingerprint, backtester) for strategy in strategies]
+        found = self.get_many(keys)
+        missing = [idx for idx, key in enumerate(keys) if key not in found]
+        if missing:
+            fresh = backtester.run_many([strategies[idx] for idx in missing], closes, tail)
+            computed = {keys[idx]: result for idx, result in zip(missing, fresh)}
+            self.put_many(computed)
+            found.update(computed)
+        METRICS.increment("backtest_cache_total", len(strategies) - len(missing), result="hit")
+        METRICS.increment("backtest_cache_total", len(missing), result="miss")
+        LOGGER.info("Backtest cache: %d hits, %d misses", len(strategies) - len(missing), len(missing))
+        return [found[key] for key in keys]
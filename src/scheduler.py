@@ -1,34 +1,314 @@
-"""Simple scheduler that runs the pipeline once per day."""
+"""Multi-job scheduler for the pipeline and its intraday stages."""
 from __future__ import annotations
 
+import abc
+import json
 import logging
-import time
-from datetime import datetime, timedelta
+import os
+import random
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Callable, Dict, List, Set
 
 from .config import CONFIG
-from .pipeline import DailyPipeline
 
 LOGGER = logging.getLogger(__name__)
 
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
 
-def _seconds_until(target_hour: int, target_minute: int) -> float:
-    now = datetime.utcnow()
-    target = now.replace(hour=target_hour, minute=target_minute, second=0, microsecond=0)
-    if target <= now:
-        target += timedelta(days=1)
-    return (target - now).total_seconds()
 
+def _utc_now() -> datetime:
+    return datetime.now(tz=timezone.utc)
 
-def run_forever() -> None:
-    """Run the pipeline once per day at the configured time."""
-    pipeline = DailyPipeline()
-    run_time = CONFIG.scheduler.run_time
-    while True:
-        wait_seconds = _seconds_until(run_time.hour, run_time.minute)
-        LOGGER.info("Next execution in %.2f hours", wait_seconds / 3600)
-        time.sleep(wait_seconds)
+
+class Schedule(abc.ABC):
+    """Base class for job schedules; all datetimes are timezone-aware UTC."""
+
+    @abc.abstractmethod
+    def next_after(self, moment: datetime) -> datetime:
+        """Return the first scheduled time strictly after ``moment``."""
+
+
+@dataclass(frozen=True)
+class IntervalSchedule(Schedule):
+    """Fire every ``every``, aligned to ``anchor`` (default: the Unix epoch)."""
+
+    every: timedelta
+    anchor: datetime = EPOCH
+
+    def next_after(self, moment: datetime) -> datetime:
+        periods = (moment - self.anchor) // self.every + 1
+        return self.anchor + periods * self.every
+
+
+def _parse_field(spec: str, low: int, high: int) -> Set[int]:
+    values: Set[int] = set()
+    for part in spec.split(","):
+        step = 1
+        if "/" in part:
+            part, step_text = part.split("/", 1)
+            step = int(step_text)
+        if part == "*":
+            start, end = low, high
+        elif "-" in part:
+            start_text, end_text = part.split("-", 1)
+            start, end = int(start_text), int(end_text)
+        else:
+            start = end = int(part)
+            if step != 1:
+                end = high
+        if start < low or end > high or start > end or step < 1:
+            raise ValueError(f"Invalid cron field {spec!r}")
+        values.update(range(start, end + 1, step))
+    return values
+
+
+@dataclass(frozen=True)
+class CronSchedule(Schedule):
+    """Five-field cron expression (minute hour day-of-month month day-of-week) in UTC."""
+
+    expression: str
+    _minutes: Set[int] = field(init=False, repr=False, compare=False)
+    _hours: Set[int] = field(init=False, repr=False, compare=False)
+    _days: Set[int] = field(init=False, repr=False, compare=False)
+    _months: Set[int] = field(init=False, repr=False, compare=False)
+    _weekdays: Set[int] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        fields = self.expression.split()
+        if len(fields) != 5:
+            raise ValueError(f"Cron expression needs five fields: {self.expression!r}")
+        minute, hour, day, month, weekday = fields
+        object.__setattr__(self, "_minutes", _parse_field(minute, 0, 59))
+        object.__setattr__(self, "_hours", _parse_field(hour, 0, 23))
+        object.__setattr__(self, "_days", _parse_field(day, 1, 31))
+        object.__setattr__(self, "_months", _parse_field(month, 1, 12))
+        # Cron counts Sunday as 0 (or 7); normalise to 0-6.
+        object.__setattr__(self, "_weekdays", {value % 7 for value in _parse_field(weekday, 0, 7)})
+
+    def _day_matches(self, moment: datetime) -> bool:
+        day_restricted = len(self._days) < 31
+        weekday_restricted = len(self._weekdays) < 7
+        day_ok = moment.day in self._days
+        weekday_ok = (moment.weekday() + 1) % 7 in self._weekdays
+        if day_restricted and weekday_restricted:
+            return day_ok or weekday_ok
+        return day_ok and weekday_ok
+
+    def next_after(self, moment: datetime) -> datetime:
+        candidate = moment.astimezone(timezone.utc).replace(second=0, microsecond=0) + timedelta(minutes=1)
+        limit = candidate + timedelta(days=366 * 5)
+        while candidate < limit:
+            if candidate.month not in self._months:
+                year = candidate.year + candidate.month // 12
+                candidate = candidate.replace(year=year, month=candidate.month % 12 + 1, day=1, hour=0, minute=0)
+            elif not self._day_matches(candidate):
+                candidate = (candidate + timedelta(days=1)).replace(hour=0, minute=0)
+            elif candidate.hour not in self._hours:
+                candidate = (candidate + timedelta(hours=1)).replace(minute=0)
+            elif candidate.minute not in self._minutes:
+                candidate += timedelta(minutes=1)
+            else:
+                return candidate
+        raise ValueError(f"Cron expression never fires: {self.expression!r}")
+
+
+@dataclass
+class Job:
+    """A named callable, its schedule and the random delay spread applied to each run."""
+
+    name: str
+    func: Callable[[], object]
+    schedule: Schedule
+    jitter: timedelta = timedelta(0)
+    catch_up: bool = True
+
+
+class JobState:
+    """Persist each job's last successful run so missed runs can be caught up."""
+
+    def __init__(self, path: Path | None) -> None:
+        self._path = path
+        self._last_runs: Dict[str, datetime] = {}
+        self._lock = threading.Lock()
+        if path is not None and path.exists():
+            try:
+                raw = json.loads(path.read_text(encoding="utf-8"))
+                self._last_runs = {name: datetime.fromisoformat(value) for name, value in raw.items()}
+            except (json.JSONDecodeError, ValueError):
+                LOGGER.warning("Scheduler state corrupted, resetting: %s", path)
+
+    def last_run(self, name: str) -> datetime | None:
+        with self._lock:
+            return self._last_runs.get(name)
+
+    def record(self, name: str, moment: datetime) -> None:
+        with self._lock:
+            self._last_runs[name] = moment
+            if self._path is None:
+                return
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self._path.with_suffix(self._path.suffix + ".tmp")
+            payload = {job: value.isoformat() for job, value in self._last_runs.items()}
+            tmp.write_text(json.dumps(payload, indent=2, sort_keys=True), encoding="utf-8")
+            os.replace(tmp, self._path)
+
+
+class Scheduler:
+    """Run registered jobs in a bounded worker pool.
+
+    A job never overlaps with a still-running instance of itself; a due run
+    is skipped instead. On start, jobs whose persisted last run is older than
+    their previous scheduled time run once immediately to catch up.
+    ``clock`` returns the current UTC time and defaults to the system clock.
+    """
+
+    def __init__(
+        self,
+        state: JobState | None = None,
+        max_workers: int = 4,
+        clock: Callable[[], datetime] | None = None,
+    ) -> None:
+        self._state = state or JobState(None)
+        self._clock = clock or _utc_now
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="scheduler")
+        self._jobs: Dict[str, Job] = {}
+        self._due: Dict[str, datetime] = {}
+        self._running: Dict[str, Future] = {}
+        self._stop = threading.Event()
+        self._rng = random.Random()
+
+    def register(self, job: Job) -> None:
+        if job.name in self._jobs:
+            raise ValueError(f"Job already registered: {job.name}")
+        self._jobs[job.name] = job
+        now = self.now()
+        last = self._state.last_run(job.name)
+        if job.catch_up and last is not None and job.schedule.next_after(last) <= now:
+            LOGGER.info("Job %s missed a run since %s, catching up", job.name, last.isoformat())
+            self._due[job.name] = now
+        else:
+            self._due[job.name] = self._next_due(job, now)
+
+    def now(self) -> datetime:
+        return self._clock()
+
+    def _next_due(self, job: Job, after: datetime) -> datetime:
+        due = job.schedule.next_after(after)
+        if job.jitter:
+            due += timedelta(seconds=self._rng.uniform(0, job.jitter.total_seconds()))
+        return due
+
+    def run_pending(self) -> List[str]:
+        """Submit every due job and return the names of those started."""
+        now = self.now()
+        started: List[str] = []
+        for name, job in self._jobs.items():
+            if self._due[name] > now:
+                continue
+            self._due[name] = self._next_due(job, now)
+            running = self._running.get(name)
+            if running is not None and not running.done():
+                LOGGER.warning("Job %s still running, skipping this run", name)
+                continue
+            LOGGER.info("Starting job %s (next run %s)", name, self._due[name].isoformat())
+            self._running[name] = self._pool.submit(self._execute, job)
+            started.append(name)
+        return started
+
+    def _execute(self, job: Job) -> None:
+        started = self.now()
         try:
-            pipeline.run()
+            job.func()
         except Exception as exc:  # pragma: no cover - defensive logging
-            LOGGER.exception("Pipeline execution failed: %s", exc)
-        time.sleep(60)  # avoid duplicate runs if the loop is fast
+            LOGGER.exception("Job %s failed: %s", job.name, exc)
+            return
+        self._state.record(job.name, started)
+
+    def seconds_until_next(self) -> float:
+        if not self._due:
+            return 60.0
+        return max((min(self._due.values()) - self.now()).total_seconds(), 0.0)
+
+    def run_forever(self, max_sleep: float = 60.0) -> None:
+        """Dispatch jobs until ``stop`` is called."""
+        while not self._stop.is_set():
+            self.run_pending()
+            wait = min(self.seconds_until_next(), max_sleep)
+            LOGGER.debug("Next job in %.1fs", wait)
+            self._stop.wait(wait)
+        self._pool.shutdown(wait=True)
+
+    def stop(self) -> None:
+        self._stop.set()
+
+
+def _run_pipeline() -> None:
+    from .pipeline import DailyPipeline
+
+    DailyPipeline().run()
+
+
+def _refresh_candles() -> None:
+    from .data import HistoricalDataClient
+
+    HistoricalDataClient().fetch_candles()
+
+
+def _reevaluate_tracked() -> None:
+    from .data import HistoricalDataClient
+    from .model_factory import build_candidate
+    from .model_repository import ModelRepository
+    from .rescoring import IncrementalRescorer
+
+    repository = ModelRepository(Path(CONFIG.scheduler.repository_path))
+    rescorer = IncrementalRescorer()
+    try:
+        candidates = [build_candidate(model) for model in repository.query()]
+        scores = rescorer.advance(candidates, HistoricalDataClient().fetch_candles())
+        best = sorted(scores, key=lambda score: score.result.sharpe_ratio, reverse=True)[:5]
+        for score in best:
+            LOGGER.info(
+                "Tracked %s: sharpe %.2f over the rolling window",
+                score.full_name or score.key,
+                score.result.sharpe_ratio,
+            )
+    finally:
+        rescorer.close()
+        repository.close()
+
+
+def build_default_scheduler() -> Scheduler:
+    """Register the daily pipeline and the configured intraday jobs."""
+    cfg = CONFIG.scheduler
+    state = JobState(Path(cfg.state_path) if cfg.state_path else None)
+    scheduler = Scheduler(state, max_workers=cfg.max_workers)
+    jitter = timedelta(seconds=cfg.jitter_seconds)
+    run_time = cfg.run_time
+    scheduler.register(
+        Job("daily-pipeline", _run_pipeline, CronSchedule(f"{run_time.minute} {run_time.hour} * * *"), jitter)
+    )
+    if cfg.candle_refresh_minutes:
+        interval = IntervalSchedule(timedelta(minutes=cfg.candle_refresh_minutes))
+        scheduler.register(Job("refresh-candles", _refresh_candles, interval, jitter, catch_up=False))
+    if cfg.reevaluate_minutes:
+        interval = IntervalSchedule(timedelta(minutes=cfg.reevaluate_minutes))
+        scheduler.register(Job("reevaluate", _reevaluate_tracked, interval, jitter, catch_up=False))
+    return scheduler
+
+
+def run_forever() -> None:
+    """Run the configured jobs until the process is stopped."""
+    scheduler = build_default_scheduler()
+    try:
+        scheduler.run_forever()
+    except KeyboardInterrupt:  # pragma: no cover - interactive shutdown
+        scheduler.stop()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    run_forever()
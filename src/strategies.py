@@ -4,15 +4,117 @@ from __future__ import annotations
 import abc
 import math
 from dataclasses import dataclass
-from typing import Iterable, List
+from typing import Any, Dict, Iterable, Sequence
+
+import numpy as np
+
+from . import indicators
+from .bars import SIGNAL_DTYPE, Prices, stack_signals
 
 
 class Strategy(abc.ABC):
-    """Base class for trading strategies."""
+    """Base class for trading strategies.
+
+    ``generate_signals`` accepts closes as a list, an array or a ``BarSeries``
+    and returns one ``SIGNAL_DTYPE`` entry per bar. Besides the batch path,
+    strategies can be advanced bar by bar with ``update``; feeding the same
+    closes through ``update`` yields exactly the batch signals. Incremental
+    state lives outside the dataclass fields and can be checkpointed with
+    ``get_state``/``set_state``.
+    """
 
     @abc.abstractmethod
-    def generate_signals(self, prices: List[float]) -> List[int]:
-        """Return 1 for long, -1 for short, and 0 for neutral positions."""
+    def generate_signals(self, prices: Prices) -> np.ndarray:
+        """Return 1 for long, -1 for short, and 0 for neutral positions.
+
+        Fractional positions may be returned as floats; batch backtests then
+        keep them as float64 rather than truncating them to ``SIGNAL_DTYPE``.
+        """
+
+    def generate_signal_matrix(self, prices: np.ndarray) -> np.ndarray:
+        """Return signals for every row of a (symbols x bars) price matrix.
+
+        Row ``i`` equals ``generate_signals(prices[i])``; vectorized strategies
+        override this to compute all rows in one pass.
+        """
+        matrix = np.atleast_2d(indicators.as_array(prices))
+        return stack_signals([self.generate_signals(series) for series in matrix], matrix.shape[1])
+
+    def update(self, close: float) -> int:
+        """Advance by one bar and return the signal for it.
+
+        The default keeps every close and re-runs ``generate_signals`` over
+        them, which costs O(bars) per call; the built-in strategies override
+        it with constant-time incremental state.
+        """
+        stream = self._stream_state(1)
+        closes = stream.setdefault("closes", [])
+        closes.append(float(close))
+        stream["bars"] += 1
+        return np.asarray(self.generate_signals(closes))[-1].item()
+
+    def reset(self) -> None:
+        """Forget incremental state so the next ``update`` starts a new series."""
+        self.__dict__.pop("_stream", None)
+
+    def get_state(self) -> Dict[str, Any]:
+        """Return a JSON-serialisable checkpoint of the incremental state."""
+        stream = self.__dict__.get("_stream") or {}
+        return {key: list(value) if isinstance(value, list) else value for key, value in stream.items()}
+
+    def set_state(self, state: Dict[str, Any]) -> None:
+        self.__dict__["_stream"] = {
+            key: list(value) if isinstance(value, list) else value for key, value in (state or {}).items()
+        } or None
+
+    def _stream_state(self, capacity: int) -> Dict[str, Any]:
+        """Return the incremental state, creating a ring buffer of ``capacity`` slots."""
+        stream = self.__dict__.get("_stream")
+        if stream is None:
+            stream = self.__dict__["_stream"] = {"bars": 0, "ring": [0.0] * max(capacity, 1), "pos": 0}
+        return stream
+
+
+def _ring_push(stream: Dict[str, Any], value: float) -> None:
+    ring = stream["ring"]
+    ring[stream["pos"]] = value
+    stream["pos"] = (stream["pos"] + 1) % len(ring)
+
+
+def _ring_back(stream: Dict[str, Any], age: int, key: str = "ring") -> float:
+    """Return the value pushed ``age`` pushes ago (0 is the most recent)."""
+    ring = stream[key]
+    return ring[(stream["pos"] - 1 - age) % len(ring)]
+
+
+# The O(n) running totals can misplace the sign of a near-zero average difference by rounding.
+# Differences within these error bounds are re-decided on window sums added left to right, the
+# order the original per-bar ``sum`` used, so ties and near-ties resolve exactly as before.
+# A window sum differenced from the running totals only carries the rounding of the additions
+# inside that window, so its error is bounded by the largest total the window touches (and the
+# offset added back), not by how long the series is.
+_RELATIVE_ERROR = 1e-9  # rounding of the means themselves, including the reference sums
+_LOCAL_ERROR = 8 * np.finfo(np.float64).eps  # per unit of the largest running total in the window
+
+
+def _sign(fast: float, slow: float) -> int:
+    return 1 if fast > slow else -1 if fast < slow else 0
+
+
+def _reference_mean(prices: Sequence[float], window: int) -> float:
+    """Mean of the last ``window`` prices, summed left to right."""
+    total = 0.0
+    for price in prices[len(prices) - window :]:
+        total += price
+    return total / window
+
+
+def _reference_means(series: np.ndarray, lead: tuple, ends: np.ndarray, window: int) -> np.ndarray:
+    """``_reference_mean`` of the ``window`` bars before each of ``ends``, vectorized across them."""
+    total = np.zeros(ends.shape)
+    for offset in range(window, 0, -1):
+        total += series[(*lead, np.maximum(ends - offset, 0))]
+    return total / window
 
 
 @dataclass
@@ -22,21 +124,91 @@ class SmaCrossStrategy(Strategy):
     fast_window: int = 10
     slow_window: int = 30
 
-    def generate_signals(self, prices: List[float]) -> List[int]:
-        if len(prices) < self.slow_window:
-            return [0] * len(prices)
-        signals: List[int] = [0] * len(prices)
-        for idx in range(self.slow_window, len(prices)):
-            fast = sum(prices[idx - self.fast_window : idx]) / self.fast_window
-            slow = sum(prices[idx - self.slow_window : idx]) / self.slow_window
-            if fast > slow:
-                signals[idx] = 1
-            elif fast < slow:
-                signals[idx] = -1
-            else:
-                signals[idx] = 0
+    def generate_signals(self, prices: Prices) -> np.ndarray:
+        return self._signals(indicators.as_array(prices))
+
+    def generate_signal_matrix(self, prices: np.ndarray) -> np.ndarray:
+        return self._signals(np.atleast_2d(indicators.as_array(prices)))
+
+    def _signals(self, series: np.ndarray) -> np.ndarray:
+        bars = series.shape[-1]
+        signals = np.zeros(series.shape, dtype=SIGNAL_DTYPE)
+        if bars < self.slow_window:
+            return signals
+        # Signal at ``idx`` uses the averages of the bars strictly before it.
+        fast = indicators.sma(series, self.fast_window)[..., self.slow_window - 1 : -1]
+        slow = indicators.sma(series, self.slow_window)[..., self.slow_window - 1 : -1]
+        if self.fast_window > self.slow_window:
+            # Matches the original slicing, where a not-yet-full fast window summed to zero.
+            warmup = np.arange(self.slow_window, bars) < self.fast_window
+            fast = np.where(warmup, 0.0, fast)
+        difference = fast - slow
+        signals[..., self.slow_window :] = np.sign(difference)
+        # Running totals as in ``indicators._rolling_sum``. Every total in the window ending at
+        # ``end`` is at most the one before the window plus the absolute steps inside it.
+        offset = series[..., :1]
+        steps = series - offset
+        totals = np.cumsum(steps, axis=-1)
+        reach = np.cumsum(np.abs(steps, out=steps), axis=-1)
+        ends = np.arange(self.slow_window - 1, bars - 1)
+        starts = np.maximum(ends - max(self.fast_window, self.slow_window), 0)
+        local = np.abs(totals[..., starts]) + (reach[..., ends] - reach[..., starts])
+        bound = _RELATIVE_ERROR * (np.abs(fast) + np.abs(slow))
+        bound += _LOCAL_ERROR * (local + np.abs(offset))
+        near = np.abs(difference, out=difference) <= bound
+        if near.any():
+            *lead, column = np.nonzero(near)
+            ends = column + self.slow_window
+            exact_fast = _reference_means(series, tuple(lead), ends, self.fast_window)
+            exact_fast[ends < self.fast_window] = 0.0
+            exact_slow = _reference_means(series, tuple(lead), ends, self.slow_window)
+            signals[(*lead, ends)] = np.sign(exact_fast - exact_slow)
         return signals
 
+    def update(self, close: float) -> int:
+        # Mirrors ``indicators._rolling_sum``: a running total of prices minus the
+        # first price, differenced over the last ``window`` totals, so results
+        # are bit-identical to the batch path. Recent closes are kept as well to
+        # settle near-ties on exact window sums like the batch path does.
+        stream = self._stream_state(max(self.fast_window, self.slow_window) + 1)
+        idx = stream["bars"]
+        if idx == 0:
+            stream["offset"] = close
+            stream["total"] = 0.0
+            stream["peak"] = 0.0
+            stream["closes"] = [0.0] * len(stream["ring"])
+        signal = 0
+        if idx >= self.slow_window:
+            slow = self._window_mean(stream, self.slow_window)
+            warmup = self.fast_window > self.slow_window and idx < self.fast_window
+            fast = 0.0 if warmup else self._window_mean(stream, self.fast_window)
+            signal = _sign(fast, slow)
+            relative = _RELATIVE_ERROR * (abs(fast) + abs(slow))
+            offset = abs(stream["offset"])
+            # The largest total so far bounds the window's; only near that bound is the ring scanned.
+            near = abs(fast - slow) <= relative + _LOCAL_ERROR * (stream["peak"] + offset)
+            if near:
+                local = max(abs(total) for total in stream["ring"])
+                near = abs(fast - slow) <= relative + _LOCAL_ERROR * (local + offset)
+            if near:
+                size = max(self.fast_window, self.slow_window)
+                recent = [_ring_back(stream, age, "closes") for age in range(size - 1, -1, -1)]
+                exact_fast = 0.0 if warmup else _reference_mean(recent, self.fast_window)
+                signal = _sign(exact_fast, _reference_mean(recent, self.slow_window))
+        stream["total"] = stream["total"] + (close - stream["offset"]) if idx else 0.0
+        stream["peak"] = max(stream["peak"], abs(stream["total"]))
+        stream["closes"][stream["pos"]] = close
+        _ring_push(stream, stream["total"])
+        stream["bars"] = idx + 1
+        return signal
+
+    @staticmethod
+    def _window_mean(stream: Dict[str, Any], window: int) -> float:
+        """Mean of the ``window`` bars ending at the previous bar."""
+        latest = _ring_back(stream, 0)
+        window_sum = latest - _ring_back(stream, window) if stream["bars"] - 1 >= window else latest
+        return (window_sum + stream["offset"] * window) / window
+
 
 @dataclass
 class MomentumStrategy(Strategy):
@@ -45,26 +217,49 @@ class MomentumStrategy(Strategy):
     lookback: int = 14
     threshold: float = 0.02
 
-    def generate_signals(self, prices: List[float]) -> List[int]:
-        signals: List[int] = [0] * len(prices)
-        for idx in range(self.lookback, len(prices)):
-            start = prices[idx - self.lookback]
-            if start == 0:
-                continue
-            change = (prices[idx] - start) / start
-            if change > self.threshold:
-                signals[idx] = 1
-            elif change < -self.threshold:
-                signals[idx] = -1
+    def generate_signals(self, prices: Prices) -> np.ndarray:
+        return self._signals(indicators.as_array(prices))
+
+    def generate_signal_matrix(self, prices: np.ndarray) -> np.ndarray:
+        return self._signals(np.atleast_2d(indicators.as_array(prices)))
+
+    def _signals(self, series: np.ndarray) -> np.ndarray:
+        change = indicators.rolling_return(series, self.lookback)
+        signals = np.zeros(series.shape, dtype=SIGNAL_DTYPE)
+        # Long takes precedence when a negative threshold makes both conditions true.
+        signals[change < -self.threshold] = -1
+        signals[change > self.threshold] = 1
         return signals
 
+    def update(self, close: float) -> int:
+        stream = self._stream_state(self.lookback + 1)
+        _ring_push(stream, close)
+        stream["bars"] += 1
+        if self.lookback < 0 or stream["bars"] <= self.lookback:
+            return 0
+        start = _ring_back(stream, self.lookback)
+        if start == 0:
+            return 0
+        change = (close - start) / start
+        if change > self.threshold:
+            return 1
+        if change < -self.threshold:
+            return -1
+        return 0
+
 
 @dataclass
 class HoldStrategy(Strategy):
     """A do-nothing benchmark strategy."""
 
-    def generate_signals(self, prices: List[float]) -> List[int]:
-        return [0] * len(prices)
+    def generate_signals(self, prices: Prices) -> np.ndarray:
+        return np.zeros(len(prices), dtype=SIGNAL_DTYPE)
+
+    def generate_signal_matrix(self, prices: np.ndarray) -> np.ndarray:
+        return np.zeros(np.shape(np.atleast_2d(prices)), dtype=SIGNAL_DTYPE)
+
+    def update(self, close: float) -> int:
+        return 0
 
 
 def strategy_from_keywords(keywords: Iterable[str]) -> Strategy:
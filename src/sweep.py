@@ -0,0 +1,198 @@
+"""Strategy parameter sweeps fanned out across a process pool."""
+from __future__ import annotations
+
+import itertools
+import logging
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, Sequence, Tuple, Type, Union
+
+import numpy as np
+
+from .backtester import Backtester, BacktestResult
+from .strategies import MomentumStrategy, SmaCrossStrategy, Strategy
+
+LOGGER = logging.getLogger(__name__)
+
+ParamSet = Dict[str, Any]
+Constraint = Callable[[ParamSet], bool]
+
+DEFAULT_GRIDS: Dict[Type[Strategy], Dict[str, Sequence[Any]]] = {
+    SmaCrossStrategy: {"fast_window": range(5, 55, 5), "slow_window": range(20, 210, 10)},
+    MomentumStrategy: {"lookback": range(5, 65, 5), "threshold": [0.0, 0.01, 0.02, 0.05, 0.1]},
+}
+# Combinations a grid expansion drops; an SMA cross needs its fast window inside the slow one.
+DEFAULT_CONSTRAINTS: Dict[Type[Strategy], Constraint] = {
+    SmaCrossStrategy: lambda params: params["fast_window"] < params["slow_window"],
+}
+
+
+@dataclass(frozen=True)
+class Range:
+    """Inclusive ``[low, high]`` interval for ``random_search``; integer bounds sample integers."""
+
+    low: Union[int, float]
+    high: Union[int, float]
+
+    def __post_init__(self) -> None:
+        if self.low > self.high:
+            raise ValueError(f"Range low {self.low} exceeds high {self.high}")
+
+    def sample(self, rng: random.Random) -> Union[int, float]:
+        if isinstance(self.low, int) and isinstance(self.high, int):
+            return rng.randint(self.low, self.high)
+        return rng.uniform(self.low, self.high)
+
+
+# Consecutive draws ``random_search`` discards before giving up on a constraint.
+_MAX_REJECTIONS = 1000
+
+
+@dataclass
+class SweepResult:
+    params: ParamSet
+    result: BacktestResult
+
+
+def grid(space: Mapping[str, Iterable[Any]], constraint: Constraint | None = None) -> List[ParamSet]:
+    """Return every combination of a parameter grid that satisfies ``constraint``."""
+    names = list(space)
+    combos = (dict(zip(names, values)) for values in itertools.product(*(list(space[name]) for name in names)))
+    return [params for params in combos if constraint is None or constraint(params)]
+
+
+def default_grid(strategy_cls: Type[Strategy]) -> List[ParamSet]:
+    """Expand ``DEFAULT_GRIDS`` for a strategy class, dropping invalid combinations."""
+    return grid(DEFAULT_GRIDS[strategy_cls], DEFAULT_CONSTRAINTS.get(strategy_cls))
+
+
+def random_search(
+    space: Mapping[str, Union[Range, Iterable[Any]]],
+    samples: int,
+    seed: int | None = None,
+    constraint: Constraint | None = None,
+) -> List[ParamSet]:
+    """Sample parameter sets that satisfy ``constraint``.
+
+    ``Range`` specs are sampled uniformly; any other iterable, tuples
+    included, is a list of choices.
+    """
+    rng = random.Random(seed)
+    choices = {name: spec if isinstance(spec, Range) else list(spec) for name, spec in space.items()}
+    param_sets: List[ParamSet] = []
+    for _ in range(samples):
+        for _attempt in range(_MAX_REJECTIONS):
+            params = {
+                name: spec.sample(rng) if isinstance(spec, Range) else rng.choice(spec)
+                for name, spec in choices.items()
+            }
+            if constraint is None or constraint(params):
+                break
+        else:
+            raise ValueError(f"Constraint rejected {_MAX_REJECTIONS} consecutive samples")
+        param_sets.append(params)
+    return param_sets
+
+
+class SharedPrices:
+    """Place a closes array in ``multiprocessing.shared_memory`` once for all workers."""
+
+    def __init__(self, closes: Sequence[float]) -> None:
+        prices = np.ascontiguousarray(closes, dtype=np.float64)
+        self.length = int(prices.size)
+        self._shm = shared_memory.SharedMemory(create=True, size=max(prices.nbytes, 1))
+        self.name = self._shm.name
+        np.ndarray(prices.shape, dtype=np.float64, buffer=self._shm.buf)[:] = prices
+
+    def close(self) -> None:
+        self._shm.close()
+        self._shm.unlink()
+
+    def __enter__(self) -> "SharedPrices":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+def attach_prices(name: str, length: int) -> Tuple[shared_memory.SharedMemory, np.ndarray]:
+    """Attach a pool worker to a ``SharedPrices`` block created by its parent process."""
+    shm = shared_memory.SharedMemory(name=name)
+    prices = np.ndarray((length,), dtype=np.float64, buffer=shm.buf)
+    prices.flags.writeable = False
+    return shm, prices
+
+
+_WORKER_STATE: Dict[str, Any] = {}
+
+
+def _init_worker(name: str, length: int) -> None:
+    shm, prices = attach_prices(name, length)
+    _WORKER_STATE["shm"] = shm
+    _WORKER_STATE["prices"] = prices
+
+
+def _run_chunk(
+    strategy_cls: Type[Strategy],
+    backtester: Backtester,
+    param_sets: List[ParamSet],
+) -> List[BacktestResult]:
+    prices = _WORKER_STATE["prices"]
+    return backtester.run_many([strategy_cls(**params) for params in param_sets], prices)
+
+
+class ParameterSweep:
+    """Backtest a strategy class across many parameter sets and rank the results."""
+
+    def __init__(
+        self,
+        strategy_cls: Type[Strategy],
+        backtester: Backtester | None = None,
+        max_workers: int | None = None,
+        chunk_size: int = 64,
+    ) -> None:
+        self._strategy_cls = strategy_cls
+        self._backtester = backtester or Backtester()
+        self._max_workers = max_workers or os.cpu_count() or 1
+        self._chunk_size = chunk_size
+
+    def run(
+        self,
+        closes: Sequence[float],
+        param_sets: Iterable[ParamSet],
+        rank_by: str = "sharpe_ratio",
+    ) -> List[SweepResult]:
+        """Return sweep results sorted best-first by ``rank_by``."""
+        param_sets = list(param_sets)
+        if not param_sets:
+            return []
+        chunks = [param_sets[i : i + self._chunk_size] for i in range(0, len(param_sets), self._chunk_size)]
+        LOGGER.info(
+            "Sweeping %d %s parameter sets in %d chunks on %d workers",
+            len(param_sets),
+            self._strategy_cls.__name__,
+            len(chunks),
+            self._max_workers,
+        )
+        results = list(self._execute(closes, chunks))
+        ranked = [SweepResult(params, result) for params, result in zip(param_sets, results)]
+        ranked.sort(key=lambda item: getattr(item.result, rank_by), reverse=rank_by != "max_drawdown")
+        return ranked
+
+    def _execute(self, closes: Sequence[float], chunks: List[List[ParamSet]]) -> Iterator[BacktestResult]:
+        if self._max_workers == 1 or len(chunks) == 1:
+            prices = np.asarray(closes, dtype=np.float64)
+            for chunk in chunks:
+                yield from self._backtester.run_many([self._strategy_cls(**params) for params in chunk], prices)
+            return
+        with SharedPrices(closes) as shared, ProcessPoolExecutor(
+            max_workers=min(self._max_workers, len(chunks)),
+            initializer=_init_worker,
+            initargs=(shared.name, shared.length),
+        ) as pool:
+            futures = [pool.submit(_run_chunk, self._strategy_cls, self._backtester, chunk) for chunk in chunks]
+            for future in futures:
+                yield from future.result()
@@ -1,17 +1,19 @@
 """Binance trading adapter."""
 from __future__ import annotations
 
-import hmac
 import logging
+import threading
 from dataclasses import dataclass
-from hashlib import sha256
 from time import time
-from typing import Dict
-
-import requests
+from typing import TYPE_CHECKING, Dict, List, Sequence
 
 from .config import CONFIG
 
+if TYPE_CHECKING:  # the router pulls in requests; build it only when an order is sent
+    import requests
+
+    from .order_router import OrderRouter
+
 LOGGER = logging.getLogger(__name__)
 
 
@@ -22,42 +24,51 @@ class TradeDecision:
     symbol: str
     side: str
     quantity: float
+    client_order_id: str | None = None  # deterministic id makes resubmission idempotent
 
 
 class Trader:
     """Place market orders against Binance's REST API."""
 
-    ORDER_ENDPOINT = "/api/v3/order"
-
-    def __init__(self, session: requests.Session | None = None) -> None:
-        self._session = session or requests.Session()
+    def __init__(self, session: requests.Session | None = None, router: OrderRouter | None = None) -> None:
         self._cfg = CONFIG.binance
+        self._session = session
+        self._router = router
+        self._router_lock = threading.Lock()
 
     def execute(self, decision: TradeDecision) -> Dict:
+        return self.execute_many([decision])[0]
+
+    def execute_many(self, decisions: Sequence[TradeDecision]) -> List[Dict]:
+        """Submit independent decisions concurrently; results keep the input order."""
         if not self._cfg.api_key or not self._cfg.api_secret:
             LOGGER.warning("No Binance credentials provided; skipping live trade")
-            return {"status": "skipped", "reason": "missing credentials"}
-        LOGGER.info("Submitting order to Binance: %s", decision)
-        payload = {
-            "symbol": decision.symbol,
-            "side": decision.side.upper(),
-            "type": "MARKET",
-            "quantity": f"{decision.quantity:.6f}",
-            "timestamp": int(time() * 1000),
-        }
-        payload["signature"] = self._sign(payload)
-        headers = {"X-MBX-APIKEY": self._cfg.api_key}
-        response = self._session.post(
-            f"{self._cfg.base_url}{self.ORDER_ENDPOINT}",
-            headers=headers,
-            params=payload,
-            timeout=30,
-        )
-        response.raise_for_status()
-        LOGGER.info("Order successful: %s", response.json())
-        return response.json()
-
-    def _sign(self, payload: Dict[str, str]) -> str:
-        query = "&".join(f"{key}={value}" for key, value in payload.items() if key != "signature")
-        signature = hmac.new(self._cfg.api_secret.encode(), query.encode(), sha256).hexdigest()
-        return signature
+            return [{"status": "skipped", "reason": "missing credentials"} for _ in decisions]
+        from .order_router import client_order_id
+
+        router = self._get_router()
+        orders = []
+        for decision in decisions:
+            LOGGER.info("Submitting order to Binance: %s", decision)
+            orders.append(
+                {
+                    "symbol": decision.symbol,
+                    "side": decision.side,
+                    "quantity": decision.quantity,
+                    "client_order_id": decision.client_order_id
+                    or client_order_id(decision.symbol, decision.side, decision.quantity, time()),
+                }
+            )
+        results = router.submit_many(orders)
+        for result in results:
+            LOGGER.info("Order successful: %s", result)
+        return results
+
+    def _get_router(self) -> OrderRouter:
+        # The overlapped pipeline executes decisions from several threads; they must share one router.
+        with self._router_lock:
+            if self._router is None:
+                from .order_router import OrderRouter
+
+                self._router = OrderRouter(self._session)
+            return self._router
@@ -0,0 +1,158 @@
+"""Walk-forward evaluation with incrementally maintained window metrics."""
+from __future__ import annotations
+
+import logging
+import math
+from dataclasses import dataclass
+from typing import List, Sequence, Tuple
+
+import numpy as np
+
+from .backtester import Backtester, BacktestResult
+from .config import CONFIG, WalkForwardConfig
+from .strategies import Strategy
+
+LOGGER = logging.getLogger(__name__)
+
+# (peak, trough, max drawdown) of a run of consecutive equity points.
+Summary = Tuple[float, float, float]
+
+
+@dataclass
+class WalkForwardWindow:
+    train_start: int
+    test_start: int
+    test_end: int
+    train: BacktestResult
+    test: BacktestResult
+
+
+def window_bounds(periods: int, cfg: WalkForwardConfig) -> List[Tuple[int, int, int]]:
+    """Return ``(train_start, test_start, test_end)`` bar indices for each window."""
+    bounds: List[Tuple[int, int, int]] = []
+    test_start = cfg.train_bars
+    while test_start + cfg.test_bars <= periods:
+        train_start = 0 if cfg.expanding else test_start - cfg.train_bars
+        bounds.append((train_start, test_start, test_start + cfg.test_bars))
+        test_start += cfg.step_bars
+    return bounds
+
+
+def _merge(older: Summary | None, newer: Summary | None) -> Summary | None:
+    if older is None:
+        return newer
+    if newer is None:
+        return older
+    peak = max(older[0], newer[0])
+    trough = min(older[1], newer[1])
+    drawdown = max(older[2], newer[2], 1 - newer[1] / older[0] if older[0] > 0 else 0.0)
+    return peak, trough, drawdown
+
+
+class SlidingDrawdown:
+    """Max drawdown over a sliding run of equity points in amortized O(1) per bar.
+
+    Drawdown summaries form a monoid, so a two-stack queue yields the
+    aggregate of the current window without rescanning it.
+    """
+
+    def __init__(self, equity: np.ndarray) -> None:
+        self._equity = equity
+        self._start = 0
+        self._end = 0
+        self._front: List[Summary] = []
+        self._back: Summary | None = None
+        self._back_start = 0
+
+    def advance(self, start: int, end: int) -> float:
+        """Slide to equity points ``[start, end)`` and return their max drawdown."""
+        if start < self._start or end < self._end:
+            raise ValueError("Window bounds must be non-decreasing")
+        for idx in range(self._end, end):
+            value = float(self._equity[idx])
+            self._back = _merge(self._back, (value, value, 0.0))
+        self._end = end
+        while self._start < start:
+            if not self._front:
+                self._refill_front()
+            self._front.pop()
+            self._start += 1
+        summary = _merge(self._front[-1] if self._front else None, self._back)
+        return summary[2] if summary else 0.0
+
+    def _refill_front(self) -> None:
+        suffix: Summary | None = None
+        for idx in range(self._end - 1, self._start - 1, -1):
+            value = float(self._equity[idx])
+            suffix = _merge((value, value, 0.0), suffix)
+            self._front.append(suffix)  # type: ignore[arg-type]
+        self._back = None
+
+
+class WalkForward:
+    """Score a strategy on rolling or expanding train/test windows.
+
+    Signals and returns are computed once for the whole series; window
+    return and Sharpe come from prefix sums and drawdown from
+    ``SlidingDrawdown``, so no slice is ever re-backtested.
+    """
+
+    def __init__(self, backtester: Backtester | None = None, config: WalkForwardConfig | None = None) -> None:
+        self._backtester = backtester or Backtester()
+        self._cfg = config or CONFIG.walk_forward
+
+    def run(self, strategy: Strategy, closes: Sequence[float]) -> List[WalkForwardWindow]:
+        prices = np.asarray(closes, dtype=np.float64)
+        signals = np.asarray(strategy.generate_signals(closes))
+        if signals.shape != prices.shape:
+            raise ValueError("Signals length mismatch")
+        return self.run_returns(signals * self._backtester.compute_returns(prices))
+
+    def run_returns(self, strategy_returns: np.ndarray) -> List[WalkForwardWindow]:
+        bounds = window_bounds(len(strategy_returns), self._cfg)
+        if not bounds:
+            LOGGER.info("Series of %d bars too short for walk-forward windows", len(strategy_returns))
+            return []
+        prefix = _PrefixSums(strategy_returns)
+        train_drawdown = SlidingDrawdown(prefix.equity)
+        test_drawdown = SlidingDrawdown(prefix.equity)
+        windows: List[WalkForwardWindow] = []
+        for train_start, test_start, test_end in bounds:
+            # Returns [a, b) map onto equity points [a, b].
+            train = self._window_result(prefix, train_start, test_start)
+            train.max_drawdown = train_drawdown.advance(train_start, test_start + 1)
+            test = self._window_result(prefix, test_start, test_end)
+            test.max_drawdown = test_drawdown.advance(test_start, test_end + 1)
+            windows.append(WalkForwardWindow(train_start, test_start, test_end, train, test))
+        LOGGER.info("Computed %d walk-forward windows", len(windows))
+        return windows
+
+    def _window_result(self, prefix: "_PrefixSums", start: int, end: int) -> BacktestResult:
+        periods = end - start
+        if prefix.equity[start] > 0:
+            total = float(prefix.equity[end] / prefix.equity[start] - 1)
+        else:
+            total = float(np.prod(1.0 + prefix.returns[start:end]) - 1)
+        annual = Backtester._annualized_return(total, periods, self._backtester.periods_per_year)
+        sharpe = 0.0
+        # Flat windows are detected exactly; prefix-sum differences would leave rounding noise.
+        if periods >= 2 and prefix.active[end] > prefix.active[start]:
+            mean = (prefix.sums[end] - prefix.sums[start]) / periods
+            squares = prefix.squares[end] - prefix.squares[start]
+            variance = (squares - periods * mean * mean) / (periods - 1)
+            if variance > 1e-12 * squares / periods:
+                periods_per_year = self._backtester.periods_per_year
+                excess = mean - self._backtester.risk_free_rate / periods_per_year
+                sharpe = float(excess / math.sqrt(variance) * math.sqrt(periods_per_year))
+        return BacktestResult(total, annual, sharpe, 0.0)
+
+
+class _PrefixSums:
+    """Prefix aggregates that give any window's statistics in O(1)."""
+
+    def __init__(self, returns: np.ndarray) -> None:
+        self.returns = returns
+        self.sums = np.concatenate([[0.0], np.cumsum(returns)])
+        self.squares = np.concatenate([[0.0], np.cumsum(returns * returns)])
+        self.active = np.concatenate([[0], np.cumsum(returns != 0)])
+        self.equity = np.concatenate([[1.0], np.cumprod(1.0 + returns)])
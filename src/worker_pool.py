@@ -0,0 +1,185 @@
+"""Process pool whose workers can be killed and replaced when a task hangs or crashes."""
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import signal
+import time
+from collections import deque
+from multiprocessing.connection import Connection, wait
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, Sequence, Tuple
+
+from .metrics import METRICS
+
+try:  # POSIX only; memory caps are skipped elsewhere
+    import resource
+except ImportError:  # pragma: no cover - Windows
+    resource = None  # type: ignore[assignment]
+
+LOGGER = logging.getLogger(__name__)
+
+# (task index, succeeded, result or error message)
+TaskResult = Tuple[int, bool, Any]
+
+
+def _worker_main(
+    conn: Connection,
+    initializer: Callable[..., None] | None,
+    initargs: Sequence[Any],
+    memory_limit_mb: int | None,
+) -> None:
+    signal.signal(signal.SIGINT, signal.SIG_IGN)  # the parent decides when workers stop
+    METRICS.drain()  # a forked worker starts with a copy of the parent's metrics; only ship its own
+    if memory_limit_mb and resource is not None:
+        limit = memory_limit_mb * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+    if initializer is not None:
+        initializer(*initargs)
+    while True:
+        try:
+            message = conn.recv()
+        except EOFError:
+            return
+        if message is None:
+            return
+        index, func, args = message
+        try:
+            reply = (index, True, func(*args))
+        except BaseException as exc:  # noqa: BLE001 - MemoryError and friends must not kill the worker
+            reply = (index, False, f"{type(exc).__name__}: {exc}" if str(exc) else type(exc).__name__)
+        delta = METRICS.drain()
+        try:
+            conn.send((*reply, delta))
+        except Exception as exc:  # noqa: BLE001 - e.g. an unpicklable result
+            conn.send((index, False, f"Unable to return result: {exc}", delta))
+
+
+class _Worker:
+    def __init__(
+        self,
+        context: Any,
+        initializer: Callable[..., None] | None,
+        initargs: Sequence[Any],
+        memory_limit_mb: int | None,
+    ) -> None:
+        self.conn, child = context.Pipe()
+        self.process = context.Process(
+            target=_worker_main,
+            args=(child, initializer, tuple(initargs), memory_limit_mb),
+            daemon=True,
+        )
+        self.process.start()
+        child.close()
+
+    def kill(self) -> None:
+        self.process.kill()
+        self.process.join()
+        self.conn.close()
+
+    def stop(self) -> None:
+        try:
+            self.conn.send(None)
+        except OSError:
+            pass
+        self.process.join(timeout=5)
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join()
+        self.conn.close()
+
+
+class WorkerPool:
+    """Run one task per worker at a time, enforcing a wall-clock timeout per task.
+
+    Unlike ``ProcessPoolExecutor`` a hung task is handled by killing just its
+    worker and starting a fresh one; a worker that dies (segfault, memory cap)
+    fails only the task it was running. Workers are started lazily and stay
+    warm across ``imap_unordered`` calls until ``close``. Metrics a task
+    records in its worker are sent back with its result and merged into the
+    parent's ``METRICS``.
+    """
+
+    def __init__(
+        self,
+        processes: int,
+        initializer: Callable[..., None] | None = None,
+        initargs: Sequence[Any] = (),
+        timeout: float | None = None,
+        memory_limit_mb: int | None = None,
+        start_method: str | None = None,
+    ) -> None:
+        self._processes = max(1, processes)
+        self._initializer = initializer
+        self._initargs = tuple(initargs)
+        self._timeout = timeout
+        self._memory_limit_mb = memory_limit_mb
+        self._context = multiprocessing.get_context(start_method)
+        self._idle: List[_Worker] = []
+        self._size = 0
+
+    def imap_unordered(self, func: Callable[..., Any], arguments: Iterable[Sequence[Any]]) -> Iterator[TaskResult]:
+        """Yield ``(index, ok, value)`` for every argument tuple as soon as it finishes."""
+        pending: Deque[Tuple[int, Sequence[Any]]] = deque(enumerate(arguments))
+        running: Dict[_Worker, Tuple[int, float]] = {}
+        try:
+            while pending or running:
+                while pending and (self._idle or self._size < self._processes):
+                    worker = self._acquire()
+                    index, args = pending.popleft()
+                    worker.conn.send((index, func, tuple(args)))
+                    deadline = time.monotonic() + self._timeout if self._timeout else float("inf")
+                    running[worker] = (index, deadline)
+                next_deadline = min(deadline for _, deadline in running.values())
+                wait_for = None if next_deadline == float("inf") else max(0.0, next_deadline - time.monotonic())
+                handles: List[Any] = [worker.conn for worker in running]
+                handles += [worker.process.sentinel for worker in running]
+                ready = set(wait(handles, timeout=wait_for))
+                now = time.monotonic()
+                for worker, (index, deadline) in list(running.items()):
+                    if worker.conn in ready:
+                        try:
+                            _, ok, value, delta = worker.conn.recv()
+                        except (EOFError, OSError):
+                            yield index, False, self._replace(worker, running, "worker exited unexpectedly")
+                            continue
+                        del running[worker]
+                        self._idle.append(worker)
+                        METRICS.merge(delta)
+                        yield index, ok, value
+                    elif worker.process.sentinel in ready:
+                        worker.process.join(timeout=1)
+                        code = worker.process.exitcode
+                        yield index, False, self._replace(worker, running, f"worker exited with code {code}")
+                    elif now >= deadline:
+                        yield index, False, self._replace(worker, running, f"timed out after {self._timeout:g}s")
+        finally:
+            # Abandoned iteration leaves tasks in flight; those workers cannot be reused safely.
+            for worker in list(running):
+                self._replace(worker, running, "abandoned")
+
+    def _acquire(self) -> _Worker:
+        if self._idle:
+            return self._idle.pop()
+        self._size += 1
+        return _Worker(self._context, self._initializer, self._initargs, self._memory_limit_mb)
+
+    def _replace(self, worker: _Worker, running: Dict[_Worker, Tuple[int, float]], reason: str) -> str:
+        """Kill a worker whose task cannot complete; a fresh one is started on demand."""
+        index, _ = running.pop(worker)
+        worker.kill()
+        self._size -= 1
+        if reason != "abandoned":
+            LOGGER.warning("Task %d failed: %s; replacing its worker", index, reason)
+        return reason
+
+    def close(self) -> None:
+        for worker in self._idle:
+            worker.stop()
+        self._idle.clear()
+        self._size = 0
+
+    def __enter__(self) -> "WorkerPool":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
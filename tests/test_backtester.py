@@ -0,0 +1,102 @@
+from dataclasses import dataclass
+
+import numpy as np
+import pytest
+
+from src.backtester import Backtester, MetricsAccumulator, iter_chunks
+from src.bars import SIGNAL_DTYPE, stack_signals
+from src.strategies import HoldStrategy, MomentumStrategy, SmaCrossStrategy, Strategy
+
+
+@dataclass
+class ConstantStrategy(Strategy):
+    """Hold a fixed, possibly fractional, position on every bar."""
+
+    position: float = 0.5
+
+    def generate_signals(self, prices):
+        return np.full(len(prices), self.position)
+
+    def update(self, close):
+        return self.position
+
+STRATEGIES = [
+    SmaCrossStrategy(),
+    SmaCrossStrategy(5, 20),
+    SmaCrossStrategy(30, 10),
+    MomentumStrategy(),
+    MomentumStrategy(7, -0.01),
+    HoldStrategy(),
+]
+
+
+def random_walk(bars, seed=0):
+    rng = np.random.default_rng(seed)
+    return (100 * np.cumprod(1 + rng.normal(0.0005, 0.03, bars))).tolist()
+
+
+SERIES = {
+    "random": random_walk(500),
+    "flat": [100.0] * 200,
+    "flat_after_trend": [100 + 0.37 * idx for idx in range(60)] + [50.0] * 100,
+    "zero_prices": [10.0, 0.0, 0.0, 12.0, 11.0] * 20 + random_walk(100, seed=1),
+    "short": random_walk(15, seed=2),
+    "single": [100.0],
+    "empty": [],
+}
+
+
+@pytest.mark.parametrize("closes", SERIES.values(), ids=SERIES.keys())
+def test_vectorized_engine_matches_scalar_reference(closes):
+    Backtester().cross_check(STRATEGIES, closes)
+
+
+@pytest.mark.parametrize("closes", [SERIES["random"], np.asarray(SERIES["random"])], ids=["list", "array"])
+def test_cross_check_with_risk_free_rate_and_hourly_bars(closes):
+    Backtester(risk_free_rate=0.02, periods_per_year=24 * 365).cross_check(STRATEGIES, closes)
+
+
+def test_run_streaming_matches_run_batch():
+    backtester = Backtester()
+    closes = np.asarray(SERIES["random"])
+    signals = np.asarray(SmaCrossStrategy(5, 20).generate_signals(closes))
+    chunks = [(closes[start : start + 64], signals[start : start + 64]) for start in range(0, len(closes), 64)]
+    streamed = backtester.run_streaming(chunks)
+    batch = backtester.run_batch(closes, signals)[0]
+    for name in ("total_return", "annualized_return", "sharpe_ratio", "max_drawdown"):
+        assert getattr(streamed, name) == pytest.approx(getattr(batch, name), rel=1e-9, abs=1e-12)
+
+
+@pytest.mark.parametrize("closes", SERIES.values(), ids=SERIES.keys())
+def test_per_bar_updates_match_run_batch(closes):
+    backtester = Backtester(risk_free_rate=0.01)
+    prices = np.asarray(closes, dtype=np.float64)
+    for strategy in STRATEGIES + [ConstantStrategy(0.5)]:
+        signals = np.asarray(strategy.generate_signals(closes), dtype=np.float64)
+        batch = backtester.run_batch(prices, signals)[0]
+        accumulator = MetricsAccumulator(backtester.risk_free_rate, backtester.periods_per_year)
+        for r in signals * backtester.compute_returns(prices):
+            accumulator.update(float(r))
+        results = [accumulator.result()]
+        results += [backtester.run_streaming(iter_chunks(prices, signals, size)) for size in (1, 7)]
+        for result in results:
+            for name in ("total_return", "annualized_return", "sharpe_ratio", "max_drawdown"):
+                expected = getattr(batch, name)
+                assert getattr(result, name) == pytest.approx(expected, rel=1e-9, abs=1e-12), (strategy, name)
+
+
+def test_fractional_signals_are_not_truncated():
+    closes = SERIES["random"]
+    strategies = [ConstantStrategy(0.5), SmaCrossStrategy(5, 20)]
+    Backtester().cross_check(strategies, closes)
+    half = Backtester().run_many(strategies, closes)[0]
+    assert half.total_return != 0.0
+    matrix = ConstantStrategy(0.5).generate_signal_matrix(np.array([closes[:50], closes[50:100]]))
+    assert matrix.dtype == np.float64 and np.all(matrix == 0.5)
+
+
+def test_integer_signals_stack_compactly():
+    assert stack_signals([[1, 0, -1], np.array([0, 1, 1], dtype=SIGNAL_DTYPE)], 3).dtype == SIGNAL_DTYPE
+    assert stack_signals([[300, 0, 0]], 3).dtype == np.float64
+    with pytest.raises(ValueError):
+        stack_signals([[1, 0]], 3)
@@ -0,0 +1,97 @@
+import dataclasses
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+import requests
+
+from fakes import FakeKlinesServer, synthetic_klines
+from src.candle_store import CANDLE_DTYPE, CandleStore, candles_from_klines
+from src.config import CONFIG
+from src.data import HistoricalDataClient
+from src.http_client import build_session
+
+DAY_MS = 86_400_000
+
+
+def recent_klines(count, seed=0):
+    """Daily klines whose last bar is the one currently forming."""
+    today = int(time.time() * 1000) // DAY_MS * DAY_MS
+    return synthetic_klines(count, start_ms=today - (count - 1) * DAY_MS, seed=seed)
+
+
+@pytest.fixture
+def store(tmp_path):
+    return CandleStore(tmp_path / "candles")
+
+
+def test_append_skips_stored_and_rejects_unsorted(store):
+    candles = candles_from_klines(synthetic_klines(10))
+    assert store.append("BTCUSDT", "1d", candles[:6]) == 6
+    assert store.append("BTCUSDT", "1d", candles[3:]) == 4
+    np.testing.assert_array_equal(store.load("BTCUSDT", "1d"), candles)
+    with pytest.raises(ValueError):
+        store.append("BTCUSDT", "1d", candles_from_klines(synthetic_klines(20))[[15, 12]])
+
+
+def test_torn_record_is_discarded(store):
+    candles = candles_from_klines(synthetic_klines(5))
+    store.append("BTCUSDT", "1d", candles[:3])
+    with store.path_for("BTCUSDT", "1d").open("ab") as handle:
+        handle.write(candles[3:4].tobytes()[: CANDLE_DTYPE.itemsize // 2])
+    assert store.append("BTCUSDT", "1d", candles) == 2
+    np.testing.assert_array_equal(store.load("BTCUSDT", "1d"), candles)
+
+
+def test_concurrent_appends_do_not_duplicate_candles(store):
+    candles = candles_from_klines(synthetic_klines(500))
+    chunks = [candles[: end + 50] for end in range(0, 460, 10)] * 4
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        written = sum(pool.map(lambda chunk: store.append("BTCUSDT", "1d", chunk), chunks))
+    assert written == len(candles)
+    np.testing.assert_array_equal(store.load("BTCUSDT", "1d"), candles)
+
+
+def page_queries(requests_log):
+    return [(query["startTime"], query["endTime"]) for _, _, query in requests_log]
+
+
+def test_incremental_sync_downloads_only_new_candles(store):
+    rows = recent_klines(400)
+    with FakeKlinesServer(rows[:-10]) as server:
+        client = HistoricalDataClient(session=requests.Session(), store=store, base_url=server.klines_url)
+        first = client.fetch_candles("BTCUSDT", "1d")
+        server.klines = rows
+        before = len(server.requests)
+        second = client.fetch_candles("BTCUSDT", "1d")
+        pages = page_queries(server.requests)
+
+    assert len(first) == 390
+    # Today's bar is still forming and is not persisted.
+    assert len(second) == 399
+    # Only the page holding the new candles is fetched again, under the URL of the first sync.
+    assert len(pages) - before == 1
+    assert pages[-1] in pages[:before]
+    np.testing.assert_array_equal(second, candles_from_klines(rows[:-1]))
+
+
+def test_recorded_sync_replays_with_and_without_stored_candles(tmp_path):
+    def sync(mode, store, base_url):
+        config = dataclasses.replace(CONFIG.http, cache_path=str(tmp_path / "http.sqlite3"), mode=mode)
+        session = build_session("binance_klines", config=config)
+        return HistoricalDataClient(session=session, store=store, base_url=base_url).fetch_candles("BTCUSDT", "1d")
+
+    rows = recent_klines(400)
+    store = CandleStore(tmp_path / "candles")
+    with FakeKlinesServer(rows[:-10]) as server:
+        recorded = sync("record", store, server.klines_url)
+        server.klines = rows
+        rerun = sync("record", store, server.klines_url)
+        base_url = server.klines_url
+
+    # The server is gone: replay serves the recorded pages whether or not the candles are stored.
+    np.testing.assert_array_equal(sync("replay", store, base_url), rerun)
+    np.testing.assert_array_equal(sync("replay", CandleStore(tmp_path / "fresh"), base_url), rerun)
+    assert len(rerun) == len(recorded) + 9
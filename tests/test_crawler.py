@@ -0,0 +1,90 @@
+import dataclasses
+import json
+import time
+
+import pytest
+import requests
+
+from fakes import FakeGitHubSearchServer, synthetic_repositories
+from src import crawler
+from src.config import CONFIG
+from src.crawler import ConditionalCache, GitHubModelCrawler
+
+
+@pytest.fixture
+def github_config(monkeypatch):
+    def configure(**overrides):
+        settings = {
+            "query": "sma",
+            "extra_queries": ("momentum",),
+            "per_page": 10,
+            "max_pages": 5,
+            "max_concurrent_requests": 2,
+            "etag_cache_path": None,
+            "api_token": None,
+        }
+        github = dataclasses.replace(CONFIG.github, **{**settings, **overrides})
+        monkeypatch.setattr(crawler, "CONFIG", dataclasses.replace(CONFIG, github=github))
+
+    configure()
+    return configure
+
+
+def make_crawler(server, cache):
+    return GitHubModelCrawler(session=requests.Session(), search_url=server.search_url, cache=cache)
+
+
+def test_queries_and_pages_are_merged_and_deduplicated(github_config):
+    items = synthetic_repositories(40)
+    # The queries overlap on items 20-29 and each spans several pages.
+    queries = {"sma": items[:30], "momentum": items[20:]}
+    with FakeGitHubSearchServer(items, queries=queries) as server:
+        models = make_crawler(server, ConditionalCache(None)).fetch_recent_models()
+        pages = sorted((query["q"], int(query["page"])) for _, _, query in server.requests)
+
+    assert sorted(model["id"] for model in models) == sorted(item["id"] for item in items)
+    assert pages == [("momentum", page) for page in (1, 2)] + [("sma", page) for page in (1, 2, 3)]
+    assert all(model["pushed_at"].endswith("+00:00") for model in models)
+
+
+def test_second_run_revalidates_without_spending_quota(github_config, tmp_path):
+    path = tmp_path / "etags.json"
+    with FakeGitHubSearchServer(synthetic_repositories(25)) as server:
+        first = make_crawler(server, ConditionalCache(path)).fetch_recent_models()
+        spent = server.rate_limit - server.remaining
+        second = make_crawler(server, ConditionalCache(path)).fetch_recent_models()
+
+    assert spent == 6
+    # Every page came back 304 and was served from the persisted cache.
+    assert server.remaining == server.rate_limit - spent
+    assert len(server.requests) == 12
+    assert second == first
+
+
+def test_rate_limit_waits_for_reset(github_config):
+    github_config(extra_queries=())
+    with FakeGitHubSearchServer(synthetic_repositories(50), rate_limit=3, reset_after=0.5) as server:
+        began = time.time()
+        models = make_crawler(server, ConditionalCache(None)).fetch_recent_models()
+        elapsed = time.time() - began
+
+    assert len(models) == 50
+    # Five pages on a quota of three: the limiter holds back until the window resets.
+    assert len(server.requests) == 5
+    assert elapsed >= 0.5
+
+
+@pytest.mark.parametrize(
+    "content",
+    [None, b"", b'{"sma#1": {"etag"', b"\xff\xfe\x00", b"[1, 2]", json.dumps({"sma#1": "etag"}).encode()],
+    ids=["missing", "empty", "truncated", "binary", "list", "bad-entry"],
+)
+def test_missing_or_corrupt_etag_cache_is_tolerated(github_config, tmp_path, content):
+    path = tmp_path / "etags.json"
+    if content is not None:
+        path.write_bytes(content)
+    with FakeGitHubSearchServer(synthetic_repositories(15)) as server:
+        models = make_crawler(server, ConditionalCache(path)).fetch_recent_models()
+
+    assert len(models) == 15
+    assert set(json.loads(path.read_text())) == {"sma#1", "sma#2", "momentum#1", "momentum#2"}
@@ -0,0 +1,133 @@
+import pytest
+import requests
+
+from fakes import FakeKlinesServer, synthetic_klines
+from src import downloader
+from src.downloader import KlineDownloader, WeightBudget
+
+DAY_MS = 86_400_000
+START_MS = 1_577_836_800_000
+
+
+NOW = 1_700_000_000.0
+NEXT_MINUTE = 1_700_000_040.0
+
+
+class FakeClock:
+    """Stands in for the ``time`` module; ``sleep`` advances ``time`` instead of blocking."""
+
+    def __init__(self, now=NOW):
+        self.now = now
+        self.sleeps = []
+
+    def time(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(downloader, "time", fake)
+    return fake
+
+
+def make_downloader(server, **kwargs):
+    kwargs.setdefault("max_workers", 1)
+    kwargs.setdefault("max_retries", 3)
+    kwargs.setdefault("weight_limit", 1200)
+    return KlineDownloader(server.klines_url, session=requests.Session(), **kwargs)
+
+
+def open_times(rows):
+    return [int(row[0]) for row in rows]
+
+
+def test_download_spans_pages_in_order():
+    rows = synthetic_klines(2500, start_ms=START_MS)
+    with FakeKlinesServer(rows) as server:
+        result = make_downloader(server, max_workers=4).download("BTCUSDT", "1d", START_MS, rows[-1][0])
+        pages = len(server.requests)
+
+    assert open_times(result) == open_times(rows)
+    assert pages == 3
+
+
+@pytest.mark.parametrize("status", [429, 418])
+def test_rate_limit_waits_for_retry_after(clock, status):
+    rows = synthetic_klines(100, start_ms=START_MS)
+    with FakeKlinesServer(rows, errors=[(status, {"Retry-After": "7"})]) as server:
+        result = make_downloader(server, backoff_seconds=0.5).download("BTCUSDT", "1d", START_MS, rows[-1][0])
+        attempts = len(server.requests)
+
+    assert open_times(result) == open_times(rows)
+    assert attempts == 2
+    # The backoff sleep runs first; the budget then holds the retry until Retry-After has passed.
+    assert clock.sleeps[0] == 0.5
+    assert sum(clock.sleeps) >= 7
+
+
+def test_server_errors_are_retried_with_backoff(clock):
+    rows = synthetic_klines(100, start_ms=START_MS)
+    with FakeKlinesServer(rows, failures=2) as server:
+        result = make_downloader(server, backoff_seconds=0.5).download("BTCUSDT", "1d", START_MS, rows[-1][0])
+
+    assert open_times(result) == open_times(rows)
+    assert clock.sleeps == [0.5, 1.0]
+
+
+def test_server_errors_beyond_retries_raise(clock):
+    rows = synthetic_klines(100, start_ms=START_MS)
+    with FakeKlinesServer(rows, failures=5) as server:
+        with pytest.raises(requests.HTTPError):
+            make_downloader(server, max_retries=2).download("BTCUSDT", "1d", START_MS, rows[-1][0])
+        assert len(server.requests) == 3
+
+
+def test_used_weight_header_throttles_until_next_minute(clock):
+    # Each request spends 2 of the 5 weight; the server's running total soon exceeds the limit.
+    rows = synthetic_klines(4000, start_ms=START_MS)
+    with FakeKlinesServer(rows) as server:
+        server.used_weight = 2
+        result = make_downloader(server, weight_limit=5).download("BTCUSDT", "1d", START_MS, rows[-1][0])
+        pages = len(server.requests)
+
+    assert open_times(result) == open_times(rows)
+    assert pages == 5
+    # Weight is reset each minute, so the download crossed at least one minute boundary.
+    assert clock.sleeps
+    assert clock.now >= NEXT_MINUTE
+
+
+def test_weight_budget_blocks_when_the_server_reports_the_limit(clock):
+    budget = WeightBudget(10)
+    response = requests.Response()
+    response.status_code = 200
+    response.headers["X-MBX-USED-WEIGHT-1M"] = "9"
+    budget.observe(response)
+
+    budget.acquire(2)
+
+    assert clock.sleeps == [NEXT_MINUTE - NOW]
+    budget.acquire(8)
+    assert clock.sleeps == [NEXT_MINUTE - NOW]
+
+
+class OverlappingKlinesServer(FakeKlinesServer):
+    """Ignore ``endTime`` so every page also returns the start of the next one, plus a repeat."""
+
+    def handle(self, method, path, query, headers):
+        status, headers, rows = super().handle(method, path, {**query, "endTime": str(2**62)}, headers)
+        return status, headers, rows + rows[-1:] if rows else rows
+
+
+def test_overlapping_pages_are_deduplicated():
+    rows = synthetic_klines(2500, start_ms=START_MS)
+    start, end = rows[10][0], rows[2400][0]
+    with OverlappingKlinesServer(rows) as server:
+        result = make_downloader(server, max_workers=3).download("BTCUSDT", "1d", start, end)
+
+    assert open_times(result) == open_times(rows[10:2401])
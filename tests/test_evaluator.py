@@ -0,0 +1,92 @@
+import dataclasses
+
+import numpy as np
+import pytest
+
+from fakes import synthetic_klines
+from src import evaluator
+from src.backtester import Backtester
+from src.candle_store import candles_from_klines
+from src.config import CONFIG
+from src.evaluator import ModelEvaluator
+from src.model_factory import ModelCandidate
+from src.strategies import MomentumStrategy, SmaCrossStrategy
+
+
+def patch_config(monkeypatch, **sections):
+    monkeypatch.setattr(evaluator, "CONFIG", dataclasses.replace(CONFIG, **sections))
+
+
+def test_screening_scores_recent_bars_with_full_history_signals(monkeypatch):
+    patch_config(
+        monkeypatch,
+        evaluation=dataclasses.replace(CONFIG.evaluation, result_cache_path=None),
+        # A margin no candidate can clear rejects everyone on the first rung.
+        screening=dataclasses.replace(CONFIG.screening, enabled=True, rungs=(60, 365), sharpe_margin=-100.0),
+    )
+    rng = np.random.default_rng(4)
+    closes = 100 * np.cumprod(1 + rng.normal(0.001, 0.02, 500))
+    strategies = [SmaCrossStrategy(10, 30), MomentumStrategy(14, 0.0)]
+    candidates = [ModelCandidate({"id": index}, strategy) for index, strategy in enumerate(strategies)]
+
+    outcomes = ModelEvaluator(data_client=object(), backtester=Backtester()).evaluate_on(candidates, closes)
+
+    backtester = Backtester()
+    for outcome, strategy in zip(outcomes, strategies):
+        signals = np.asarray(strategy.generate_signals(closes))
+        returns = (signals * backtester.compute_returns(closes))[-60:]
+        expected = [float(value[0]) for value in backtester.metric_arrays(returns)]
+        assert outcome.screened_bars == 60
+        assert not outcome.eligible_for_live
+        assert list(dataclasses.astuple(outcome.result)) == expected
+        # Restarting on the window alone would leave the first slow_window bars flat.
+        assert outcome.result != backtester.run_many([strategy], closes[-60:])[0]
+
+
+class PanelClient:
+    def __init__(self, candles):
+        self.candles = candles
+
+    def fetch_candles(self, symbol=None, interval=None):
+        return self.candles[symbol]
+
+
+def test_configured_panel_scores_later_listed_symbols_like_single_symbol_runs(monkeypatch):
+    candles = {
+        "BTCUSDT": candles_from_klines(synthetic_klines(400, seed=7)),
+        # Listed 150 bars after the first symbol.
+        "NEWUSDT": candles_from_klines(synthetic_klines(400, seed=8))[150:],
+    }
+    patch_config(
+        monkeypatch,
+        evaluation=dataclasses.replace(CONFIG.evaluation, result_cache_path=None),
+        panel=dataclasses.replace(CONFIG.panel, symbols=tuple(candles)),
+    )
+    strategies = [SmaCrossStrategy(5, 20), MomentumStrategy(7, -0.01)]
+    candidates = [ModelCandidate({"id": index}, strategy) for index, strategy in enumerate(strategies)]
+
+    outcomes = ModelEvaluator(data_client=PanelClient(candles), backtester=Backtester()).evaluate(candidates)
+
+    for symbol, rows in candles.items():
+        expected = Backtester().run_many(strategies, rows["close"])
+        for outcome, result in zip(outcomes, expected):
+            for name in ("total_return", "annualized_return", "sharpe_ratio", "max_drawdown"):
+                actual = getattr(outcome.symbols[symbol], name)
+                assert actual == pytest.approx(getattr(result, name), rel=1e-9, abs=1e-12)
+
+
+def test_panel_evaluation_warns_about_bypassed_settings(monkeypatch, caplog):
+    candles = {"BTCUSDT": candles_from_klines(synthetic_klines(200, seed=7))}
+    patch_config(
+        monkeypatch,
+        evaluation=dataclasses.replace(CONFIG.evaluation, result_cache_path=None, timeframes=("1w",)),
+        screening=dataclasses.replace(CONFIG.screening, enabled=True),
+        panel=dataclasses.replace(CONFIG.panel, symbols=tuple(candles)),
+    )
+    candidates = [ModelCandidate({"id": 0}, SmaCrossStrategy(5, 20))]
+
+    with caplog.at_level("WARNING", logger=evaluator.LOGGER.name):
+        outcomes = ModelEvaluator(data_client=PanelClient(candles), backtester=Backtester()).evaluate(candidates)
+
+    assert outcomes[0].timeframes == {} and outcomes[0].screened_bars is None
+    assert "ignores the enabled timeframes, screening settings" in caplog.text
@@ -0,0 +1,151 @@
+import json
+
+import pytest
+import requests
+
+from fakes import FakeServer
+from src import http_client
+from src.config import HttpConfig
+from src.http_client import CachingAdapter, ReplayMiss, ResponseCache, build_session
+
+TTL = 900.0
+
+
+class Clock:
+    """Stands in for the ``time`` module of ``http_client``."""
+
+    def __init__(self, now=1_700_000_000.0):
+        self.now = now
+
+    def time(self):
+        return self.now
+
+
+class VersionedServer(FakeServer):
+    """Serve ``/resource`` with validators for its current ``version``; accept POSTs anywhere."""
+
+    def __init__(self):
+        super().__init__()
+        self.version = 1
+        self.conditional = []
+
+    def validators(self):
+        return {"ETag": f'"v{self.version}"', "Last-Modified": f"Mon, 0{self.version} Jan 2024 00:00:00 GMT"}
+
+    def handle(self, method, path, query, headers):
+        if method == "POST":
+            return 200, {}, {"accepted": True}
+        validators = self.validators()
+        sent = {name: headers.get(name.lower()) for name in ("If-None-Match", "If-Modified-Since")}
+        self.conditional.append(sent)
+        if sent["If-None-Match"] == validators["ETag"]:
+            return 304, validators, None
+        return 200, validators, {"version": self.version, "path": path, **query}
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = Clock()
+    monkeypatch.setattr(http_client, "time", fake)
+    return fake
+
+
+@pytest.fixture
+def server():
+    with VersionedServer() as fake:
+        yield fake
+
+
+def cached_session(tmp_path, mode="live", max_bytes=1 << 20):
+    cache = ResponseCache(tmp_path / "http.sqlite3", max_bytes)
+    session = requests.Session()
+    session.mount("http://", CachingAdapter(cache, "test", mode, TTL))
+    return session, cache
+
+
+def test_fresh_entries_are_served_without_a_request(clock, server, tmp_path):
+    session, _ = cached_session(tmp_path)
+    first = session.get(f"{server.url}/resource", params={"page": 1})
+    clock.now += TTL - 1
+    second = session.get(f"{server.url}/resource", params={"page": 1})
+    assert len(server.requests) == 1
+    assert second.headers["X-Cache"] == "HIT"
+    assert second.json() == first.json() == {"version": 1, "path": "/resource", "page": "1"}
+    # A different query is a different entry.
+    session.get(f"{server.url}/resource", params={"page": 2})
+    assert len(server.requests) == 2
+
+
+def test_stale_entries_are_revalidated(clock, server, tmp_path):
+    session, cache = cached_session(tmp_path)
+    url = f"{server.url}/resource"
+    session.get(url)
+    clock.now += TTL + 1
+    revalidated = session.get(url)
+    assert server.conditional[-1] == {"If-None-Match": '"v1"', "If-Modified-Since": "Mon, 01 Jan 2024 00:00:00 GMT"}
+    assert revalidated.status_code == 200
+    assert revalidated.headers["X-Cache"] == "REVALIDATED"
+    assert revalidated.json()["version"] == 1
+    # The 304 restarted the TTL.
+    assert cache.get(cache.key(url))["stored_at"] == clock.now
+    clock.now += TTL - 1
+    assert session.get(url).headers["X-Cache"] == "HIT"
+    assert len(server.requests) == 2
+
+    server.version = 2
+    clock.now += 2
+    changed = session.get(url)
+    assert changed.json()["version"] == 2
+    assert "X-Cache" not in changed.headers
+    assert cache.get(cache.key(url))["headers"]["ETag"] == '"v2"'
+
+
+def test_least_recently_used_entries_are_evicted(clock, server, tmp_path):
+    # Each body is 37 bytes, so two entries fit within the budget and a third does not.
+    path = tmp_path / "http.sqlite3"
+    config = HttpConfig(cache_path=str(path), cache_max_mb=100 / (1024 * 1024), mode="live")
+    session = build_session("test", config=config)
+    a, b, c = (f"{server.url}/resource/{name}" for name in "abc")
+    for url in (a, b, a, c):
+        session.get(url)
+        clock.now += 1
+    cache = http_client._CACHES.pop(path)
+    try:
+        assert len(cache) == 2
+        assert cache.get(cache.key(b)) is None
+        assert cache.get(cache.key(a)) is not None
+        assert len(server.requests) == 3
+    finally:
+        cache.close()
+
+
+def test_record_mode_refreshes_every_entry(clock, server, tmp_path):
+    session, cache = cached_session(tmp_path, mode="record")
+    url = f"{server.url}/resource"
+    session.get(url)
+    server.version = 2
+    refreshed = session.get(url)
+    assert len(server.requests) == 2
+    assert refreshed.json()["version"] == 2
+    # Record mode never sends validators; it always stores a full response.
+    assert server.conditional[-1] == {"If-None-Match": None, "If-Modified-Since": None}
+    assert json.loads(cache.get(cache.key(url))["body"])["version"] == 2
+
+    replay, _ = cached_session(tmp_path, mode="replay")
+    assert replay.get(url).json()["version"] == 2
+    with pytest.raises(ReplayMiss):
+        replay.get(f"{server.url}/other")
+
+
+def test_posts_and_signed_order_requests_are_never_cached(clock, server, tmp_path):
+    session, cache = cached_session(tmp_path)
+    for _ in range(2):
+        assert session.post(f"{server.url}/api/v3/order", data={"symbol": "BTCUSDT"}).json() == {"accepted": True}
+        session.get(f"{server.url}/api/v3/order", params={"origClientOrderId": "cm1", "signature": "abc"})
+    assert len(server.requests) == 4
+    assert len(cache) == 0
+    replay, _ = cached_session(tmp_path, mode="replay")
+    with pytest.raises(ReplayMiss):
+        replay.post(f"{server.url}/api/v3/order")
+    with pytest.raises(ReplayMiss):
+        replay.get(f"{server.url}/api/v3/order", params={"signature": "abc"})
@@ -0,0 +1,24 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from src import indicators
+
+
+def test_cache_is_consistent_under_concurrent_lookups():
+    cache = indicators.IndicatorCache(max_entries=8)
+    rng = np.random.default_rng(0)
+    series = [100 + rng.normal(0, 1, 500).cumsum() for _ in range(4)]
+    tasks = [(series[idx % 4], 2 + idx % 13) for idx in range(2000)]
+
+    def lookup(task):
+        prices, window = task
+        return window, prices, indicators.sma(prices, window, cache=cache)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(lookup, tasks))
+    for window, prices, values in results:
+        np.testing.assert_array_equal(values, indicators._sma(prices, window))
+    stats = cache.stats()
+    assert stats["entries"] == 8
+    assert stats["hits"] + stats["misses"] == len(tasks)
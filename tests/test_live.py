@@ -0,0 +1,65 @@
+import dataclasses
+import json
+
+import numpy as np
+import pytest
+
+from fakes import synthetic_klines
+from src.live import StrategyBook
+from src.strategies import HoldStrategy, MomentumStrategy, SmaCrossStrategy
+
+STRATEGIES = [
+    SmaCrossStrategy(5, 20),
+    SmaCrossStrategy(30, 10),
+    MomentumStrategy(14, 0.02),
+    MomentumStrategy(7, -0.01),
+    HoldStrategy(),
+]
+
+
+def fresh_book():
+    return StrategyBook({str(index): dataclasses.replace(strategy) for index, strategy in enumerate(STRATEGIES)})
+
+
+@pytest.fixture
+def kline_file(tmp_path):
+    rows = synthetic_klines(400, seed=3)
+    path = tmp_path / "klines.jsonl"
+    with path.open("w", encoding="utf-8") as handle:
+        for row in rows:
+            # A still-forming websocket update precedes every closed bar and must be skipped.
+            handle.write(json.dumps({"e": "kline", "k": {"t": row[0], "c": "1.0", "x": False}}) + "\n")
+            handle.write(json.dumps(row) + "\n")
+    return path, np.array([float(row[4]) for row in rows])
+
+
+@pytest.mark.parametrize("strategy", STRATEGIES, ids=repr)
+def test_update_matches_generate_signals(strategy):
+    closes = np.array([float(row[4]) for row in synthetic_klines(300, seed=1)])
+    strategy = dataclasses.replace(strategy)
+    streamed = [strategy.update(close) for close in closes]
+    assert streamed == np.asarray(strategy.generate_signals(closes)).tolist()
+
+
+def test_replay_matches_batch_signals(kline_file):
+    path, closes = kline_file
+    book = fresh_book()
+    signals = book.replay(path)
+    for key, strategy in book.strategies.items():
+        assert signals[key] == np.asarray(strategy.generate_signals(closes))[-1]
+
+
+def test_checkpoint_resumes_replay(kline_file, tmp_path):
+    path, closes = kline_file
+    lines = path.read_text(encoding="utf-8").splitlines()
+    head = tmp_path / "head.jsonl"
+    head.write_text("\n".join(lines[:300]) + "\n", encoding="utf-8")
+
+    book = fresh_book()
+    book.replay(head)
+    book.checkpoint(tmp_path / "book.json")
+    restored = StrategyBook.restore(tmp_path / "book.json")
+    # Replaying the overlap again is ignored; only the new bars advance the strategies.
+    restored.replay(path)
+    for key, strategy in restored.strategies.items():
+        assert restored.signals[key] == np.asarray(strategy.generate_signals(closes))[-1]
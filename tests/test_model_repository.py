@@ -0,0 +1,24 @@
+import json
+
+import pytest
+
+from src.model_repository import ModelRepository
+
+MODELS = {
+    "1": {"id": 1, "full_name": "a/one", "pushed_at": "2024-01-02T00:00:00Z", "topics": ["Crypto"]},
+    "2": {"id": 2, "full_name": "b/two", "pushed_at": "2024-01-01T00:00:00Z", "topics": []},
+}
+
+
+@pytest.mark.parametrize("name", ["models.json", "models.sqlite3"])
+def test_legacy_json_is_migrated_to_sqlite(tmp_path, name):
+    legacy = tmp_path / "models.json"
+    legacy.write_text(json.dumps(MODELS), encoding="utf-8")
+    repository = ModelRepository(tmp_path / name)
+    try:
+        assert repository.path == tmp_path / "models.sqlite3"
+        assert len(repository) == 2
+        assert [model["id"] for model in repository.query(topic="crypto")] == [1]
+    finally:
+        repository.close()
+    assert json.loads(legacy.read_text(encoding="utf-8")) == MODELS
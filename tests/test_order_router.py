@@ -0,0 +1,103 @@
+import dataclasses
+import time
+
+import pytest
+
+from fakes import FakeBinanceServer
+from src import order_router
+from src.config import CONFIG
+from src.order_router import OrderRouter, OrderStatusUnknown
+
+SECRET = "test-secret"
+
+
+class LookupDownServer(FakeBinanceServer):
+    """Accept orders but fail every order lookup with a 5xx."""
+
+    def handle(self, method, path, query, headers):
+        if method == "GET" and path == "/api/v3/order":
+            return 503, {}, {"code": -1001, "msg": "Internal error; unable to process your request."}
+        return super().handle(method, path, query, headers)
+
+
+class RejectFirstOrderServer(FakeBinanceServer):
+    """Fail the first order with a 5xx before the exchange records it."""
+
+    rejected = False
+
+    def handle(self, method, path, query, headers):
+        if method == "POST" and path == "/api/v3/order" and not self.rejected:
+            self.rejected = True
+            return 503, {}, {"code": -1001, "msg": "Internal error; unable to process your request."}
+        return super().handle(method, path, query, headers)
+
+
+class RateLimitFirstOrderServer(FakeBinanceServer):
+    """Reject the first order with ``status`` and a one second ``Retry-After``."""
+
+    def __init__(self, api_secret, status):
+        super().__init__(api_secret)
+        self.status = status
+        self.limited = False
+
+    def handle(self, method, path, query, headers):
+        if method == "POST" and path == "/api/v3/order" and not self.limited:
+            self.limited = True
+            return self.status, {"Retry-After": "1"}, {"code": -1015, "msg": "Too many new orders."}
+        return super().handle(method, path, query, headers)
+
+
+@pytest.fixture
+def router_config(monkeypatch):
+    binance = dataclasses.replace(
+        CONFIG.binance, api_key="key", api_secret=SECRET, order_timeout=0.2, max_order_retries=2
+    )
+    monkeypatch.setattr(order_router, "CONFIG", dataclasses.replace(CONFIG, binance=binance))
+
+
+def submit(server, order_id):
+    router = OrderRouter(base_url=server.url)
+    return router.submit("BTCUSDT", "BUY", 0.001, order_id)
+
+
+def test_timed_out_order_is_found_instead_of_resubmitted(router_config):
+    with FakeBinanceServer(SECRET, hang_first=1, hang_seconds=0.5) as server:
+        order = submit(server, "cm-timeout")
+    assert order["clientOrderId"] == "cm-timeout"
+    assert server.fills == 1
+
+
+def test_unknown_order_status_fails_without_resubmitting(router_config):
+    with LookupDownServer(SECRET, hang_first=1, hang_seconds=0.5) as server:
+        with pytest.raises(OrderStatusUnknown):
+            submit(server, "cm-unknown")
+        posts = [query for method, path, query in server.requests if method == "POST"]
+    assert server.fills == 1
+    assert len(posts) == 1
+
+
+def test_order_missing_on_the_exchange_is_resubmitted(router_config):
+    with RejectFirstOrderServer(SECRET) as server:
+        order = submit(server, "cm-rejected")
+        posts = [query for method, path, query in server.requests if method == "POST"]
+    assert order["status"] == "FILLED"
+    assert len(posts) == 2
+    assert server.fills == 1
+
+
+@pytest.mark.parametrize("status", [429, 418])
+def test_rate_limited_order_waits_for_retry_after(router_config, status):
+    with RateLimitFirstOrderServer(SECRET, status) as server:
+        began = time.monotonic()
+        order = submit(server, "cm-limited")
+        elapsed = time.monotonic() - began
+        calls = [
+            (method, query.get("newClientOrderId") or query.get("origClientOrderId"))
+            for method, path, query in server.requests
+            if path == "/api/v3/order"
+        ]
+    assert order["status"] == "FILLED"
+    assert server.fills == 1
+    # The same id is looked up before it is resubmitted.
+    assert calls == [("POST", "cm-limited"), ("GET", "cm-limited"), ("POST", "cm-limited")]
+    assert elapsed >= 1.0
@@ -0,0 +1,39 @@
+from src.metrics import METRICS
+from src.pipeline import DailyPipeline
+
+
+class _Crawler:
+    def fetch_recent_models(self):
+        return [{"id": 1, "full_name": "a/one"}]
+
+
+class _Evaluator:
+    def load_closes(self):
+        return []
+
+    def evaluate(self, candidates):
+        return []
+
+    def evaluate_on(self, candidates, closes):
+        return []
+
+    def close(self):
+        pass
+
+
+def test_counters_stay_monotonic_across_runs(tmp_path, monkeypatch):
+    summaries = []
+    monkeypatch.setattr(METRICS, "enabled", True)
+    monkeypatch.setattr(METRICS, "export", lambda **fields: summaries.append(METRICS.summary()))
+    pipeline = DailyPipeline(tmp_path / "models.sqlite3", crawler=_Crawler(), evaluator=_Evaluator(), trader=object())
+    for _ in range(2):
+        assert pipeline.run() == []
+
+    def fetched(summary):
+        return next(
+            counter["value"]
+            for counter in summary["counters"]
+            if counter["name"] == "repositories_total" and counter["labels"] == {"kind": "fetched"}
+        )
+
+    assert fetched(summaries[1]) == fetched(summaries[0]) + 1
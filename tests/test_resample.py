@@ -0,0 +1,107 @@
+from collections import OrderedDict
+from datetime import datetime, timezone
+
+import numpy as np
+import pytest
+
+from fakes import synthetic_klines
+from src.candle_store import CANDLE_DTYPE, candles_from_klines
+from src.resample import Resampler, bucket_bounds, bucket_spec, resample
+
+HOUR_MS = 3_600_000
+DAY_MS = 86_400_000
+# 2020-01-01 00:00 UTC, a Wednesday.
+START_MS = 1_577_836_800_000
+
+
+def hourly_candles(count, seed=0, missing=0):
+    candles = candles_from_klines(synthetic_klines(count, interval_ms=HOUR_MS, start_ms=START_MS, seed=seed))
+    if missing:
+        keep = np.ones(count, dtype=bool)
+        keep[np.random.default_rng(seed).choice(count, missing, replace=False)] = False
+        candles = candles[keep]
+    return candles
+
+
+def naive_resample(candles, width, offset):
+    groups = OrderedDict()
+    for row in candles:
+        groups.setdefault((int(row["open_time"]) - offset) // width, []).append(row)
+    rows = [
+        (
+            key * width + offset,
+            rows[0]["open"],
+            max(row["high"] for row in rows),
+            min(row["low"] for row in rows),
+            rows[-1]["close"],
+            sum(row["volume"] for row in rows),
+            sum(int(row["trades"]) for row in rows),
+        )
+        for key, rows in groups.items()
+    ]
+    return np.array(rows, dtype=CANDLE_DTYPE)
+
+
+def assert_bars_equal(actual, expected):
+    """Exact OHLC, open times and trades; volume sums may differ in summation order."""
+    assert len(actual) == len(expected)
+    for name in ("open_time", "open", "high", "low", "close", "trades"):
+        np.testing.assert_array_equal(actual[name], expected[name])
+    np.testing.assert_allclose(actual["volume"], expected["volume"], rtol=1e-12)
+
+
+@pytest.mark.parametrize("base, interval", [("1h", "4h"), ("1h", "1d"), ("1h", "1w"), ("1h", "1h")])
+@pytest.mark.parametrize("missing", [0, 60], ids=["complete", "gaps"])
+def test_resample_matches_naive_groupby(base, interval, missing):
+    candles = hourly_candles(24 * 40 + 7, missing=missing)
+    width, offset = bucket_spec(base, interval)
+    assert_bars_equal(resample(candles, base, interval), naive_resample(candles, width, offset))
+
+
+def test_weekly_buckets_start_on_monday_with_partial_edges():
+    # Wednesday 2020-01-01 through Friday 2020-01-24.
+    candles = hourly_candles(24 * 24)
+    bars = resample(candles, "1h", "1w")
+    weekdays = [datetime.fromtimestamp(int(t) / 1000, tz=timezone.utc).weekday() for t in bars["open_time"]]
+    assert weekdays == [0, 0, 0, 0]
+    # The leading week starts before the first candle and only holds its Wednesday to Sunday.
+    assert bars["open_time"][0] == START_MS - 2 * DAY_MS
+    assert bars["trades"][0] == candles["trades"][: 24 * 5].sum()
+    assert bars["open"][0] == candles["open"][0]
+    # The trailing week is unfinished and only dropped on request.
+    assert bars["close"][-1] == candles["close"][-1]
+    np.testing.assert_array_equal(resample(candles, "1h", "1w", drop_partial=True), bars[:-1])
+
+
+def test_complete_trailing_bucket_is_kept():
+    candles = hourly_candles(24 * 3)
+    assert len(resample(candles, "1h", "1d", drop_partial=True)) == 3
+    assert len(resample(candles[:-1], "1h", "1d", drop_partial=True)) == 2
+
+
+@pytest.mark.parametrize("interval", ["4h", "1d", "1w"])
+def test_incremental_resampler_matches_batch(interval):
+    candles = hourly_candles(24 * 30, seed=3, missing=20)
+    rng = np.random.default_rng(7)
+    resampler = Resampler("1h", interval)
+    cursor = 0
+    while cursor < len(candles):
+        step = int(rng.integers(1, 40))
+        # Updates may overlap what was already seen; older bars are ignored.
+        resampler.update(candles[max(cursor - 5, 0) : cursor + step])
+        cursor += step
+        expected = resample(candles[:cursor], "1h", interval)
+        assert_bars_equal(resampler.bars, expected)
+        complete = resample(candles[:cursor], "1h", interval, drop_partial=True)
+        assert resampler.partial == (len(complete) < len(expected))
+    assert not resampler.bars.flags.writeable
+
+
+def test_bucket_bounds_and_spec_edges():
+    ids, starts = bucket_bounds(np.array([], dtype=np.int64), HOUR_MS)
+    assert ids.size == 0 and starts.size == 0
+    ids, starts = bucket_bounds(np.array([0, HOUR_MS, 3 * HOUR_MS, 4 * HOUR_MS]), 2 * HOUR_MS)
+    assert ids.tolist() == [0, 1, 2] and starts.tolist() == [0, 2, 3]
+    for base, interval in (("1d", "1M"), ("1d", "4h"), ("3d", "1w")):
+        with pytest.raises(ValueError):
+            bucket_spec(base, interval)
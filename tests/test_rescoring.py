@@ -0,0 +1,75 @@
+import sqlite3
+
+import numpy as np
+import pytest
+
+from fakes import synthetic_klines
+from src.backtester import Backtester
+from src.candle_store import candles_from_klines
+from src.model_factory import ModelCandidate
+from src.rescoring import IncrementalRescorer, RollingScore, TrackedScoreStore
+from src.strategies import MomentumStrategy, SmaCrossStrategy
+
+WINDOW = 120
+
+
+def candidates():
+    strategies = [SmaCrossStrategy(5, 20), MomentumStrategy(7, -0.01)]
+    return [
+        ModelCandidate({"id": index, "full_name": f"r/{index}"}, strategy) for index, strategy in enumerate(strategies)
+    ]
+
+
+def rescore(path, candles):
+    rescorer = IncrementalRescorer(TrackedScoreStore(path), Backtester(), window=WINDOW)
+    try:
+        return rescorer.advance(candidates(), candles)
+    finally:
+        rescorer.close()
+
+
+def updated_at(path):
+    with sqlite3.connect(path) as conn:
+        return dict(conn.execute("SELECT key, updated_at FROM scores"))
+
+
+def test_resumed_scores_match_a_full_history_backtest(tmp_path):
+    candles = candles_from_klines(synthetic_klines(400, seed=5))
+    path = tmp_path / "scores.sqlite3"
+    assert [score.bars for score in rescore(path, candles[:250])] == [250, 250]
+    # The state is read back from the binary ring and stack columns of a reopened store.
+    resumed = rescore(path, candles)
+    assert [score.bars for score in resumed] == [150, 150]
+
+    expected = Backtester().run_many([candidate.strategy for candidate in candidates()], candles["close"], tail=WINDOW)
+    for score, result in zip(resumed, expected):
+        for name in ("total_return", "annualized_return", "sharpe_ratio", "max_drawdown"):
+            assert getattr(score.result, name) == pytest.approx(getattr(result, name), rel=1e-9, abs=1e-12)
+
+
+def test_no_new_bars_leaves_the_stored_state_untouched(tmp_path):
+    candles = candles_from_klines(synthetic_klines(200, seed=6))
+    path = tmp_path / "scores.sqlite3"
+    first = rescore(path, candles)
+    written = updated_at(path)
+    again = rescore(path, candles)
+    assert [score.bars for score in again] == [0, 0]
+    assert [score.result for score in again] == [score.result for score in first]
+    assert updated_at(path) == written
+
+
+def test_checkpointed_rolling_score_matches_an_uninterrupted_one():
+    returns = np.random.default_rng(3).normal(0.0005, 0.02, 4 * WINDOW).tolist()
+    backtester = Backtester()
+    continuous = RollingScore(WINDOW)
+    resumed = RollingScore(WINDOW)
+    for index, r in enumerate(returns):
+        continuous.push(r)
+        resumed.push(r)
+        if index % 37 == 0:
+            resumed = RollingScore.unpack(*resumed.pack())
+        assert resumed.result(backtester) == continuous.result(backtester)
+    expected = backtester.metric_arrays(np.array(returns[-WINDOW:]))
+    actual = continuous.result(backtester)
+    for name, value in zip(("total_return", "annualized_return", "sharpe_ratio", "max_drawdown"), expected):
+        assert getattr(actual, name) == pytest.approx(float(value[0]), rel=1e-9)
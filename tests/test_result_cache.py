@@ -0,0 +1,35 @@
+import math
+from dataclasses import dataclass
+
+import numpy as np
+
+from src.backtester import Backtester
+from src.bars import SIGNAL_DTYPE
+from src.result_cache import BacktestCache
+from src.strategies import HoldStrategy, Strategy
+
+
+@dataclass
+class AlwaysShort(Strategy):
+    def generate_signals(self, prices):
+        return np.full(len(prices), -1, SIGNAL_DTYPE)
+
+    def update(self, price):
+        return -1
+
+
+def test_non_finite_results_are_returned_but_not_cached(tmp_path):
+    # A 3.5x bar wipes out a short position and leaves the metrics undefined.
+    closes = [100.0, 102.0, 350.0, 340.0, 330.0, 335.0]
+    strategies = [AlwaysShort(), HoldStrategy()]
+    backtester = Backtester()
+    cache = BacktestCache(tmp_path / "results.sqlite3")
+    try:
+        first = cache.run_many(backtester, strategies, closes, "fingerprint")
+        assert not all(math.isfinite(value) for value in vars(first[0]).values())
+        assert len(cache) == 1
+        second = cache.run_many(backtester, strategies, closes, "fingerprint")
+    finally:
+        cache.close()
+    assert repr(second) == repr(first)
+    assert cache.stats.hits == 1
@@ -0,0 +1,75 @@
+import dataclasses
+
+import numpy as np
+import pytest
+
+from src.config import RobustnessConfig
+from src.robustness import MonteCarlo, path_indices
+from src.strategies import MomentumStrategy, SmaCrossStrategy
+
+
+def random_closes(bars, seed=0):
+    rng = np.random.default_rng(seed)
+    return 100 * np.cumprod(1 + rng.normal(0.0005, 0.02, bars))
+
+
+STRATEGIES = [SmaCrossStrategy(5, 20), MomentumStrategy(7, 0.0)]
+CONFIG = RobustnessConfig(paths=300, block_size=10, seed=11, chunk_paths=300)
+
+
+def test_fixed_seed_is_reproducible():
+    closes = random_closes(400)
+    first = MonteCarlo(config=CONFIG).run_many(STRATEGIES, closes)
+    assert MonteCarlo(config=CONFIG).run_many(STRATEGIES, closes) == first
+    other = MonteCarlo(config=dataclasses.replace(CONFIG, seed=12)).run_many(STRATEGIES, closes)
+    assert other != first
+
+
+@pytest.mark.parametrize("block_size", [0, 10])
+def test_chunking_does_not_change_results(block_size):
+    closes = random_closes(400)
+    whole = dataclasses.replace(CONFIG, block_size=block_size)
+    results = MonteCarlo(config=whole).run_many(STRATEGIES, closes)
+    for chunk_paths in (1, 64, 299):
+        chunked = dataclasses.replace(whole, chunk_paths=chunk_paths)
+        # Same paths; only the row reductions may round differently with the matrix shape.
+        for actual, expected in zip(MonteCarlo(config=chunked).run_many(STRATEGIES, closes), results):
+            assert dataclasses.astuple(actual) == pytest.approx(dataclasses.astuple(expected), rel=1e-12)
+    assert all(result.paths == CONFIG.paths for result in results)
+
+
+@pytest.mark.parametrize("block_size", [0, 10])
+def test_path_indices_shape_and_chunking(block_size):
+    assert path_indices(37, 5, block_size, np.random.default_rng(0)).shape == (5, 37)
+    assert path_indices(7, 5, block_size, np.random.default_rng(0)).shape == (5, 7)
+    rng = np.random.default_rng(4)
+    chunked = np.vstack([path_indices(37, 2, block_size, rng) for _ in range(3)])
+    np.testing.assert_array_equal(chunked, path_indices(37, 6, block_size, np.random.default_rng(4)))
+
+
+def test_block_bootstrap_keeps_bars_in_order_within_blocks():
+    periods, block = 103, 10
+    indices = path_indices(periods, 50, block, np.random.default_rng(1))
+    assert indices.min() >= 0 and indices.max() < periods
+    for row in indices:
+        for start in range(0, periods, block):
+            chunk = row[start : start + block]
+            np.testing.assert_array_equal(chunk, chunk[0] + np.arange(len(chunk)))
+
+
+def test_zero_block_size_is_a_permutation():
+    indices = path_indices(50, 20, 0, np.random.default_rng(2))
+    for row in indices:
+        np.testing.assert_array_equal(np.sort(row), np.arange(50))
+    assert any((row != np.arange(50)).any() for row in indices)
+    # Reordering bars keeps every path's total return.
+    returns = np.random.default_rng(3).normal(0, 0.01, 50)
+    totals = np.prod(1 + returns[indices], axis=1) - 1
+    np.testing.assert_allclose(totals, np.prod(1 + returns) - 1)
+
+
+def test_empty_history_scores_flat_paths():
+    assert path_indices(0, 4, 10, np.random.default_rng(0)).shape == (4, 0)
+    result = MonteCarlo(config=CONFIG).run_returns(np.empty((1, 0)))[0]
+    assert result.paths == CONFIG.paths
+    assert result.sharpe_low == 0.0 and result.drawdown_high == 0.0 and result.loss_probability == 0.0
@@ -0,0 +1,136 @@
+import threading
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.scheduler import CronSchedule, IntervalSchedule, Job, JobState, Scheduler
+
+
+def utc(*args):
+    return datetime(*args, tzinfo=timezone.utc)
+
+
+class Clock:
+    def __init__(self, now):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.mark.parametrize(
+    "expression, moment, expected",
+    [
+        ("*/15 * * * *", utc(2024, 3, 1, 10, 7), utc(2024, 3, 1, 10, 15)),
+        ("*/15 * * * *", utc(2024, 3, 1, 10, 15), utc(2024, 3, 1, 10, 30)),
+        ("*/15 * * * *", utc(2024, 12, 31, 23, 50), utc(2025, 1, 1, 0, 0)),
+        # Weekdays 9-17 on the hour and half hour: Friday evening rolls over to Monday.
+        ("0,30 9-17 * * 1-5", utc(2024, 3, 1, 17, 30), utc(2024, 3, 4, 9, 0)),
+        ("0,30 9-17 * * 1-5", utc(2024, 3, 4, 9, 10), utc(2024, 3, 4, 9, 30)),
+        # Months without a 31st are skipped.
+        ("0 0 31 * *", utc(2024, 4, 1), utc(2024, 5, 31)),
+        ("0 0 31 * *", utc(2024, 5, 31), utc(2024, 7, 31)),
+        ("0 12 29 2 *", utc(2025, 3, 1), utc(2028, 2, 29, 12, 0)),
+    ],
+)
+def test_cron_next_after(expression, moment, expected):
+    assert CronSchedule(expression).next_after(moment) == expected
+
+
+def test_cron_rejects_impossible_and_malformed_expressions():
+    with pytest.raises(ValueError, match="never fires"):
+        CronSchedule("0 0 30 2 *").next_after(utc(2024, 1, 1))
+    for expression in ("* * * *", "61 * * * *", "5-1 * * * *", "*/0 * * * *"):
+        with pytest.raises(ValueError):
+            CronSchedule(expression)
+
+
+def test_interval_schedule_is_aligned_to_its_anchor():
+    schedule = IntervalSchedule(timedelta(minutes=15))
+    assert schedule.next_after(utc(2024, 3, 1, 10, 15)) == utc(2024, 3, 1, 10, 30)
+    assert schedule.next_after(utc(2024, 3, 1, 10, 16, 30)) == utc(2024, 3, 1, 10, 30)
+
+
+def finish(scheduler, name):
+    scheduler._running[name].result(timeout=5)
+
+
+def test_missed_daily_run_fires_once_on_restart(tmp_path):
+    state = JobState(tmp_path / "state.json")
+    state.record("daily", utc(2024, 3, 1, 9, 0))
+    clock = Clock(utc(2024, 3, 3, 12, 0))
+    runs = []
+    scheduler = Scheduler(JobState(tmp_path / "state.json"), clock=clock)
+    scheduler.register(Job("daily", lambda: runs.append(clock()), CronSchedule("0 9 * * *")))
+
+    # Two days were missed; one catch-up run covers them.
+    assert scheduler.run_pending() == ["daily"]
+    finish(scheduler, "daily")
+    assert scheduler.run_pending() == []
+    assert runs == [utc(2024, 3, 3, 12, 0)]
+    assert JobState(tmp_path / "state.json").last_run("daily") == utc(2024, 3, 3, 12, 0)
+    assert scheduler.seconds_until_next() == timedelta(hours=21).total_seconds()
+
+    clock.now = utc(2024, 3, 4, 9, 0)
+    assert scheduler.run_pending() == ["daily"]
+
+
+def test_up_to_date_job_waits_for_its_next_run():
+    state = JobState(None)
+    state.record("daily", utc(2024, 3, 3, 9, 0))
+    scheduler = Scheduler(state, clock=Clock(utc(2024, 3, 3, 12, 0)))
+    scheduler.register(Job("daily", lambda: None, CronSchedule("0 9 * * *")))
+    assert scheduler.run_pending() == []
+
+
+def test_running_job_is_not_started_again():
+    clock = Clock(utc(2024, 3, 1, 10, 0))
+    release = threading.Event()
+    started = []
+
+    def slow():
+        started.append(clock())
+        release.wait(5)
+
+    scheduler = Scheduler(clock=clock)
+    scheduler.register(Job("slow", slow, IntervalSchedule(timedelta(minutes=5)), catch_up=False))
+    clock.now = utc(2024, 3, 1, 10, 5)
+    assert scheduler.run_pending() == ["slow"]
+    clock.now = utc(2024, 3, 1, 10, 10)
+    assert scheduler.run_pending() == []
+    release.set()
+    finish(scheduler, "slow")
+    clock.now = utc(2024, 3, 1, 10, 15)
+    assert scheduler.run_pending() == ["slow"]
+    finish(scheduler, "slow")
+    assert started == [utc(2024, 3, 1, 10, 5), utc(2024, 3, 1, 10, 15)]
+
+
+def test_failed_run_is_not_recorded_as_success(tmp_path):
+    clock = Clock(utc(2024, 3, 1, 10, 0))
+    outcomes = iter([RuntimeError("boom"), None])
+
+    def flaky():
+        outcome = next(outcomes)
+        if outcome is not None:
+            raise outcome
+
+    state = JobState(tmp_path / "state.json")
+    scheduler = Scheduler(state, clock=clock)
+    scheduler.register(Job("flaky", flaky, IntervalSchedule(timedelta(hours=1))))
+    clock.now = utc(2024, 3, 1, 11, 0)
+    assert scheduler.run_pending() == ["flaky"]
+    finish(scheduler, "flaky")
+    assert state.last_run("flaky") is None
+    assert not (tmp_path / "state.json").exists()
+
+    clock.now = utc(2024, 3, 1, 12, 0)
+    assert scheduler.run_pending() == ["flaky"]
+    finish(scheduler, "flaky")
+    assert state.last_run("flaky") == utc(2024, 3, 1, 12, 0)
+
+
+def test_corrupt_state_file_is_reset(tmp_path):
+    path = tmp_path / "state.json"
+    path.write_text("{not json", encoding="utf-8")
+    assert JobState(path).last_run("daily") is None
@@ -0,0 +1,152 @@
+import dataclasses
+import json
+from dataclasses import dataclass
+from typing import List
+
+import numpy as np
+import pytest
+
+from src import indicators
+from src.strategies import MomentumStrategy, SmaCrossStrategy, Strategy
+
+
+def reference_sma_cross(prices: List[float], fast_window: int, slow_window: int) -> List[int]:
+    """The original per-bar implementation the vectorized kernels replaced."""
+    if len(prices) < slow_window:
+        return [0] * len(prices)
+    signals = [0] * len(prices)
+    for idx in range(slow_window, len(prices)):
+        fast = sum(prices[idx - fast_window : idx]) / fast_window
+        slow = sum(prices[idx - slow_window : idx]) / slow_window
+        if fast > slow:
+            signals[idx] = 1
+        elif fast < slow:
+            signals[idx] = -1
+    return signals
+
+
+def reference_momentum(prices: List[float], lookback: int, threshold: float) -> List[int]:
+    signals = [0] * len(prices)
+    for idx in range(lookback, len(prices)):
+        start = prices[idx - lookback]
+        if start == 0:
+            continue
+        change = (prices[idx] - start) / start
+        if change > threshold:
+            signals[idx] = 1
+        elif change < -threshold:
+            signals[idx] = -1
+    return signals
+
+
+def random_walk(bars, seed, decimals=None, drift=0.0):
+    rng = np.random.default_rng(seed)
+    prices = 100 * np.cumprod(1 + rng.normal(drift, 0.02, bars))
+    return (prices if decimals is None else np.round(prices, decimals)).tolist()
+
+
+SERIES = {
+    "random": random_walk(600, 0),
+    "rounded": random_walk(600, 1, decimals=1),
+    "flat_after_trend": [100 + 0.37 * idx for idx in range(60)] + [50.0] * 100,
+    "flat_inexact": [0.1] * 120,
+    "steps": [100.0] * 40 + [101.0] * 40 + [99.5] * 40 + [100.0] * 40,
+    "alternating": [100.0, 101.0] * 80,
+    "zero_prices": [10.0, 0.0, 0.0, 12.0, 11.0] * 30,
+    "large_flat": random_walk(3000, 2) + [12345.6789] * 300,
+    # Prices fall to a tiny fraction of the running totals, where those lose most precision.
+    "collapsing": random_walk(2000, 3, drift=-0.01),
+}
+SMA_WINDOWS = [(5, 20), (10, 30), (2, 3), (20, 20), (30, 10), (1, 50)]
+MOMENTUM_PARAMS = [(14, 0.02), (7, 0.0), (3, -0.01), (30, 0.1), (0, 0.02), (0, -0.01)]
+
+
+@pytest.fixture(autouse=True)
+def clear_indicator_cache():
+    indicators.CACHE.clear()
+    yield
+    indicators.CACHE.clear()
+
+
+@pytest.mark.parametrize("windows", SMA_WINDOWS, ids=str)
+@pytest.mark.parametrize("name", SERIES)
+def test_sma_cross_matches_reference(name, windows):
+    prices = SERIES[name]
+    strategy = SmaCrossStrategy(*windows)
+    expected = reference_sma_cross(prices, *windows)
+    assert np.asarray(strategy.generate_signals(prices)).tolist() == expected
+    assert [strategy.update(price) for price in prices] == expected
+
+
+@pytest.mark.parametrize("params", MOMENTUM_PARAMS, ids=str)
+@pytest.mark.parametrize("name", SERIES)
+def test_momentum_matches_reference(name, params):
+    prices = SERIES[name]
+    strategy = MomentumStrategy(*params)
+    expected = reference_momentum(prices, *params)
+    assert np.asarray(strategy.generate_signals(prices)).tolist() == expected
+    assert [strategy.update(price) for price in prices] == expected
+
+
+def test_sma_cross_fast_window_longer_than_series_counts_as_zero():
+    # The original slice ``prices[idx - fast_window : idx]`` wrapped around to the end of the
+    # series here, so its signals depended on how many bars came later. Until ``fast_window``
+    # bars exist the fast mean is now zero, as it already was for longer series.
+    prices = [1000.0, 1.0, 2.0, 1.0, 1.0, 50.0, 1.0]
+    strategy = SmaCrossStrategy(24, 1)
+    expected = [0] + [-1] * 6
+    assert np.asarray(strategy.generate_signals(prices)).tolist() == expected
+    assert [strategy.update(price) for price in prices] == expected
+    assert reference_sma_cross(prices, 24, 1) == [0, -1, 1, 1, 1, 1, -1]
+
+
+def test_sma_cross_rarely_settles_ties_on_long_series(monkeypatch):
+    # Rounding is bounded per window, so the exact fallback stays rare however long the series.
+    from src import strategies
+
+    settled = []
+    reference_means = strategies._reference_means
+
+    def counting(series, lead, ends, window):
+        settled.append(len(ends))
+        return reference_means(series, lead, ends, window)
+
+    monkeypatch.setattr(strategies, "_reference_means", counting)
+    prices = np.asarray(random_walk(200_000, 4, drift=0.0002))
+    SmaCrossStrategy(10, 30).generate_signals(prices)
+    assert sum(settled) < 100
+
+
+def test_signal_matrix_matches_rows():
+    matrix = np.array([SERIES["random"][:160], SERIES["flat_after_trend"], SERIES["steps"]])
+    for strategy in (SmaCrossStrategy(5, 20), MomentumStrategy(3, -0.01)):
+        rows = [np.asarray(dataclasses.replace(strategy).generate_signals(row)).tolist() for row in matrix]
+        assert strategy.generate_signal_matrix(matrix).tolist() == rows
+
+
+@dataclass
+class BreakoutStrategy(Strategy):
+    """A third-party strategy that only implements the batch path."""
+
+    window: int = 5
+
+    def generate_signals(self, prices):
+        prices = np.asarray(prices, dtype=np.float64)
+        signals = np.zeros(len(prices))
+        for idx in range(self.window, len(prices)):
+            signals[idx] = 1.0 if prices[idx] > prices[idx - self.window : idx].max() else -0.5
+        return signals
+
+
+def test_default_update_replays_generate_signals():
+    prices = SERIES["random"][:120]
+    expected = BreakoutStrategy().generate_signals(prices).tolist()
+    strategy = BreakoutStrategy()
+    streamed = [strategy.update(price) for price in prices[:70]]
+    # Checkpoints survive a JSON round trip into a fresh instance.
+    resumed = BreakoutStrategy()
+    resumed.set_state(json.loads(json.dumps(strategy.get_state())))
+    streamed += [resumed.update(price) for price in prices[70:]]
+    assert streamed == expected
+    resumed.reset()
+    assert resumed.update(prices[0]) == 0.0
@@ -0,0 +1,37 @@
+import pytest
+
+from src.strategies import MomentumStrategy, SmaCrossStrategy
+from src.sweep import DEFAULT_CONSTRAINTS, DEFAULT_GRIDS, Range, default_grid, grid, random_search
+
+
+def test_default_sma_grid_keeps_fast_below_slow():
+    param_sets = default_grid(SmaCrossStrategy)
+    assert param_sets
+    assert all(params["fast_window"] < params["slow_window"] for params in param_sets)
+    assert len(param_sets) < len(grid(DEFAULT_GRIDS[SmaCrossStrategy]))
+
+
+def test_grid_without_constraint_is_the_full_product():
+    assert len(default_grid(MomentumStrategy)) == 12 * 5
+    assert grid({"a": [1, 2], "b": [3]}) == [{"a": 1, "b": 3}, {"a": 2, "b": 3}]
+
+
+def test_random_search_samples_ranges_and_choices():
+    space = {"fast_window": Range(2, 40), "threshold": Range(0.0, 0.1), "mode": (5, 50)}
+    param_sets = random_search(space, 200, seed=1)
+    assert param_sets == random_search(space, 200, seed=1)
+    assert all(2 <= params["fast_window"] <= 40 and isinstance(params["fast_window"], int) for params in param_sets)
+    assert all(0.0 <= params["threshold"] <= 0.1 for params in param_sets)
+    # A 2-tuple is a pair of choices, not a range.
+    assert {params["mode"] for params in param_sets} == {5, 50}
+
+
+def test_random_search_applies_constraint():
+    space = {"fast_window": Range(5, 50), "slow_window": Range(20, 200)}
+    param_sets = random_search(space, 100, seed=0, constraint=DEFAULT_CONSTRAINTS[SmaCrossStrategy])
+    assert len(param_sets) == 100
+    assert all(params["fast_window"] < params["slow_window"] for params in param_sets)
+    with pytest.raises(ValueError):
+        random_search(space, 1, seed=0, constraint=lambda params: False)
+    with pytest.raises(ValueError):
+        Range(3, 2)
@@ -0,0 +1,33 @@
+import dataclasses
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from src import order_router, trader
+from src.config import CONFIG
+from src.trader import TradeDecision, Trader
+
+
+def test_concurrent_executions_share_one_router(monkeypatch):
+    binance = dataclasses.replace(CONFIG.binance, api_key="key", api_secret="secret")
+    monkeypatch.setattr(trader, "CONFIG", dataclasses.replace(CONFIG, binance=binance))
+    created = []
+    barrier = threading.Barrier(8)
+
+    class Router:
+        def __init__(self, session):
+            created.append(self)
+
+        def submit_many(self, orders):
+            return [{"status": "FILLED", "clientOrderId": order["client_order_id"]} for order in orders]
+
+    monkeypatch.setattr(order_router, "OrderRouter", Router)
+    instance = Trader()
+
+    def execute(index):
+        barrier.wait()
+        return instance.execute(TradeDecision("BTCUSDT", "BUY", 0.001, f"cm{index}"))
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(execute, range(8)))
+    assert [result["clientOrderId"] for result in results] == [f"cm{index}" for index in range(8)]
+    assert len(created) == 1
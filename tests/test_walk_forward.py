@@ -0,0 +1,88 @@
+import math
+
+import numpy as np
+import pytest
+
+from src.backtester import Backtester
+from src.config import WalkForwardConfig
+from src.strategies import MomentumStrategy, SmaCrossStrategy
+from src.walk_forward import SlidingDrawdown, WalkForward, window_bounds
+
+METRICS = ("total_return", "annualized_return", "sharpe_ratio", "max_drawdown")
+
+
+def random_closes(bars, seed=0):
+    rng = np.random.default_rng(seed)
+    return 100 * np.cumprod(1 + rng.normal(0.0005, 0.02, bars))
+
+
+def brute_max_drawdown(equity):
+    peak = equity[0]
+    worst = 0.0
+    for value in equity:
+        peak = max(peak, value)
+        worst = max(worst, 1 - value / peak)
+    return worst
+
+
+@pytest.mark.parametrize("expanding", [False, True], ids=["rolling", "expanding"])
+@pytest.mark.parametrize("strategy", [SmaCrossStrategy(5, 20), MomentumStrategy(7, 0.0)], ids=str)
+def test_windows_match_backtester_on_the_same_slices(strategy, expanding):
+    closes = random_closes(700)
+    cfg = WalkForwardConfig(train_bars=120, test_bars=40, step_bars=25, expanding=expanding)
+    backtester = Backtester()
+    windows = WalkForward(backtester, cfg).run(strategy, closes)
+    strategy_returns = np.asarray(strategy.generate_signals(closes)) * backtester.compute_returns(closes)
+
+    assert [(w.train_start, w.test_start, w.test_end) for w in windows] == window_bounds(len(closes), cfg)
+    for window in windows:
+        if expanding:
+            assert window.train_start == 0
+        for result, start, end in (
+            (window.train, window.train_start, window.test_start),
+            (window.test, window.test_start, window.test_end),
+        ):
+            expected = backtester.metric_arrays(strategy_returns[start:end])
+            for name, value in zip(METRICS, expected):
+                assert math.isclose(getattr(result, name), float(value[0]), rel_tol=1e-7, abs_tol=1e-10), name
+
+
+def test_flat_windows_score_zero_sharpe():
+    closes = random_closes(300)
+    returns = np.asarray(SmaCrossStrategy(5, 20).generate_signals(closes)) * Backtester.compute_returns(closes)
+    returns[:150] = 0.0
+    cfg = WalkForwardConfig(train_bars=100, test_bars=40, step_bars=40)
+    windows = WalkForward(Backtester(), cfg).run_returns(returns)
+    assert windows[0].train.sharpe_ratio == 0.0
+    assert windows[0].train.total_return == 0.0
+    assert windows[-1].test.sharpe_ratio != 0.0
+
+
+def test_sliding_drawdown_matches_brute_force():
+    rng = np.random.default_rng(5)
+    equity = np.cumprod(1 + rng.normal(0, 0.03, 400))
+    sliding = SlidingDrawdown(equity)
+    start = end = 0
+    for _ in range(300):
+        end = min(len(equity), end + int(rng.integers(0, 6)))
+        start = min(end, start + int(rng.integers(0, 6)))
+        expected = brute_max_drawdown(equity[start:end]) if end > start else 0.0
+        assert math.isclose(sliding.advance(start, end), expected)
+    with pytest.raises(ValueError):
+        sliding.advance(start - 1, end)
+
+
+@pytest.mark.parametrize("periods", [0, 50, 159])
+def test_history_shorter_than_one_window_yields_nothing(periods):
+    cfg = WalkForwardConfig(train_bars=120, test_bars=40, step_bars=25)
+    assert window_bounds(periods, cfg) == []
+    assert WalkForward(Backtester(), cfg).run(SmaCrossStrategy(5, 20), random_closes(periods)) == []
+
+
+def test_window_bounds_at_the_edges():
+    cfg = WalkForwardConfig(train_bars=120, test_bars=40, step_bars=25)
+    assert window_bounds(160, cfg) == [(0, 120, 160)]
+    assert window_bounds(184, cfg) == [(0, 120, 160)]
+    assert window_bounds(185, cfg) == [(0, 120, 160), (25, 145, 185)]
+    expanding = WalkForwardConfig(train_bars=120, test_bars=40, step_bars=25, expanding=True)
+    assert window_bounds(185, expanding) == [(0, 120, 160), (0, 145, 185)]
@@ -0,0 +1,84 @@
+import os
+import time
+
+import pytest
+
+from src.metrics import METRICS
+from src.worker_pool import WorkerPool, resource
+
+
+def square(value):
+    return value * value
+
+
+def sleep_then_square(value):
+    if value < 0:
+        time.sleep(10)
+    return value * value
+
+
+def crash_on_negative(value):
+    if value < 0:
+        os._exit(3)
+    return value * value
+
+
+def allocate(megabytes):
+    return len(bytearray(megabytes * 1024 * 1024))
+
+
+def count_task(value):
+    METRICS.increment("worker_tasks_total", kind="test")
+    with METRICS.span("worker_task_seconds"):
+        return value
+
+
+def run(pool, func, values):
+    return sorted(pool.imap_unordered(func, [(value,) for value in values]))
+
+
+def test_hung_task_times_out_without_failing_the_others():
+    with WorkerPool(2, timeout=0.5) as pool:
+        results = run(pool, sleep_then_square, [1, -1, 2, 3])
+        assert run(pool, square, [4]) == [(0, True, 16)]
+    assert results[1] == (1, False, "timed out after 0.5s")
+    assert [result for result in results if result[1]] == [(0, True, 1), (2, True, 4), (3, True, 9)]
+
+
+def test_crashed_worker_fails_only_its_task():
+    with WorkerPool(2) as pool:
+        results = run(pool, crash_on_negative, [1, -1, 2])
+        assert run(pool, square, [5]) == [(0, True, 25)]
+    # Depending on which the parent notices first, the closed pipe or the exit code is reported.
+    assert results[1][:2] == (1, False) and "exited" in results[1][2]
+    assert results[0] == (0, True, 1) and results[2] == (2, True, 4)
+
+
+def _virtual_memory_mb():
+    with open("/proc/self/status", encoding="ascii") as handle:
+        for line in handle:
+            if line.startswith("VmSize:"):
+                return int(line.split()[1]) // 1024
+    raise RuntimeError("VmSize not reported")
+
+
+@pytest.mark.skipif(resource is None or not os.path.exists("/proc/self/status"), reason="needs RLIMIT_AS and procfs")
+def test_memory_error_is_reported_and_the_worker_survives():
+    limit = _virtual_memory_mb() + 256
+    with WorkerPool(1, memory_limit_mb=limit, start_method="fork") as pool:
+        results = run(pool, allocate, [1, 4096, 2])
+    assert results[1] == (1, False, "MemoryError")
+    assert results[0] == (0, True, 1024 * 1024) and results[2] == (2, True, 2 * 1024 * 1024)
+
+
+def test_worker_metrics_are_merged_into_the_parent(monkeypatch):
+    monkeypatch.setattr(METRICS, "enabled", True)
+    METRICS.reset()
+    try:
+        with WorkerPool(2, start_method="fork") as pool:
+            assert len(run(pool, count_task, range(5))) == 5
+        summary = METRICS.summary()
+    finally:
+        METRICS.reset()
+    assert summary["counters"] == [{"name": "worker_tasks_total", "labels": {"kind": "test"}, "value": 5}]
+    assert [(timer["name"], timer["count"]) for timer in summary["timers"]] == [("worker_task_seconds", 5)]